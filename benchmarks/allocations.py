@@ -0,0 +1,84 @@
+"""Measure peak bytes allocated per record by decoding, normalization and parsing
+
+Usage:
+    python -m benchmarks.allocations
+"""
+import argparse
+import gc
+import json
+import pathlib
+import sys
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from whois_parser.decoding import decode_raw_text
+from whois_parser.dispatch import get_tld
+from whois_parser.parser import WhoisParser
+from whois_parser.parsers.abstract import normalize_raw_text
+
+FIXTURES_DIR = pathlib.Path(__file__).parent.parent / "tests" / "fixtures"
+
+
+def load_fixtures() -> list[tuple[bytes, str]]:
+    return [
+        (path.read_bytes(), path.name.removesuffix(".txt"))
+        for path in sorted(FIXTURES_DIR.glob("*.txt"))
+    ]
+
+
+def measure_peak(func: Callable[[], Any]) -> int:
+    """Measure peak bytes allocated while calling a function
+
+    Args:
+        func (Callable[[], Any]): Function
+
+    Returns:
+        int: Bytes
+    """
+    # call it once to exclude caches from the measurement
+    func()
+
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return peak - before
+
+
+def measure(fixtures: list[tuple[bytes, str]]) -> dict[str, int]:
+    """Measure mean peak bytes per record
+
+    Args:
+        fixtures (list[tuple[bytes, str]]): Pairs of a whois record in bytes and a hostname
+
+    Returns:
+        dict[str, int]: Steps and bytes per record
+    """
+    parser = WhoisParser(use_index=True)
+    totals = {"decode": 0, "normalize": 0, "parse": 0}
+    for data, hostname in fixtures:
+        raw_text = decode_raw_text(data, tld=get_tld(hostname))
+        totals["decode"] += measure_peak(
+            lambda: decode_raw_text(data, tld=get_tld(hostname))
+        )
+        totals["normalize"] += measure_peak(lambda: normalize_raw_text(raw_text))
+        totals["parse"] += measure_peak(lambda: parser.parse(data, hostname=hostname))
+
+    return {step: total // len(fixtures) for step, total in totals.items()}
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.parse_args()
+
+    result = {"peak_bytes_per_record": measure(load_fixtures())}
+    sys.stdout.write(json.dumps(result, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
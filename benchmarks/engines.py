@@ -0,0 +1,45 @@
+"""Compare matching engines on synthetic corpora
+
+Usage:
+    python -m benchmarks.engines --records 50
+"""
+import argparse
+import json
+import sys
+
+from whois_parser.parser import WhoisParser
+from whois_parser.parsers.engines import ENGINES
+
+from . import run, synthetic
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--format", choices=synthetic.FORMATS, action="append")
+    arg_parser.add_argument("--records", type=int, default=50)
+    arg_parser.add_argument("--seed", type=int, default=0)
+    arg_parser.add_argument("--use-index", action="store_true")
+    args = arg_parser.parse_args()
+
+    results: dict[str, dict] = {}
+    for format in args.format or synthetic.FORMATS:
+        corpus = list(synthetic.generate(format, args.records, seed=args.seed))
+        results[format] = {}
+        for engine in ENGINES:
+            parser = WhoisParser(use_index=args.use_index, engine=engine)
+            metrics = run.benchmark(parser, corpus)
+            results[format][engine] = {
+                "records_per_sec": metrics["records_per_sec"],
+                "p50_ms": metrics["p50_ms"],
+                "p99_ms": metrics["p99_ms"],
+            }
+
+        base = results[format]["pyparsing"]["records_per_sec"]
+        for engine, metrics in results[format].items():
+            metrics["speedup"] = metrics["records_per_sec"] / base
+
+    sys.stdout.write(json.dumps(results, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Measure time to import whois_parser in fresh interpreters
+
+Usage:
+    python -m benchmarks.import_time --runs 10
+    python -m benchmarks.import_time --runs 10 --budget 300
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+# modules which should not be imported by "import whois_parser"
+LAZY_MODULES = (
+    "dateparser",
+    "importlib.metadata",
+    "asyncio",
+    "concurrent.futures",
+    "sqlite3",
+    "whois_parser.server",
+    "numpy",
+    "whois_parser.parsers.jp",
+    "whois_parser.parsers.uk",
+    "whois_parser.parsers.be",
+)
+
+SCRIPT = """
+import json, sys, time
+started = time.perf_counter()
+import whois_parser
+elapsed = time.perf_counter() - started
+json.dump({"ms": elapsed * 1e3, "modules": sorted(sys.modules)}, sys.stdout)
+"""
+
+
+def measure_once() -> dict:
+    """Import whois_parser in a fresh interpreter
+
+    Returns:
+        dict: Milliseconds and names of imported modules
+    """
+    output = subprocess.run(
+        [sys.executable, "-c", SCRIPT], check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output)
+
+
+def measure(runs: int) -> dict:
+    """Measure time to import whois_parser
+
+    Args:
+        runs (int): Number of interpreters
+
+    Returns:
+        dict: Median / min / max milliseconds and lazy modules which are imported eagerly
+    """
+    results = [measure_once() for _ in range(runs)]
+    timings = [result["ms"] for result in results]
+    modules = set(results[0]["modules"])
+    return {
+        "runs": runs,
+        "median_ms": statistics.median(timings),
+        "min_ms": min(timings),
+        "max_ms": max(timings),
+        "eager_modules": [module for module in LAZY_MODULES if module in modules],
+    }
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--runs", type=int, default=10)
+    arg_parser.add_argument("--budget", type=float, help="Max median milliseconds")
+    args = arg_parser.parse_args()
+
+    result = measure(args.runs)
+    sys.stdout.write(json.dumps(result, indent=2) + "\n")
+
+    if len(result["eager_modules"]) > 0:
+        sys.stderr.write(f"eagerly imported: {', '.join(result['eager_modules'])}\n")
+        sys.exit(1)
+
+    if args.budget is not None and result["median_ms"] > args.budget:
+        sys.stderr.write(
+            f"regression: {result['median_ms']:.1f} ms > {args.budget} ms\n"
+        )
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
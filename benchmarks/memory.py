@@ -0,0 +1,82 @@
+"""Measure memory held by parsed whois records
+
+Usage:
+    python -m benchmarks.memory --records 1000
+"""
+import argparse
+import gc
+import itertools
+import json
+import pathlib
+import sys
+import tracemalloc
+
+from whois_parser.parser import WhoisParser
+
+FIXTURES_DIR = pathlib.Path(__file__).parent.parent / "tests" / "fixtures"
+
+MODES: dict[str, dict] = {
+    "default": {},
+    "compact": {"compact": True},
+    "compact+digest": {"compact": True, "raw_text_mode": "digest"},
+    "compact+drop": {"compact": True, "raw_text_mode": "drop"},
+}
+
+
+def load_fixtures() -> list[tuple[str, str]]:
+    return [
+        (path.read_text(), path.name.removesuffix(".txt"))
+        for path in sorted(FIXTURES_DIR.glob("*.txt"))
+    ]
+
+
+def measure(parser: WhoisParser, fixtures: list[tuple[str, str]], records: int) -> int:
+    """Measure bytes per record retained after parsing
+
+    Args:
+        parser (WhoisParser): Parser
+        fixtures (list[tuple[str, str]]): Pairs of a whois record and a hostname
+        records (int): Number of records to parse
+
+    Returns:
+        int: Bytes per record
+    """
+    # parse all the fixtures once to exclude grammars and caches from the measurement
+    for raw_text, hostname in fixtures:
+        parser.parse(raw_text, hostname=hostname)
+
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+
+    parsed = []
+    for raw_text, hostname in itertools.islice(itertools.cycle(fixtures), records):
+        # copy raw text as if each record is read from a corpus
+        parsed.append(parser.parse((raw_text + " ")[:-1], hostname=hostname))
+
+    gc.collect()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return (after - before) // records
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--records", type=int, default=1_000)
+    arg_parser.add_argument("--mode", choices=list(MODES), action="append")
+    args = arg_parser.parse_args()
+
+    fixtures = load_fixtures()
+    results = {
+        # the line index does not change records and makes the measurement faster
+        mode: measure(
+            WhoisParser(use_index=True, **MODES[mode]), fixtures, args.records
+        )
+        for mode in args.mode or MODES
+    }
+    sys.stdout.write(json.dumps({"bytes_per_record": results}, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
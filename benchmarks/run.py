@@ -0,0 +1,207 @@
+"""Benchmark WhoisParser.parse on synthetic corpora
+
+Usage:
+    python -m benchmarks.run --records 100 --output result.json
+    python -m benchmarks.run --records 100 --compare result.json
+"""
+import argparse
+import json
+import pathlib
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Any
+
+from whois_parser.hooks import CostTable
+from whois_parser.parser import WhoisParser
+from whois_parser.parsers.engines import ENGINES
+
+from . import synthetic
+
+# metrics compared with a baseline and whether the higher is the better
+METRICS: dict[str, bool] = {
+    "records_per_sec": True,
+    "p50_ms": False,
+    "p99_ms": False,
+    "peak_memory_bytes": False,
+}
+
+
+def percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(q * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def measure_field_costs(
+    parser: WhoisParser, corpus: list[tuple[str, str]]
+) -> dict[str, float]:
+    """Measure mean milliseconds spent by the finder of each field
+
+    Args:
+        parser (WhoisParser): Parser
+        corpus (list[tuple[str, str]]): Pairs of a whois record and a hostname
+
+    Returns:
+        dict[str, float]: Field names and their costs
+    """
+    table = CostTable()
+    instrumented = WhoisParser(
+        parser.parsers_map,
+        use_index=parser.use_index,
+        engine=parser.engine,
+        hooks=[table],
+    )
+    for raw_text, hostname in corpus:
+        instrumented.parse(raw_text, hostname=hostname)
+
+    costs: dict[str, float] = {}
+    for row in table.rows():
+        costs[row["field"]] = costs.get(row["field"], 0.0) + row["total"] * 1e3
+
+    return {field: cost / len(corpus) for field, cost in sorted(costs.items())}
+
+
+def measure_peak_memory(parser: WhoisParser, corpus: list[tuple[str, str]]) -> int:
+    """Measure max bytes allocated at once while parsing a record
+
+    Args:
+        parser (WhoisParser): Parser
+        corpus (list[tuple[str, str]]): Pairs of a whois record and a hostname
+
+    Returns:
+        int: Peak memory
+    """
+    peak = 0
+    tracemalloc.start()
+    try:
+        for raw_text, hostname in corpus:
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            parser.parse(raw_text, hostname=hostname)
+            _, after = tracemalloc.get_traced_memory()
+            peak = max(peak, after - before)
+    finally:
+        tracemalloc.stop()
+
+    return peak
+
+
+def benchmark(parser: WhoisParser, corpus: list[tuple[str, str]]) -> dict[str, Any]:
+    """Benchmark a parser on a corpus
+
+    Args:
+        parser (WhoisParser): Parser
+        corpus (list[tuple[str, str]]): Pairs of a whois record and a hostname
+
+    Returns:
+        dict[str, Any]: Metrics
+    """
+    # compile grammars and fill caches in advance
+    raw_text, hostname = corpus[0]
+    parser.parse(raw_text, hostname=hostname)
+
+    latencies: list[float] = []
+    for raw_text, hostname in corpus:
+        started = time.perf_counter_ns()
+        parser.parse(raw_text, hostname=hostname)
+        latencies.append((time.perf_counter_ns() - started) / 1e6)
+
+    return {
+        "records": len(corpus),
+        "records_per_sec": len(corpus) / (sum(latencies) / 1e3),
+        "p50_ms": percentile(latencies, 0.5),
+        "p99_ms": percentile(latencies, 0.99),
+        "field_costs_ms": measure_field_costs(parser, corpus),
+        "peak_memory_bytes": measure_peak_memory(parser, corpus),
+    }
+
+
+def compare(
+    result: dict[str, Any], baseline: dict[str, Any], *, threshold: float
+) -> list[str]:
+    """Compare a result with a baseline and list regressions
+
+    Args:
+        result (dict[str, Any]): Result
+        baseline (dict[str, Any]): Baseline result
+        threshold (float): Ratio of tolerated change (e.g. 0.1 for 10%)
+
+    Returns:
+        list[str]: Regressions
+    """
+    regressions: list[str] = []
+    for format, metrics in result["formats"].items():
+        base_metrics = baseline["formats"].get(format)
+        if base_metrics is None:
+            continue
+
+        for metric, higher_is_better in METRICS.items():
+            value, base = metrics[metric], base_metrics[metric]
+            if base == 0:
+                continue
+
+            change = (value - base) / base
+            if (higher_is_better and change < -threshold) or (
+                not higher_is_better and change > threshold
+            ):
+                regressions.append(
+                    f"{format}.{metric}: {base:.3f} -> {value:.3f} ({change:+.1%})"
+                )
+
+    return regressions
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--format", choices=synthetic.FORMATS, action="append")
+    arg_parser.add_argument("--records", type=int, default=100)
+    arg_parser.add_argument("--seed", type=int, default=0)
+    arg_parser.add_argument("--use-index", action="store_true")
+    arg_parser.add_argument("--engine", choices=list(ENGINES), default="pyparsing")
+    arg_parser.add_argument("--output", type=pathlib.Path)
+    arg_parser.add_argument("--compare", type=pathlib.Path)
+    arg_parser.add_argument("--threshold", type=float, default=0.1)
+    args = arg_parser.parse_args()
+
+    parser = WhoisParser(use_index=args.use_index, engine=args.engine)
+    result = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "records": args.records,
+            "seed": args.seed,
+            "use_index": args.use_index,
+            "engine": args.engine,
+        },
+        "formats": {
+            format: benchmark(
+                parser,
+                list(synthetic.generate(format, args.records, seed=args.seed)),
+            )
+            for format in args.format or synthetic.FORMATS
+        },
+    }
+
+    output = json.dumps(result, indent=2) + "\n"
+    if args.output is not None:
+        args.output.write_text(output)
+    else:
+        sys.stdout.write(output)
+
+    if args.compare is None:
+        return
+
+    regressions = compare(
+        result, json.loads(args.compare.read_text()), threshold=args.threshold
+    )
+    for regression in regressions:
+        sys.stderr.write(f"regression: {regression}\n")
+
+    if len(regressions) > 0:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
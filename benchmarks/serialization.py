@@ -0,0 +1,91 @@
+"""Compare serialization of records with dataclasses.asdict + json.dumps
+
+Usage:
+    python -m benchmarks.serialization --records 1000
+"""
+import argparse
+import dataclasses
+import io
+import json
+import sys
+import time
+from collections.abc import Callable
+from typing import Any
+
+from whois_parser import serialization
+from whois_parser.dataclasses import WhoisRecord
+from whois_parser.parser import WhoisParser
+
+from . import synthetic
+
+
+def _asdict_dumps(record: WhoisRecord) -> str:
+    # a custom encoder for datetimes (it's not possible to tell them from strings afterwards)
+    return json.dumps(dataclasses.asdict(record), default=str)
+
+
+def measure(func: Callable[[], Any], *, repeat: int = 3) -> float:
+    """Measure the best seconds of a function
+
+    Args:
+        func (Callable[[], Any]): Function
+        repeat (int, optional): Number of repeats. Defaults to 3.
+
+    Returns:
+        float: Seconds
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+
+    return best
+
+
+def benchmark(records: list[WhoisRecord]) -> dict[str, float]:
+    """Benchmark serialization of records
+
+    Args:
+        records (list[WhoisRecord]): Whois records
+
+    Returns:
+        dict[str, float]: Records per second of each method and speedups
+    """
+    lines = [serialization.dumps(record) for record in records]
+
+    seconds = {
+        "asdict_dumps": measure(lambda: [_asdict_dumps(r) for r in records]),
+        "dumps": measure(lambda: [serialization.dumps(r) for r in records]),
+        "dump_ndjson": measure(
+            lambda: serialization.dump_ndjson(records, io.StringIO())
+        ),
+        "loads": measure(lambda: [serialization.loads(line) for line in lines]),
+    }
+    result = {name: len(records) / value for name, value in seconds.items()}
+    result["dumps_speedup"] = result["dumps"] / result["asdict_dumps"]
+    result["dump_ndjson_speedup"] = result["dump_ndjson"] / result["asdict_dumps"]
+    return result
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--format", choices=synthetic.FORMATS, action="append")
+    arg_parser.add_argument("--records", type=int, default=1_000)
+    arg_parser.add_argument("--seed", type=int, default=0)
+    args = arg_parser.parse_args()
+
+    parser = WhoisParser(use_index=True)
+    results: dict[str, dict[str, float]] = {}
+    for format in args.format or synthetic.FORMATS:
+        corpus = synthetic.generate(format, args.records, seed=args.seed)
+        records = [
+            parser.parse(raw_text, hostname=hostname) for raw_text, hostname in corpus
+        ]
+        results[format] = benchmark(records)
+
+    sys.stdout.write(json.dumps(results, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""Generate a synthetic corpus of whois records from the fixtures
+
+Usage:
+    python -m benchmarks.synthetic --format gtld --records 10000 --output corpus.ndjson
+"""
+import argparse
+import json
+import pathlib
+import random
+import re
+import string
+import sys
+from collections.abc import Iterator
+from typing import Optional
+
+from whois_parser import settings
+
+FIXTURES_DIR = pathlib.Path(__file__).parent.parent / "tests" / "fixtures"
+
+# formats and their templates (fixture and hostname)
+TEMPLATES: dict[str, Optional[tuple[str, str]]] = {
+    # "key: value" lines of gTLDs
+    "gtld": ("google.com.txt", "google.com"),
+    # bracketed keys of .jp
+    "jp": ("google.co.jp.txt", "google.co.jp"),
+    # indented blocks of .uk and .be
+    "uk": ("google.uk.txt", "google.uk"),
+    "be": ("google.be.txt", "google.be"),
+    # rate limit responses
+    "rate_limit": None,
+}
+FORMATS = list(TEMPLATES)
+
+LABEL_PATTERN = re.compile("google", re.IGNORECASE)
+YEAR_PATTERN = re.compile(r"(?<!\d)(?:19|20)\d{2}(?!\d)")
+
+
+def random_label(rng: random.Random) -> str:
+    return "".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 12)))
+
+
+def _replace_label(match: re.Match, label: str) -> str:
+    text = match.group(0)
+    if text.isupper():
+        return label.upper()
+
+    if text[0].isupper():
+        return label.capitalize()
+
+    return label
+
+
+def vary(raw_text: str, hostname: str, rng: random.Random) -> tuple[str, str]:
+    """Vary a whois record by replacing its label and years
+
+    Args:
+        raw_text (str): Whois record
+        hostname (str): Hostname
+        rng (random.Random): Random number generator
+
+    Returns:
+        tuple[str, str]: A pair of a whois record and a hostname
+    """
+    label = random_label(rng)
+    shift = rng.randint(-10, 10)
+
+    raw_text = LABEL_PATTERN.sub(lambda m: _replace_label(m, label), raw_text)
+    # keep years of 29th Feb valid
+    raw_text = YEAR_PATTERN.sub(lambda m: str(int(m.group(0)) + shift * 4), raw_text)
+    return raw_text, LABEL_PATTERN.sub(label, hostname)
+
+
+def get_template(format: str) -> tuple[str, str]:
+    """Get the template of a format
+
+    Args:
+        format (str): Format (gtld, jp, uk or be)
+
+    Raises:
+        ValueError: Raised if the format has no template (e.g. rate_limit)
+
+    Returns:
+        tuple[str, str]: A pair of a fixture and a hostname
+    """
+    template = TEMPLATES.get(format)
+    if template is None:
+        raise ValueError(f"{format} has no template")
+
+    return template
+
+
+def generate(format: str, records: int, *, seed: int = 0) -> Iterator[tuple[str, str]]:
+    """Generate a synthetic corpus of a format
+
+    Args:
+        format (str): Format (gtld, jp, uk, be or rate_limit)
+        records (int): Number of records
+        seed (int, optional): Seed of random numbers. Defaults to 0.
+
+    Yields:
+        Iterator[tuple[str, str]]: Pairs of a whois record and a hostname
+    """
+    if format not in TEMPLATES:
+        raise ValueError(f"{format} is not supported. Use {', '.join(FORMATS)}.")
+
+    rng = random.Random(seed)
+
+    if TEMPLATES[format] is None:
+        messages = sorted(settings.WHOIS_RATE_LIMIT_MESSAGES)
+        for _ in range(records):
+            yield rng.choice(messages) + "\n", f"{random_label(rng)}.com"
+
+        return
+
+    filename, hostname = get_template(format)
+    raw_text = (FIXTURES_DIR / filename).read_text()
+    for _ in range(records):
+        yield vary(raw_text, hostname, rng)
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--format", choices=FORMATS, default="gtld")
+    arg_parser.add_argument("--records", type=int, default=1_000)
+    arg_parser.add_argument("--seed", type=int, default=0)
+    arg_parser.add_argument("--output", type=pathlib.Path)
+    args = arg_parser.parse_args()
+
+    output = args.output.open("w") if args.output is not None else sys.stdout
+    try:
+        for raw_text, hostname in generate(args.format, args.records, seed=args.seed):
+            output.write(json.dumps({"raw_text": raw_text, "hostname": hostname}))
+            output.write("\n")
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,11 @@
 from datetime import datetime
+from typing import Optional
+
+import pytest
 
 from tests.utils import read_fixture
 from whois_parser.parser import WhoisParser
+from whois_parser.parsers.abstract import find_last_section, normalize_raw_text
 
 
 def test_parse(parser: WhoisParser):
@@ -17,3 +21,30 @@ def test_parse(parser: WhoisParser):
     assert isinstance(result.updated_at, datetime)
     assert len(result.name_servers) == 4
     assert result.is_rate_limited is False
+
+
+@pytest.mark.parametrize(
+    "raw_text,expected",
+    [
+        ("", None),
+        ("foo: #1\nbar", None),
+        ("# whois.example.com\nfoo", 0),
+        ("foo\n# a\nbar\n# b\nbaz", 12),
+        ("foo\r# a\nbar", 4),
+    ],
+)
+def test_find_last_section(raw_text: str, expected: Optional[int]):
+    assert find_last_section(raw_text) == expected
+
+
+@pytest.mark.parametrize(
+    "raw_text,expected",
+    [
+        # returned as it is without a section
+        ("  foo: 1 \n bar: #2\n", "  foo: 1 \n bar: #2\n"),
+        # lines of the last section are stripped
+        ("# a\nfoo\n# b\n  bar: 1  \r\n baz \n", "# b\nbar: 1\nbaz"),
+    ],
+)
+def test_normalize_raw_text(raw_text: str, expected: str):
+    assert normalize_raw_text(raw_text) == expected
@@ -0,0 +1,126 @@
+import pathlib
+from dataclasses import replace
+from typing import Optional
+
+import pytest
+
+from tests.utils import read_fixture
+from whois_parser import settings
+from whois_parser.parser import WhoisParser
+from whois_parser.parsers.classifier import (
+    ResponseClassifier,
+    classify,
+    is_rate_limited,
+)
+
+FIXTURES = sorted(
+    path.name for path in (pathlib.Path(__file__).parent / "../fixtures").glob("*.txt")
+)
+
+
+@pytest.mark.parametrize(
+    "raw_text,expected",
+    [
+        ("", "empty"),
+        (" \n\t\n", "empty"),
+        ("WHOIS LIMIT EXCEEDED", "rate_limited"),
+        ("% whois.example\n% Your connection limit exceeded.\n", "rate_limited"),
+        ("whois limit exceeded\n", "rate_limited"),
+        (
+            'No match for "EXAMPLE.COM".\n>>> Last update of whois database <<<\n',
+            "not_found",
+        ),
+        ("Domain Name: example.com\n", None),
+        ("a. [ドメイン名]    EXAMPLE.JP\nNo match!!\n", None),
+        (
+            'Domain Name: example.com\n# whois.example\nNo match for "EXAMPLE.COM".\n',
+            "not_found",
+        ),
+        ("WHOIS LIMIT EXCEEDED\n# whois.example\n", None),
+    ],
+)
+def test_classify(raw_text: str, expected: Optional[str]):
+    assert classify(raw_text) == expected
+
+
+@pytest.mark.parametrize("filename", FIXTURES)
+def test_classify_with_fixtures(filename: str):
+    assert classify(read_fixture(filename)) is None
+
+
+def test_classifier_prefers_rate_limit():
+    classifier = ResponseClassifier(
+        rate_limit_messages=["slow down"], not_found_messages=["not found"]
+    )
+    assert classifier.classify("Not found. Slow down.") == "rate_limited"
+
+
+def test_extend_messages(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(settings, "WHOIS_RATE_LIMIT_MESSAGES", {"Query rate exceeded"})
+    assert classify("% Query rate exceeded for 192.0.2.1") == "rate_limited"
+    assert classify("WHOIS LIMIT EXCEEDED") is None
+
+
+def test_parse_rate_limited(parser: WhoisParser):
+    record = parser.parse("% banner\nWHOIS LIMIT EXCEEDED\n", hostname="example.org")
+    assert record.is_rate_limited is True
+    assert record.domain is None
+    assert record.name_servers == []
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_parse_not_found(lazy: bool):
+    raw_text = 'No match for "EXAMPLE.COM".\n'
+    record = WhoisParser(lazy=lazy).parse(raw_text, hostname="example.com")
+    assert record.raw_text == raw_text
+    assert record.is_rate_limited is False
+    assert record.registrant.name is None
+
+
+@pytest.mark.parametrize(
+    "raw_text,expected",
+    [
+        ("Domain Name: example.com\nHTTP/1.1 400 Bad Request\n", True),
+        ("Domain Name: example.com\n% HTTP/1.1 400 Bad Request received\n", False),
+        (
+            "Domain Name: example.com\n"
+            "Remarks: We are unable to process your request at this time.\n",
+            False,
+        ),
+        ("% banner\nWe are unable to process your request at this time. Bye\n", True),
+    ],
+)
+def test_is_rate_limited(raw_text: str, expected: bool):
+    assert is_rate_limited(raw_text) is expected
+
+
+def test_parse_rate_limited_with_fields(parser: WhoisParser):
+    record = parser.parse("WHOIS LIMIT EXCEEDED", fields=["domain"])
+    assert record.is_rate_limited is False
+
+
+@pytest.mark.parametrize(
+    "message", ['No match for "EXAMPLE.COM".', "HTTP/1.1 400 Bad Request"]
+)
+def test_message_in_referral_section(parser: WhoisParser, message: str):
+    # only the last section is classified since others are never parsed
+    raw_text = read_fixture("google.com.txt").replace(
+        "# whois.markmonitor.com", f"{message}\n# whois.markmonitor.com"
+    )
+    assert classify(raw_text) is None
+
+    record = parser.parse(raw_text, hostname="google.com")
+    expected = parser.parse(read_fixture("google.com.txt"), hostname="google.com")
+    assert replace(record, raw_text="") == replace(expected, raw_text="")
+    assert record.domain == "google.com"
+    assert record.is_rate_limited is False
+
+
+def test_message_with_key_value_lines(parser: WhoisParser):
+    # a section which has key / value lines is parsed
+    raw_text = "WHOIS LIMIT EXCEEDED\nDomain Name: example.com\n"
+    assert classify(raw_text) is None
+
+    record = parser.parse(raw_text)
+    assert record.domain == "example.com"
+    assert record.is_rate_limited is True
@@ -0,0 +1,106 @@
+from datetime import datetime, timedelta
+
+import dateparser
+import pytest
+
+from whois_parser.parsers import BaseParser
+from whois_parser.parsers.dates import DateHints, fast_parse_datetime, get_timezone
+from whois_parser.parsers.utils import (
+    clear_datetime_cache,
+    get_datetime_stats,
+    parse_datetime,
+)
+
+
+@pytest.mark.parametrize(
+    "date_string",
+    [
+        "2021-11-25T02:48:55Z",
+        "2021-11-25T05:49:49.180Z",
+        "2019-09-09T08:39:04-0700",
+        "2021-05-30T02:45:43-07:00",
+        "2019-09-09T15:39:04 +0900",
+        "2019-09-09T15:39Z",
+        "2019-09-09 15:39:04",
+        "2007-09-24",
+        "2001/03/22",
+        "2021/04/01 01:05:22 (JST)",
+        "11-Jun-2014",
+        "2007. 03. 02.",
+        "Tue Dec 12 2000",
+    ],
+)
+def test_fast_parse_datetime(date_string: str):
+    expected = dateparser.parse(date_string)
+
+    dt = fast_parse_datetime(date_string)
+    assert dt == expected
+    assert dt is not None
+    assert dt.utcoffset() == expected.utcoffset()
+    assert dt.tzname() == expected.tzname()
+
+
+@pytest.mark.parametrize(
+    "date_string", ["2021-02-30", "before Aug-1996", "2000-01-01 00:00:00+01"]
+)
+def test_fast_parse_datetime_with_unknown_format(date_string: str):
+    assert fast_parse_datetime(date_string) is None
+
+
+def test_parse_datetime_stats():
+    clear_datetime_cache()
+
+    parse_datetime("2021-11-25T02:48:55Z")
+    parse_datetime("2021-11-25T02:48:55Z")
+    parse_datetime("1 Jan 2000")
+    parse_datetime("foo")
+
+    stats = get_datetime_stats()
+    assert stats["fast_path"] == 1
+    assert stats["fallback"] == 2
+    assert stats["unparsed"] == 1
+    assert stats["cache_hits"] == 1
+    assert stats["cache_misses"] == 3
+
+
+def test_parse_datetime_with_hints():
+    clear_datetime_cache()
+
+    hints = DateHints(date_formats=("%Y年%m月%d日",), timezone="JST")
+    dt = parse_datetime("2001年03月22日", hints)
+    assert dt == datetime(2001, 3, 22, tzinfo=get_timezone("JST"))
+    # a timezone of a date string is kept
+    dt = parse_datetime("2021-11-25T02:48:55Z", hints)
+    assert isinstance(dt, datetime)
+    assert dt.utcoffset() == timedelta(0)
+    assert get_datetime_stats()["fallback"] == 0
+
+    # dateparser only considers the languages of hints
+    assert parse_datetime("1 January 2000", DateHints(languages=("en",))) == datetime(
+        2000, 1, 1
+    )
+    assert parse_datetime("1 janvier 2000", DateHints(languages=("en",))) == (
+        "1 janvier 2000"
+    )
+    assert get_datetime_stats()["fallback"] == 2
+
+
+@pytest.mark.parametrize(
+    "date_string", ["15 mars 2020", "15 März 2020", "15 марта 2020", "2020年3月15日"]
+)
+def test_parse_datetime_in_other_languages(date_string: str):
+    # the fallback parser doesn't restrict languages of dates
+    assert parse_datetime(date_string, BaseParser.DATE_HINTS) == datetime(2020, 3, 15)
+
+
+@pytest.mark.parametrize(
+    "name,offset",
+    [("JST", timedelta(hours=9)), ("Z", timedelta(0)), ("-07:00", timedelta(hours=-7))],
+)
+def test_get_timezone(name: str, offset: timedelta):
+    assert get_timezone(name).utcoffset(None) == offset
+
+
+def test_get_timezone_with_unknown_name():
+    with pytest.raises(ValueError):
+        get_timezone("Asia/Tokyo")
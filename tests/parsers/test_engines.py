@@ -0,0 +1,73 @@
+import itertools
+import pathlib
+
+import pytest
+
+from tests.utils import read_fixture
+from whois_parser.parser import WhoisParser
+from whois_parser.parsers.abstract import build_keyword_grammar
+from whois_parser.parsers.engines import PyparsingEngine, RegexEngine, compile_lookup
+from whois_parser.parsers.grammars import KeywordLookup
+
+FIXTURES = sorted(
+    path.name for path in (pathlib.Path(__file__).parent / "../fixtures").glob("*.txt")
+)
+
+TEXTS = [
+    "Domain Name: example.com\nName Server: ns1.example.com\nname server :  ns2.example.com\n",
+    "Registrar:\n    Example Registrar\n",
+    "\n  Key: indented after an empty line\n  Key: indented\n",
+    "Key:value\nKey:\tvalue\nKey: \nKey:   ",
+    "[Key]                  value\n[KEY]\n\n  value on the next line\n[ke]x",
+    "Key　: value\nKey\xa0 : value\nKey \xa0: value\n",
+    "ıkey: dotless\nKEY: upper\nſtatus: long s\n",
+]
+LOOKUPS = [
+    KeywordLookup(keyword, delimiter, is_case_sensitive, is_line_start_sensitive)
+    for keyword, delimiter, is_case_sensitive, is_line_start_sensitive in itertools.product(
+        ["Key", "key", "[Key]", "Name Server", "Registrar", "status"],
+        [":", None],
+        [False, True],
+        [False, True],
+    )
+]
+
+
+@pytest.mark.parametrize("filename", FIXTURES)
+def test_parse_with_regex_engine(parser: WhoisParser, filename: str):
+    hostname = filename.removesuffix(".txt")
+    raw_text = read_fixture(filename)
+
+    expected = parser.parse(raw_text, hostname=hostname)
+    assert WhoisParser(engine="regex").parse(raw_text, hostname=hostname) == expected
+    assert (
+        WhoisParser(engine="regex", use_index=True).parse(raw_text, hostname=hostname)
+        == expected
+    )
+
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_engines_equivalence(text: str):
+    pyparsing_engine = PyparsingEngine(text, build_keyword_grammar)
+    regex_engine = RegexEngine(text, build_keyword_grammar)
+
+    for lookup in LOOKUPS:
+        assert regex_engine.find(lookup) == pyparsing_engine.find(lookup), lookup
+        assert regex_engine.find_all(lookup) == pyparsing_engine.find_all(
+            lookup
+        ), lookup
+
+
+def test_regex_engine_fallback():
+    lookup = KeywordLookup(" Key")
+    assert compile_lookup(lookup) is None
+
+    text = "Key: value\n"
+    assert RegexEngine(text, build_keyword_grammar).find(lookup) == PyparsingEngine(
+        text, build_keyword_grammar
+    ).find(lookup)
+
+
+def test_unknown_engine():
+    with pytest.raises(ValueError):
+        WhoisParser(engine="foo")
@@ -0,0 +1,31 @@
+from tests.utils import read_fixture
+from whois_parser.parsers import BaseParser, JpParser, UkParser
+from whois_parser.parsers.grammars import KeywordLookup
+
+
+def test_warm_up():
+    size = BaseParser.warm_up()
+    assert size > 0
+    assert size == len(BaseParser.grammars)
+    assert KeywordLookup("Domain Name") in BaseParser.grammars.keyword_lookups()
+
+    # grammars are reused after warm-up
+    BaseParser.parse(read_fixture("google.com.txt"))
+    assert len(BaseParser.grammars) == size
+
+
+def test_registry_per_class():
+    assert JpParser.grammars is not BaseParser.grammars
+
+    JpParser.warm_up()
+    assert (
+        KeywordLookup("[ドメイン名]", delimiter=None, is_line_start_sensitive=False)
+        in JpParser.grammars.keyword_lookups()
+    )
+
+
+def test_prefix_grammars():
+    size = UkParser.warm_up()
+
+    UkParser.parse(read_fixture("google.uk.txt"))
+    assert len(UkParser.grammars) == size
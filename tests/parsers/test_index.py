@@ -0,0 +1,48 @@
+import pathlib
+
+import pytest
+
+from tests.utils import read_fixture
+from whois_parser.parser import WhoisParser
+from whois_parser.parsers.grammars import KeywordLookup
+from whois_parser.parsers.index import LineIndex
+
+FIXTURES = sorted(
+    path.name for path in (pathlib.Path(__file__).parent / "../fixtures").glob("*.txt")
+)
+
+
+@pytest.mark.parametrize("filename", FIXTURES)
+def test_parse_with_index(parser: WhoisParser, filename: str):
+    hostname = filename.removesuffix(".txt")
+    raw_text = read_fixture(filename)
+
+    expected = parser.parse(raw_text, hostname=hostname)
+    result = WhoisParser(use_index=True).parse(raw_text, hostname=hostname)
+    assert result == expected
+
+
+def test_line_index():
+    index = LineIndex(
+        "Domain Name: example.com\n"
+        "Name Server: ns1.example.com\n"
+        "name server :  ns2.example.com\n"
+        "Registrar:\n"
+        "    Example Registrar\n"
+    )
+    assert index.keys() == ["Domain Name", "Name Server", "Registrar"]
+    assert [entry.line for entry in index.get("name server")] == [1, 2]
+
+    assert index.find(KeywordLookup("domain name")) == "example.com"
+    assert index.find_all(KeywordLookup("Name Server")) == [
+        "ns1.example.com",
+        "ns2.example.com",
+    ]
+    assert index.find_all(KeywordLookup("Name Server", is_case_sensitive=True)) == [
+        "ns1.example.com"
+    ]
+    assert index.find(KeywordLookup("Registrar")) == "Example Registrar"
+    assert index.find(KeywordLookup("Server", is_line_start_sensitive=False)) == (
+        "ns1.example.com"
+    )
+    assert index.find(KeywordLookup("Server")) is None
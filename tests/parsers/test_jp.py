@@ -14,3 +14,6 @@ def test_parse(parser: WhoisParser):
     assert result.registrant.organization == "グーグル合同会社"
     assert isinstance(result.registered_at, datetime)
     assert isinstance(result.updated_at, datetime)
+    # a date without a timezone is naive
+    assert result.registered_at.tzinfo is None
+    assert result.updated_at.tzname() == "JST"
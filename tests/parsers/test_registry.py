@@ -0,0 +1,68 @@
+import pytest
+
+from tests.utils import read_fixture
+from whois_parser.parser import WhoisParser
+from whois_parser.parsers import BaseParser, JpParser
+from whois_parser.parsers.registry import ParserRegistry, import_parser
+from whois_parser.parsers.spec import parse_spec
+
+
+def test_import_parser():
+    assert import_parser("whois_parser.parsers.jp:JpParser") is JpParser
+
+    for path in ["whois_parser.parsers.jp", "whois_parser.parsers.jp:JP_SPEC"]:
+        with pytest.raises(ValueError):
+            import_parser(path)
+
+
+def test_registry():
+    registry = ParserRegistry({"jp": "whois_parser.parsers.jp:JpParser"})
+    assert registry.is_loaded("jp") is False
+    assert list(registry) == ["jp"]
+
+    assert registry["jp"] is JpParser
+    assert registry.is_loaded("jp") is True
+    # loading a parser is not a change
+    assert registry.version == 0
+
+    registry["com"] = BaseParser
+    assert dict(registry) == {"jp": JpParser, "com": BaseParser}
+    assert registry.version == 1
+
+    del registry["com"]
+    assert "com" not in registry
+    assert registry.version == 2
+    assert registry.get("com", BaseParser) is BaseParser
+
+
+def test_fingerprint_markers():
+    registry = ParserRegistry(
+        {
+            "jp": "whois_parser.parsers.jp:JpParser",
+            "co.jp": "whois_parser.parsers.jp:JpParser",
+            "com": parse_spec({"fields": {}, "fingerprint_markers": ["foo"]}),
+        },
+        fingerprint_markers={"jp": ["[Domain Name]"]},
+    )
+    assert registry.get_fingerprint_markers("jp") == ("[Domain Name]",)
+    assert registry.get_fingerprint_markers("com") == ("foo",)
+    assert registry.is_loaded("jp") is False
+    assert registry.is_loaded("com") is False
+
+    # the parser is loaded since its markers are not given
+    assert registry.get_fingerprint_markers("co.jp") == JpParser.FINGERPRINT_MARKERS
+    assert registry.is_loaded("co.jp") is True
+
+    # markers are dropped with the parser
+    registry["jp"] = BaseParser
+    assert registry.get_fingerprint_markers("jp") == ()
+
+
+def test_parse_with_registry():
+    registry = ParserRegistry({"co.jp": "whois_parser.parsers.jp:JpParser"})
+    parser = WhoisParser(registry)
+    assert registry.is_loaded("co.jp") is False
+
+    record = parser.parse(read_fixture("google.co.jp.txt"), hostname="google.co.jp")
+    assert record.registrant.organization == "グーグル合同会社"
+    assert registry.is_loaded("co.jp") is True
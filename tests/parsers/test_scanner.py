@@ -0,0 +1,89 @@
+import itertools
+
+import pytest
+
+from whois_parser.parsers import BaseParser
+from whois_parser.parsers.grammars import KeywordLookup
+from whois_parser.parsers.scanner import KeywordScanner
+
+
+@pytest.mark.parametrize(
+    "keywords,text,expected",
+    [
+        (
+            ["Registrar", "Registrar URL"],
+            "Registrar URL: x",
+            {"Registrar", "Registrar URL"},
+        ),
+        (["Registrar", "Registrar URL"], "Registrar: x", {"Registrar"}),
+        (
+            ["Expiry Date", "Registry Expiry Date"],
+            "Registry Expiry Date: x",
+            {"Expiry Date", "Registry Expiry Date"},
+        ),
+        (["Name", "Domain"], "Registrar: x", set()),
+        (["Key"], "", set()),
+    ],
+)
+def test_scan(keywords: list[str], text: str, expected: set[str]):
+    scanner = KeywordScanner(keywords, is_case_sensitive=True)
+    assert scanner.scan(text) == expected
+
+
+def test_scan_case_insensitive():
+    scanner = KeywordScanner(["Name Server", "nserver"])
+    assert scanner.scan("NAME SERVER: x") == {"NAME SERVER"}
+    assert scanner.scan("Name Server: x") == set()
+
+
+def test_filter_keeps_priority_order():
+    scanner = KeywordScanner(["b", "a", ""], is_case_sensitive=True)
+    lookups = [
+        KeywordLookup(keyword, ":", True, False) for keyword in ["b", "c", "", "a"]
+    ]
+    assert [lookup.keyword for lookup in scanner.filter(lookups, "a: b: ")] == [
+        "b",
+        "",
+        "a",
+    ]
+
+
+@pytest.mark.parametrize("engine", ["pyparsing", "regex"])
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Registry Expiry Date: 2020-01-01\nExpiry Date: 2021-01-01\n",
+        "expiry date: 2021-01-01\nREGISTRY EXPIRY DATE: 2020-01-01\n",
+        "Expiry\tDate: 2021-01-01\nRegistry Expiry Date:\t2020-01-01\n",
+        "Unrelated: value\n",
+    ],
+)
+def test_find_by_keywords(engine: str, text: str):
+    parser = BaseParser(text, engine=engine)
+    keywords = ["Expiry Date", "Registry Expiry Date", "Date"]
+
+    for is_case_sensitive, is_line_start_sensitive in itertools.product(
+        [False, True], [False, True]
+    ):
+        lookups = [
+            KeywordLookup(keyword, ":", is_case_sensitive, is_line_start_sensitive)
+            for keyword in keywords
+        ]
+        # same as trying every keyword in order
+        expected = next(
+            (
+                value
+                for value in map(parser._find_by_lookup, lookups)
+                if value is not None
+            ),
+            None,
+        )
+        assert (
+            parser._find_by_keywords(
+                keywords,
+                delimiter=":",
+                is_case_sensitive=is_case_sensitive,
+                is_line_start_sensitive=is_line_start_sensitive,
+            )
+            == expected
+        )
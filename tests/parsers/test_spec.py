@@ -0,0 +1,140 @@
+import json
+import pathlib
+import pickle
+from datetime import datetime
+from typing import Any
+
+import pytest
+
+from tests.utils import read_fixture
+from whois_parser.parser import WhoisParser
+from whois_parser.parsers import BaseParser, JpParser
+from whois_parser.parsers.dates import DateHints
+from whois_parser.parsers.registry import ParserRegistry
+from whois_parser.parsers.spec import FieldSpec, compile_spec, load_specs, parse_spec
+
+FIXTURES = sorted(
+    path.name
+    for path in (pathlib.Path(__file__).parent.parent / "fixtures").glob("*.txt")
+)
+
+SPEC: dict[str, Any] = {
+    "fingerprint_markers": ["% Example Registry"],
+    "defaults": {"delimiter": "::"},
+    "fields": {
+        "domain": {"keywords": ["name"], "post": ["strip", "upper"]},
+        "expires_at": {"keywords": ["expiry"]},
+        "name_servers": {"keywords": ["ns"], "post": ["lower"]},
+        "registrar": {"block": "Registrar:", "keywords": ["Name:"]},
+        "registrant": {"email": {"keywords": ["email"]}, "name": None},
+    },
+}
+
+RAW_TEXT = """% Example Registry
+name:: example.test
+expiry:: 2030-01-02
+ns:: NS1.EXAMPLE.TEST
+ns:: NS2.EXAMPLE.TEST
+Registrar:
+Name: Example Registrar
+email:: registrant@example.test
+Registrant Name: John Doe
+Domain Status: active
+"""
+
+
+def test_parse_spec():
+    spec = parse_spec(SPEC)
+    assert spec.fingerprint_markers == ("% Example Registry",)
+    assert spec.fields["domain"] == FieldSpec(
+        keywords=("name",), delimiter="::", post=("strip", "upper")
+    )
+    assert spec.fields["registrant_name"] is None
+    assert spec.keywords(is_case_sensitive=False) == {"NAME", "EXPIRY", "NS", "EMAIL"}
+    assert spec.date_hints is None
+    assert parse_spec(spec) is spec
+
+    spec = parse_spec({"fields": {}, "date_hints": {"languages": ["ja"]}})
+    assert spec.date_hints == DateHints(languages=("ja",))
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"fields": {"unknown": {"keywords": ["foo"]}}},
+        {"fields": {"registrant": {"unknown": {"keywords": ["foo"]}}}},
+        {"fields": {"domain": {"keywords": ["foo"], "unknown": True}}},
+        {"fields": {"domain": {"keywords": ["foo"], "post": ["unknown"]}}},
+        {"fields": {"domain": {}}},
+        {"unknown": {}},
+        {"fields": {}, "date_hints": {"unknown": []}},
+        {"fields": {}, "date_hints": {"timezone": "foo"}},
+    ],
+)
+def test_invalid_spec(data: dict[str, Any]):
+    with pytest.raises(ValueError):
+        parse_spec(data)
+
+
+def test_compile_spec():
+    parser = compile_spec(SPEC, name="ExampleParser")
+    assert issubclass(parser, BaseParser)
+    assert parser.__name__ == "ExampleParser"
+    assert parser.FINGERPRINT_MARKERS == ("% Example Registry",)
+    # keywords of the base spec are scanned as well
+    assert {"NAME", "DOMAIN STATUS"} <= parser.SCAN_KEYWORDS[False]
+
+    record = parser.parse(RAW_TEXT)
+    assert record.domain == "EXAMPLE.TEST"
+    assert isinstance(record.expires_at, datetime)
+    assert record.name_servers == ["ns1.example.test", "ns2.example.test"]
+    assert record.registrar == "Example Registrar"
+    assert record.registrant.email == "registrant@example.test"
+    # a field whose spec is None is never found
+    assert record.registrant.name is None
+    # fields which are not defined are inherited
+    assert record.statuses == ["active"]
+
+
+def test_subclass():
+    class ExampleParser(JpParser):
+        SPEC = parse_spec({"fields": {"registrar": {"keywords": ["[Registrar]"]}}})
+
+    assert ExampleParser.FINGERPRINT_MARKERS == JpParser.FINGERPRINT_MARKERS
+    assert ExampleParser.DATE_HINTS == JpParser.DATE_HINTS
+    assert JpParser.SCAN_KEYWORDS[False] < ExampleParser.SCAN_KEYWORDS[False]
+
+    raw_text = read_fixture("google.co.jp.txt")
+    assert ExampleParser.parse(raw_text).domain == JpParser.parse(raw_text).domain
+
+
+@pytest.mark.parametrize("filename", FIXTURES)
+def test_scan_keywords(filename: str, monkeypatch: pytest.MonkeyPatch):
+    # keywords scanned at once don't change results
+    class UnscannedParser(BaseParser):
+        pass
+
+    monkeypatch.setattr(UnscannedParser, "SCAN_KEYWORDS", {})
+
+    raw_text = read_fixture(filename)
+    assert BaseParser.parse(raw_text) == UnscannedParser.parse(raw_text)
+
+
+def test_load_specs(tmp_path: pathlib.Path):
+    path = tmp_path / "specs.json"
+    path.write_text(json.dumps({"test": SPEC, "example.test": SPEC}))
+
+    registry = ParserRegistry(load_specs(path))
+    assert registry.is_loaded("test") is False
+
+    parser = WhoisParser(registry)
+    record = parser.parse(RAW_TEXT, hostname="example.test")
+    assert record.domain == "EXAMPLE.TEST"
+    assert registry.is_loaded("example.test") is True
+    assert registry["example.test"].__name__ == "ExampleTestParser"
+
+    # compiled parsers are pickled as specs
+    restored = pickle.loads(pickle.dumps(parser))
+    assert restored.parse(RAW_TEXT, hostname="example.test") == record
+    # a parser is detected by the fingerprint markers of a spec
+    assert restored.parse(RAW_TEXT) == record
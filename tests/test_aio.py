@@ -0,0 +1,102 @@
+import asyncio
+import threading
+
+import pytest
+
+from tests.utils import read_fixture
+from whois_parser.compact import EMPTY_CONTACTS
+from whois_parser.dataclasses import Abuse
+from whois_parser.parser import WhoisParser
+
+
+class CountingParser(WhoisParser):
+    # number of times the parser is pickled (to be sent to a worker process)
+    pickled = 0
+
+    def __getstate__(self) -> dict:
+        CountingParser.pickled += 1
+        return self.__dict__.copy()
+
+
+@pytest.mark.asyncio
+async def test_aparse(parser: WhoisParser):
+    raw_text = read_fixture("google.com.txt")
+
+    record = await parser.aparse(raw_text, hostname="google.com")
+    assert record == parser.parse(raw_text, hostname="google.com")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("kind", ["thread", "process"])
+async def test_aparse_many(parser: WhoisParser, kind: str):
+    items = [
+        (read_fixture("google.com.txt"), "google.com"),
+        (read_fixture("google.co.jp.txt"), "google.co.jp"),
+        (read_fixture("google.uk.txt"), "google.uk"),
+    ]
+
+    with parser.create_executor(kind=kind, max_workers=2) as executor:
+        results = [
+            result
+            async for result in parser.aparse_many(
+                items, executor=executor, concurrency=2
+            )
+        ]
+
+    assert [result.index for result in results] == [0, 1, 2]
+    for (raw_text, hostname), result in zip(items, results):
+        assert result.record == parser.parse(raw_text, hostname=hostname)
+
+
+@pytest.mark.asyncio
+async def test_process_executor_sends_parser_once():
+    parser = CountingParser(compact=True)
+    CountingParser.pickled = 0
+    items = [(read_fixture("google.com.txt"), "google.com"), ("", None)] * 4
+
+    with parser.create_executor(kind="process", max_workers=2) as executor:
+        results = [
+            result async for result in parser.aparse_many(items, executor=executor)
+        ]
+        record = await parser.aparse("", executor=executor)
+
+    # the parser is sent to each worker at most once (not per record)
+    assert CountingParser.pickled <= 2
+    assert [result.record for result in results] == [
+        parser.parse(raw_text, hostname=hostname) for raw_text, hostname in items
+    ]
+    # empty contacts are shared in the parent process again
+    assert record.abuse is EMPTY_CONTACTS[Abuse]
+
+
+@pytest.mark.asyncio
+async def test_aparse_many_cancellation(parser: WhoisParser):
+    started = threading.Event()
+    release = threading.Event()
+    calls: list[str] = []
+
+    class BlockingParser(WhoisParser):
+        def parse(self, raw_text, *, hostname=None, fields=None):
+            calls.append(raw_text)
+            started.set()
+            release.wait()
+            return super().parse(raw_text, hostname=hostname, fields=fields)
+
+    items = [("", None)] * 10
+    consumed: list[int] = []
+
+    async def consume():
+        async for result in BlockingParser().aparse_many(items, concurrency=2):
+            consumed.append(result.index)
+
+    task = asyncio.create_task(consume())
+    await asyncio.get_running_loop().run_in_executor(None, started.wait)
+
+    task.cancel()
+    release.set()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert consumed == []
+    # queued items are not submitted to the executor
+    assert len(calls) <= 2
@@ -0,0 +1,41 @@
+import pathlib
+
+import pytest
+
+from tests.utils import read_fixture
+from whois_parser.parser import WhoisParser
+
+FILENAMES = sorted(
+    path.name for path in (pathlib.Path(__file__).parent / "fixtures").glob("*.txt")
+)
+
+
+@pytest.fixture
+def items() -> list[tuple[str, str]]:
+    return [
+        (read_fixture(filename), filename.removesuffix(".txt"))
+        for filename in FILENAMES
+    ]
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_parse_many(parser: WhoisParser, items: list[tuple[str, str]], workers):
+    results = list(parser.parse_many(items, workers=workers, chunksize=2))
+
+    assert [result.index for result in results] == list(range(len(items)))
+    for (raw_text, hostname), result in zip(items, results):
+        assert result.error is None
+        assert result.record == parser.parse(raw_text, hostname=hostname)
+
+
+def test_parse_many_as_completed(parser: WhoisParser, items: list[tuple[str, str]]):
+    results = list(parser.parse_many(items, workers=2, chunksize=1, ordered=False))
+    assert sorted(result.index for result in results) == list(range(len(items)))
+
+
+def test_parse_many_with_error(parser: WhoisParser):
+    results = list(parser.parse_many([(None, "example.com"), ("", "example.com")]))  # type: ignore
+
+    assert results[0].record is None
+    assert results[0].error is not None
+    assert results[1].record is not None
@@ -0,0 +1,93 @@
+import pytest
+
+from benchmarks import allocations, import_time, run
+from benchmarks import serialization as serialization_benchmark
+from benchmarks import synthetic
+from tests.utils import read_fixture
+from whois_parser.parser import WhoisParser
+
+
+def _filled_fields(record) -> set[str]:
+    return {
+        field
+        for field in ("domain", "registrar", "registered_at", "expires_at", "statuses")
+        if getattr(record, field)
+    }
+
+
+@pytest.mark.parametrize("format", ["gtld", "jp", "uk", "be"])
+def test_synthetic(format: str):
+    parser = WhoisParser(use_index=True)
+    filename, hostname = synthetic.get_template(format)
+    template = parser.parse(read_fixture(filename), hostname=hostname)
+
+    corpus = list(synthetic.generate(format, 3, seed=1))
+    assert len({raw_text for raw_text, _ in corpus}) == 3
+
+    for raw_text, hostname in corpus:
+        record = parser.parse(raw_text, hostname=hostname)
+        # synthetic records are parsed as well as their templates
+        assert _filled_fields(record) == _filled_fields(template)
+        if record.domain is not None:
+            assert record.domain.lower() == hostname
+
+
+def test_synthetic_rate_limit():
+    parser = WhoisParser()
+    for raw_text, hostname in synthetic.generate("rate_limit", 3):
+        assert parser.parse(raw_text, hostname=hostname).is_rate_limited
+
+    with pytest.raises(ValueError):
+        synthetic.get_template("rate_limit")
+
+
+def test_compare():
+    baseline = {
+        "formats": {
+            "gtld": {
+                "records_per_sec": 100.0,
+                "p50_ms": 1.0,
+                "p99_ms": 2.0,
+                "peak_memory_bytes": 100,
+            }
+        }
+    }
+    result = {
+        "formats": {
+            "gtld": {
+                "records_per_sec": 50.0,
+                "p50_ms": 1.0,
+                "p99_ms": 2.1,
+                "peak_memory_bytes": 100,
+            }
+        }
+    }
+
+    regressions = run.compare(result, baseline, threshold=0.1)
+    assert len(regressions) == 1
+    assert regressions[0].startswith("gtld.records_per_sec")
+
+
+def test_serialization_benchmark():
+    parser = WhoisParser(use_index=True)
+    records = [
+        parser.parse(raw_text, hostname=hostname)
+        for raw_text, hostname in synthetic.generate("gtld", 3)
+    ]
+
+    result = serialization_benchmark.benchmark(records)
+    assert result["dumps"] > 0
+    assert result["loads"] > 0
+
+
+def test_import_time():
+    result = import_time.measure(1)
+    assert result["median_ms"] > 0
+    # heavy dependencies and parsers of ccTLDs are imported on first use
+    assert result["eager_modules"] == []
+
+
+def test_allocations():
+    result = allocations.measure(allocations.load_fixtures()[:2])
+    assert set(result) == {"decode", "normalize", "parse"}
+    assert result["parse"] > 0
@@ -0,0 +1,171 @@
+import importlib.metadata as importlib_metadata
+import json
+import pathlib
+import pickle
+import sqlite3
+
+import pytest
+
+from tests.utils import read_fixture
+from whois_parser.cache import ResultCache, get_cache_version
+from whois_parser.parser import WhoisParser
+from whois_parser.parsers import BaseParser, JpParser
+from whois_parser.parsers.spec import compile_spec
+
+FIXTURES = sorted(
+    path.name for path in (pathlib.Path(__file__).parent / "fixtures").glob("*.txt")
+)
+DATETIME_FIELDS = ("expires_at", "registered_at", "updated_at")
+
+
+@pytest.mark.parametrize("filename", FIXTURES)
+def test_round_trip(filename: str):
+    hostname = filename.removesuffix(".txt")
+    raw_text = read_fixture(filename)
+    cache = ResultCache()
+    parser = WhoisParser(cache=cache)
+
+    parsed = parser.parse(raw_text, hostname=hostname)
+    cached = parser.parse(raw_text, hostname=hostname)
+    assert cached == parsed
+    assert cached is not parsed
+    assert cached.raw_text == raw_text
+    for field in DATETIME_FIELDS:
+        value = getattr(parsed, field)
+        assert repr(getattr(cached, field)) == repr(value)
+
+    stats = cache.stats
+    assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+
+
+def test_cached_record_is_not_shared():
+    parser = WhoisParser(cache=ResultCache())
+    raw_text = "Domain Name: example.com\n"
+
+    parser.parse(raw_text).name_servers.append("ns1.example.com")
+    assert parser.parse(raw_text).name_servers == []
+
+
+def test_make_key():
+    key = ResultCache.make_key(BaseParser, "foo")
+    assert key == ResultCache.make_key(BaseParser, "foo")
+    assert key != ResultCache.make_key(JpParser, "foo")
+    assert key != ResultCache.make_key(BaseParser, "foo", ["domain"])
+    assert ResultCache.make_key(
+        BaseParser, "foo", ["domain", "registrar"]
+    ) == ResultCache.make_key(BaseParser, "foo", ["registrar", "domain"])
+
+
+def test_make_key_by_last_section():
+    raw_text = "# whois.example\nDomain Name: example.com\n"
+    # a referral section is not parsed
+    assert ResultCache.make_key(
+        BaseParser, "# whois.iana.org\nrefer: whois.example\n" + raw_text
+    ) == ResultCache.make_key(BaseParser, raw_text)
+
+
+def test_make_key_by_spec():
+    spec = {"fields": {"domain": {"keywords": ["name"]}}}
+    parser = compile_spec(spec, name="ExampleParser")
+    other = compile_spec(
+        {"fields": {"domain": {"keywords": ["domain"]}}}, name="ExampleParser"
+    )
+    assert ResultCache.make_key(parser, "foo") == ResultCache.make_key(
+        compile_spec(spec, name="ExampleParser"), "foo"
+    )
+    assert ResultCache.make_key(parser, "foo") != ResultCache.make_key(other, "foo")
+
+
+def test_cache_version_without_metadata(monkeypatch: pytest.MonkeyPatch):
+    def version(name: str) -> str:
+        raise importlib_metadata.PackageNotFoundError(name)
+
+    get_cache_version.cache_clear()
+    monkeypatch.setattr(importlib_metadata, "version", version)
+    try:
+        assert get_cache_version().startswith("unknown+")
+    finally:
+        get_cache_version.cache_clear()
+
+
+def test_evictions():
+    cache = ResultCache(max_entries=2)
+    parser = WhoisParser(cache=cache)
+    for domain in ["a.com", "b.com", "c.com", "a.com"]:
+        parser.parse(f"Domain Name: {domain}\n")
+
+    stats = cache.stats
+    assert (stats.hits, stats.misses, stats.evictions, stats.entries) == (0, 4, 2, 2)
+
+
+def test_max_bytes():
+    cache = ResultCache(max_bytes=1)
+    WhoisParser(cache=cache).parse("Domain Name: example.com\n")
+    assert (cache.stats.entries, cache.stats.bytes) == (0, 0)
+
+
+def test_disk_tier(tmp_path: pathlib.Path):
+    path = tmp_path / "cache.sqlite3"
+    raw_text = read_fixture("google.co.jp.txt")
+
+    cache = ResultCache(path=path)
+    parsed = WhoisParser(cache=cache).parse(raw_text, hostname="google.co.jp")
+    cache.close()
+
+    cache = ResultCache(path=path)
+    parser = WhoisParser(cache=cache)
+    assert parser.parse(raw_text, hostname="google.co.jp") == parsed
+    assert parser.parse(raw_text, hostname="google.co.jp") == parsed
+    assert (cache.stats.disk_hits, cache.stats.hits, cache.stats.misses) == (1, 1, 0)
+
+    cache.clear()
+    parser.parse(raw_text, hostname="google.co.jp")
+    assert cache.stats.misses == 1
+    cache.close()
+
+
+def test_disk_tier_stores_json(tmp_path: pathlib.Path):
+    path = tmp_path / "cache.sqlite3"
+    cache = ResultCache(path=path)
+    parser = WhoisParser(cache=cache)
+    parser.parse("Domain Name: example.com\n")
+    cache.close()
+
+    connection = sqlite3.connect(path)
+    ((key, value),) = connection.execute("SELECT key, value FROM records")
+    assert json.loads(value)["domain"] == "example.com"
+
+    # a value which is not JSON (e.g. a pickle) is never loaded
+    connection.execute(
+        "UPDATE records SET value = ? WHERE key = ?",
+        (pickle.dumps({"domain": "example.com"}), key),
+    )
+    connection.commit()
+    connection.close()
+
+    cache = ResultCache(path=path)
+    assert cache.get(key) is None
+    assert cache.stats.misses == 1
+    cache.close()
+
+
+def test_pickle(tmp_path: pathlib.Path):
+    cache = ResultCache(path=tmp_path / "cache.sqlite3")
+    parser = WhoisParser(cache=cache)
+    parser.parse("Domain Name: example.com\n")
+
+    restored: ResultCache = pickle.loads(pickle.dumps(cache))
+    assert restored.stats.entries == 0
+    WhoisParser(cache=restored).parse("Domain Name: example.com\n")
+    assert restored.stats.disk_hits == 1
+
+    cache.close()
+    restored.close()
+
+
+def test_invalid_options():
+    with pytest.raises(ValueError):
+        ResultCache(max_entries=0)
+
+    with pytest.raises(ValueError):
+        WhoisParser(lazy=True, cache=ResultCache())
@@ -0,0 +1,163 @@
+import csv
+import gzip
+import io
+import json
+import pathlib
+import subprocess
+import sys
+
+import pytest
+
+from tests.utils import read_fixture
+from whois_parser.cli import expand_sources, get_csv_columns, main
+from whois_parser.dataclasses import WhoisRecord
+from whois_parser.parser import WhoisParser
+
+FIXTURES = pathlib.Path(__file__).parent / "fixtures"
+
+
+def make_stdin(data: bytes) -> io.TextIOWrapper:
+    return io.TextIOWrapper(io.BytesIO(data))
+
+
+def test_directory(capsys: pytest.CaptureFixture):
+    assert main([str(FIXTURES)]) == 0
+
+    captured = capsys.readouterr()
+    lines = [json.loads(line) for line in captured.out.splitlines()]
+    filenames = sorted(path.name for path in FIXTURES.glob("*.txt"))
+    assert [line["index"] for line in lines] == list(range(len(filenames)))
+    assert [line["hostname"] + ".txt" for line in lines] == filenames
+
+    parser = WhoisParser(engine="regex", raw_text_mode="drop")
+    for filename, line in zip(filenames, lines):
+        expected = parser.parse(
+            read_fixture(filename), hostname=filename.removesuffix(".txt")
+        )
+        assert WhoisRecord.from_dict(line["record"]) == expected
+
+    assert f"{len(filenames)} records, 0 errors" in captured.err
+
+
+def test_csv_with_fields(capsys: pytest.CaptureFixture, tmp_path: pathlib.Path):
+    output = tmp_path / "output.csv"
+    assert (
+        main(
+            [
+                str(FIXTURES / "google.co*.txt"),
+                "--format",
+                "csv",
+                "--fields",
+                "domain,name_servers,registrant",
+                "-o",
+                str(output),
+                "--quiet",
+            ]
+        )
+        == 0
+    )
+    assert capsys.readouterr().err == ""
+
+    with open(output, newline="") as f:
+        rows = list(csv.DictReader(f))
+
+    assert [row["hostname"] for row in rows] == ["google.co.jp", "google.com"]
+    assert list(rows[0]) == get_csv_columns(
+        frozenset(["domain", "name_servers", "registrant"])
+    )
+    assert rows[1]["domain"] == "google.com"
+    assert rows[1]["registrant_organization"] == "Google LLC"
+    assert set(rows[1]["name_servers"].split("|")) == {
+        "ns1.google.com",
+        "ns2.google.com",
+        "ns3.google.com",
+        "ns4.google.com",
+    }
+
+
+def test_stdin_ndjson(capsys: pytest.CaptureFixture, monkeypatch: pytest.MonkeyPatch):
+    data = (
+        json.dumps({"text": read_fixture("google.uk.txt"), "host": "google.uk"})
+        + "\n"
+        + json.dumps({"text": "Domain Name: example.com\n", "host": None})
+        + "\n"
+    )
+    monkeypatch.setattr("sys.stdin", make_stdin(gzip.compress(data.encode())))
+
+    assert (
+        main(["--text-field", "text", "--hostname-field", "host", "--workers", "2"])
+        == 0
+    )
+
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [line["hostname"] for line in lines] == ["google.uk", None]
+    assert lines[0]["record"]["registrar"].startswith("Markmonitor")
+    assert lines[1]["record"]["domain"] == "example.com"
+
+
+def test_stdin_invalid_ndjson(
+    capsys: pytest.CaptureFixture, monkeypatch: pytest.MonkeyPatch
+):
+    lines = [
+        json.dumps({"raw_text": "Domain Name: example.com\n"}),
+        "{",
+        json.dumps({"raw_text": "Domain Name: example.net\n"}),
+        json.dumps({"text": ""}),
+    ]
+    monkeypatch.setattr("sys.stdin", make_stdin("\n".join(lines).encode()))
+
+    # the exit status reports the failed records
+    assert main([]) == 1
+
+    captured = capsys.readouterr()
+    results = [json.loads(line) for line in captured.out.splitlines()]
+    # an invalid line is output as an error in order of the input
+    assert [result["index"] for result in results] == [0, 1, 2, 3]
+    assert results[0]["record"]["domain"] == "example.com"
+    assert ":2: JSONDecodeError" in results[1]["error"]
+    assert results[2]["record"]["domain"] == "example.net"
+    assert results[3]["error"].endswith(":4: ValueError: raw_text should be a string")
+    assert "4 records, 2 errors" in captured.err
+
+
+def test_stdin_text(capsys: pytest.CaptureFixture, monkeypatch: pytest.MonkeyPatch):
+    raw_text = read_fixture("google.co.jp.txt")
+    # a legacy charset is decoded by the TLD of the hostname
+    monkeypatch.setattr("sys.stdin", make_stdin(raw_text.encode("euc_jp")))
+
+    assert main(["-", "--hostname", "google.co.jp"]) == 0
+
+    (line,) = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert line["record"]["registrant"]["organization"] == "グーグル合同会社"
+
+
+def test_invalid_arguments(capsys: pytest.CaptureFixture):
+    with pytest.raises(SystemExit):
+        main([str(FIXTURES / "foo.txt")])
+
+    with pytest.raises(SystemExit):
+        main([str(FIXTURES / "*.foo")])
+
+    with pytest.raises(SystemExit):
+        main([str(FIXTURES), "--fields", "foo"])
+
+
+def test_expand_sources():
+    assert expand_sources(["-", str(FIXTURES)]) == ["-", str(FIXTURES)]
+    assert expand_sources([str(FIXTURES / "google.*.txt")]) == sorted(
+        str(path) for path in FIXTURES.glob("google.*.txt")
+    )
+
+
+@pytest.mark.parametrize("module", ["whois_parser", "whois_parser.cli"])
+def test_run_module(module: str):
+    completed = subprocess.run(
+        [sys.executable, "-m", module, "-", "--quiet"],
+        input=b'{"raw_text": "Domain Name: example.com\\n"}\n{\n',
+        capture_output=True,
+        check=False,
+    )
+    assert completed.returncode == 1
+    results = [json.loads(line) for line in completed.stdout.splitlines()]
+    assert results[0]["record"]["domain"] == "example.com"
+    assert "JSONDecodeError" in results[1]["error"]
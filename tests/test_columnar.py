@@ -0,0 +1,134 @@
+import pathlib
+from datetime import datetime, timezone
+
+import pytest
+
+from tests.utils import read_fixture
+from whois_parser.columnar import (
+    NULL_TIMESTAMP,
+    DatetimeColumn,
+    RecordColumns,
+    to_timestamp,
+)
+from whois_parser.dataclasses import ParseResult
+from whois_parser.parser import WhoisParser
+
+FIXTURES = sorted(
+    path.name for path in (pathlib.Path(__file__).parent / "fixtures").glob("*.txt")
+)
+
+
+@pytest.fixture
+def items() -> list[tuple[str, str]]:
+    return [
+        (read_fixture(filename), filename.removesuffix(".txt")) for filename in FIXTURES
+    ]
+
+
+def test_parse_columns(items: list[tuple[str, str]]):
+    parser = WhoisParser(use_index=True)
+    columns = parser.parse_columns(items)
+    records = [
+        parser.parse(raw_text, hostname=hostname) for raw_text, hostname in items
+    ]
+
+    assert len(columns) == len(records)
+    assert columns["index"].to_list() == list(range(len(records)))
+    assert columns["raw_text"].to_list() == [record.raw_text for record in records]
+    assert columns["domain"].to_list() == [record.domain for record in records]
+    assert columns["name_servers"].to_list() == [
+        record.name_servers for record in records
+    ]
+    assert columns["registrant_organization"].to_list() == [
+        record.registrant.organization for record in records
+    ]
+    assert columns["abuse_email"].to_list() == [
+        record.abuse.email for record in records
+    ]
+    assert columns["is_rate_limited"].to_list() == [
+        record.is_rate_limited for record in records
+    ]
+
+    for field in ["expires_at", "registered_at", "updated_at"]:
+        for value, record in zip(columns[field].to_list(), records):
+            expected = getattr(record, field)
+            assert value == expected
+            if isinstance(expected, datetime):
+                # a naive datetime is kept naive
+                assert (value.tzinfo is None) is (expected.tzinfo is None)
+
+
+def test_parse_columns_with_fields(items: list[tuple[str, str]]):
+    columns = WhoisParser(use_index=True).parse_columns(items, fields=["domain"])
+    assert set(columns.columns) == {"index", "error", "domain"}
+
+
+def test_failed_results():
+    columns = RecordColumns()
+    columns.append(ParseResult(index=0, error="ValueError: foo"))
+    assert columns["error"].to_list() == ["ValueError: foo"]
+    assert columns["domain"].to_list() == [None]
+    assert columns["statuses"].to_list() == [[]]
+    assert columns["expires_at"].to_list() == [None]
+    assert columns["is_rate_limited"].to_list() == [False]
+
+
+def test_to_timestamp():
+    assert to_timestamp(datetime(1970, 1, 1, 0, 0, 1, tzinfo=timezone.utc)) == 1_000_000
+    # a naive datetime is regarded as UTC
+    assert to_timestamp(datetime(1970, 1, 1, 0, 0, 1)) == 1_000_000
+
+
+def test_datetime_column():
+    values = [
+        datetime(2021, 4, 1, 1, 5, 22),
+        datetime(2021, 4, 1, 1, 5, 22, tzinfo=timezone.utc),
+        "foo",
+        None,
+    ]
+    column = DatetimeColumn()
+    for value in values:
+        column.append(value)
+
+    assert column.to_list() == values
+    assert column[0].tzinfo is None
+    assert [column.naive[index] for index in range(len(values))] == [
+        True,
+        False,
+        False,
+        False,
+    ]
+
+
+def test_to_numpy(items: list[tuple[str, str]]):
+    np = pytest.importorskip("numpy")
+
+    columns = WhoisParser(use_index=True).parse_columns(items)
+    arrays = columns.to_numpy()
+
+    # google.com
+    index = FIXTURES.index("google.com.txt")
+    expires_at = columns["expires_at"][index]
+    assert arrays["expires_at"].dtype == np.dtype("datetime64[us]")
+    assert arrays["expires_at_naive"][index] == (expires_at.tzinfo is None)
+    assert arrays["expires_at"][index] == np.datetime64(
+        expires_at.replace(tzinfo=None), "us"
+    )
+
+    offsets, data, valid = (
+        arrays["domain.offsets"],
+        arrays["domain.data"],
+        arrays["domain.valid"],
+    )
+    assert valid[index]
+    assert bytes(data[offsets[index] : offsets[index + 1]]) == b"google.com"
+
+    name_servers = arrays["name_servers.offsets"]
+    assert name_servers[index + 1] - name_servers[index] == 4
+
+    # NaT for a missing date
+    be = FIXTURES.index("google.be.txt")
+    expires_at = columns["expires_at"]
+    assert isinstance(expires_at, DatetimeColumn)
+    assert expires_at.timestamps[be] == NULL_TIMESTAMP
+    assert np.isnat(arrays["expires_at"][be])
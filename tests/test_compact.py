@@ -0,0 +1,109 @@
+import dataclasses
+import pickle
+import weakref
+
+import pytest
+
+from tests.utils import read_fixture
+from whois_parser.compact import digest_raw_text
+from whois_parser.dataclasses import LazyWhoisRecord, Registrant
+from whois_parser.parser import WhoisParser
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_slots(compact: bool):
+    record = WhoisParser(compact=compact).parse("")
+    assert not hasattr(record, "__dict__")
+    assert not hasattr(record.registrant, "__dict__")
+    assert not hasattr(record.abuse, "__dict__")
+    # weak references are still supported
+    assert weakref.ref(record)() is record
+    assert weakref.ref(record.registrant)() is record.registrant
+
+    assert pickle.loads(pickle.dumps(record)) == record
+
+
+def test_lazy_record_with_slots():
+    record = WhoisParser(lazy=True).parse(
+        read_fixture("google.com.txt"), hostname="google.com"
+    )
+    assert isinstance(record, LazyWhoisRecord)
+    assert record.domain == "google.com"
+    assert pickle.loads(pickle.dumps(record)) == record
+
+
+def test_shared_contacts_are_read_only():
+    parser = WhoisParser(compact=True)
+    record = parser.parse("")
+    shared = record.registrant
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        shared.name = "foo"
+
+    assert parser.parse("").registrant.name is None
+    assert shared == Registrant()
+    assert repr(shared) == repr(Registrant())
+
+    # a shared contact is copied as a mutable one
+    contact = dataclasses.replace(shared, name="foo")
+    assert type(contact) is Registrant and contact.name == "foo"
+    assert type(pickle.loads(pickle.dumps(shared))) is Registrant
+
+    record.registrant = contact
+    assert parser.parse("").registrant is shared
+
+
+@pytest.mark.parametrize(
+    "raw_text_mode,expected",
+    [
+        ("keep", lambda raw_text: raw_text),
+        ("drop", lambda _: ""),
+        ("digest", digest_raw_text),
+    ],
+)
+def test_raw_text_mode(parser: WhoisParser, raw_text_mode: str, expected):
+    raw_text = read_fixture("google.com.txt")
+
+    record = WhoisParser(raw_text_mode=raw_text_mode).parse(
+        raw_text, hostname="google.com"
+    )
+    assert record.raw_text == expected(raw_text)
+
+    full = parser.parse(raw_text, hostname="google.com")
+    assert dataclasses.replace(full, raw_text=record.raw_text) == record
+
+
+def test_compact(parser: WhoisParser):
+    raw_text = read_fixture("google.co.jp.txt")
+    compact_parser = WhoisParser(compact=True)
+
+    record = compact_parser.parse(raw_text, hostname="google.co.jp")
+    assert record == parser.parse(raw_text, hostname="google.co.jp")
+
+    other = compact_parser.parse("", hostname="example.com")
+    assert record.abuse is other.abuse
+    assert other.registrant is compact_parser.parse("").registrant
+
+
+def test_compact_with_parse_many():
+    raw_text = read_fixture("google.com.txt")
+    compact_parser = WhoisParser(compact=True, raw_text_mode="digest")
+
+    results = list(
+        compact_parser.parse_many(
+            [(raw_text, "google.com"), ("", None), ("", None)], workers=2
+        )
+    )
+    records = [result.record for result in results]
+    assert records[0] is not None and records[1] is not None and records[2] is not None
+    assert records[0].raw_text == digest_raw_text(raw_text)
+    assert records[1].abuse is records[2].abuse
+    assert records[1].abuse is compact_parser.parse("").abuse
+
+
+def test_invalid_options():
+    with pytest.raises(ValueError):
+        WhoisParser(raw_text_mode="foo")
+
+    with pytest.raises(ValueError):
+        WhoisParser(lazy=True, compact=True)
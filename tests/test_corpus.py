@@ -0,0 +1,114 @@
+import gzip
+import io
+import json
+import pathlib
+import tarfile
+
+import pytest
+
+from tests.utils import read_fixture
+from whois_parser.corpus import (
+    hostname_from_filename,
+    iter_items,
+    iter_ndjson,
+    iter_stream,
+    iter_text_file,
+    parse_corpus,
+)
+
+FIXTURES = pathlib.Path(__file__).parent / "fixtures"
+HOSTNAMES = sorted(path.name.removesuffix(".txt") for path in FIXTURES.glob("*.txt"))
+
+
+@pytest.fixture
+def ndjson() -> bytes:
+    lines = [
+        json.dumps({"hostname": hostname, "raw_text": read_fixture(f"{hostname}.txt")})
+        for hostname in HOSTNAMES
+    ]
+    return ("\n".join(lines) + "\n").encode()
+
+
+def test_hostname_from_filename():
+    assert hostname_from_filename("dumps/google.co.jp.txt") == "google.co.jp"
+    assert hostname_from_filename("google.com.txt.gz") == "google.com"
+
+
+def test_iter_directory():
+    items = list(iter_items(FIXTURES))
+
+    assert [hostname for _, hostname in items] == HOSTNAMES
+    assert items[0][0] == read_fixture(f"{HOSTNAMES[0]}.txt")
+
+
+@pytest.mark.parametrize("filename", ["records.ndjson", "records.jsonl.gz"])
+def test_iter_ndjson(tmp_path: pathlib.Path, ndjson: bytes, filename: str):
+    path = tmp_path / filename
+    path.write_bytes(gzip.compress(ndjson) if filename.endswith(".gz") else ndjson)
+
+    items = list(iter_items(path))
+    assert [hostname for _, hostname in items] == HOSTNAMES
+
+
+def test_iter_ndjson_stream(ndjson: bytes):
+    items = list(iter_ndjson(io.BytesIO(ndjson), hostname_field=None))
+    assert [hostname for _, hostname in items] == [None] * len(HOSTNAMES)
+
+
+def test_invalid_ndjson_lines(ndjson: bytes):
+    data = b'{"raw_text": "foo"}\n{\n[]\n{"hostname": "example.com"}\n' + ndjson
+
+    with pytest.raises(ValueError, match="<stream>:2: JSONDecodeError"):
+        list(iter_ndjson(io.BytesIO(data)))
+
+    errors: list[str] = []
+    items = list(iter_ndjson(io.BytesIO(data), on_error=errors.append))
+    assert [hostname for _, hostname in items] == [None, *HOSTNAMES]
+    assert [error.split(":")[1] for error in errors] == ["2", "3", "4"]
+    assert errors[2].endswith("raw_text should be a string")
+
+
+def test_iter_text_file_in_legacy_charset(tmp_path: pathlib.Path):
+    raw_text = read_fixture("google.co.jp.txt")
+    path = tmp_path / "google.co.jp.txt"
+    path.write_bytes(raw_text.encode("euc_jp"))
+
+    assert list(iter_text_file(path)) == [(raw_text, "google.co.jp")]
+
+
+@pytest.mark.parametrize("is_gzipped", [False, True])
+def test_iter_stream(ndjson: bytes, is_gzipped: bool):
+    def compress(data: bytes) -> bytes:
+        return gzip.compress(data) if is_gzipped else data
+
+    items = list(iter_stream(io.BytesIO(compress(ndjson))))
+    assert [hostname for _, hostname in items] == HOSTNAMES
+
+    raw_text = read_fixture("google.com.txt")
+    items = list(
+        iter_stream(io.BytesIO(compress(raw_text.encode())), hostname="google.com")
+    )
+    assert items == [(raw_text, "google.com")]
+
+    with pytest.raises(ValueError):
+        list(iter_stream(io.BytesIO(ndjson), input_format="foo"))
+
+
+def test_iter_tar(tmp_path: pathlib.Path, ndjson: bytes):
+    path = tmp_path / "records.tar.gz"
+    with tarfile.open(path, "w:gz") as tar:
+        tar.add(FIXTURES / "google.com.txt", arcname="dumps/google.com.txt")
+
+        info = tarfile.TarInfo("records.ndjson")
+        info.size = len(ndjson)
+        tar.addfile(info, io.BytesIO(ndjson))
+
+    items = list(iter_items(path))
+    assert [hostname for _, hostname in items] == ["google.com", *HOSTNAMES]
+
+
+def test_parse_corpus():
+    records = list(parse_corpus(FIXTURES / "google.co.jp.txt"))
+
+    assert len(records) == 1
+    assert records[0].domain == "google.co.jp"
@@ -0,0 +1,40 @@
+import pytest
+
+from tests.utils import read_fixture
+from whois_parser.decoding import decode_raw_text
+from whois_parser.parser import WhoisParser
+
+TEXT = "[登録者名]                      グーグル合同会社\n"
+
+
+@pytest.mark.parametrize("charset", ["utf-8", "utf-8-sig", "euc_jp", "cp932"])
+def test_decode_jp(charset: str):
+    assert decode_raw_text(TEXT.encode(charset), tld="jp") == TEXT
+
+
+def test_decode_iso_2022_jp():
+    # the escape sequences are valid UTF-8
+    assert decode_raw_text(TEXT.encode("iso2022_jp")) == TEXT
+
+
+def test_decode_fallback():
+    text = "Registrant Name: Société Générale\n"
+    assert decode_raw_text(text.encode("latin-1")) == text
+    # cp1252 undefined bytes are decoded by Latin-1
+    assert decode_raw_text(b"\x81\x8d") == "\x81\x8d"
+
+
+def test_decode_buffers():
+    data = TEXT.encode("utf-8")
+    assert decode_raw_text(bytearray(data)) == TEXT
+    assert decode_raw_text(memoryview(data)) == TEXT
+    assert decode_raw_text(TEXT) is TEXT
+
+
+@pytest.mark.parametrize("charset", ["utf-8", "euc_jp", "cp932", "iso2022_jp"])
+def test_parse_bytes(parser: WhoisParser, charset: str):
+    raw_text = read_fixture("google.co.jp.txt")
+
+    record = parser.parse(raw_text.encode(charset), hostname="google.co.jp")
+    assert record == parser.parse(raw_text, hostname="google.co.jp")
+    assert record.registrant.organization == "グーグル合同会社"
@@ -0,0 +1,138 @@
+from typing import Optional
+
+import pytest
+
+from tests.utils import read_fixture
+from whois_parser.dispatch import Dispatcher, SuffixTrie, split_last_section
+from whois_parser.parser import PARSERS_MAP, WhoisParser
+from whois_parser.parsers import BaseParser, BeParser, JpParser, UkParser
+from whois_parser.parsers.registry import ParserRegistry
+
+
+@pytest.mark.parametrize(
+    "hostname,expected",
+    [
+        ("google.co.jp", ("co.jp", "co.jp")),
+        ("example.jp", ("jp", "jp")),
+        ("WWW.GOOGLE.CO.JP.", ("co.jp", "co.jp")),
+        ("jp", ("jp", "jp")),
+        ("example.com", None),
+        ("co.uk", None),
+    ],
+)
+def test_suffix_trie(hostname: str, expected: Optional[tuple[str, str]]):
+    trie = SuffixTrie({"jp": "jp", "co.jp": "co.jp"})
+    assert trie.longest_match(hostname) == expected
+
+
+@pytest.mark.parametrize(
+    "raw_text,expected",
+    [
+        ("foo\n", (None, "foo\n")),
+        ("# whois.example\n  foo\n", ("# whois.example", "  foo\n")),
+        ("# a\nfoo\n# whois.example\nbar\n", ("# whois.example", "bar\n")),
+        ("foo\n# whois.example", ("# whois.example", "")),
+    ],
+)
+def test_split_last_section(raw_text: str, expected: tuple[Optional[str], str]):
+    assert split_last_section(raw_text) == expected
+
+
+def test_dispatch_by_longest_suffix():
+    dispatcher = Dispatcher({"jp": BaseParser, "co.jp": JpParser})
+    assert dispatcher.get_parser("google.co.jp") is JpParser
+    assert dispatcher.get_parser("example.jp") is BaseParser
+    assert dispatcher.get_parser("example.com") is BaseParser
+
+
+@pytest.mark.parametrize(
+    "filename,expected",
+    [
+        ("google.co.jp.txt", JpParser),
+        ("google.uk.txt", UkParser),
+        ("google.be.txt", BeParser),
+        ("google.com.txt", BaseParser),
+        ("google.kr.txt", BaseParser),
+    ],
+)
+def test_detect(filename: str, expected: type[BaseParser]):
+    dispatcher = Dispatcher(PARSERS_MAP)
+    assert dispatcher.get_parser(None, read_fixture(filename)) is expected
+
+
+def test_detect_loads_only_detected_parser():
+    registry = ParserRegistry(
+        {
+            "jp": "whois_parser.parsers.jp:JpParser",
+            "uk": "whois_parser.parsers.uk:UkParser",
+            "be": "whois_parser.parsers.be:BeParser",
+        },
+        fingerprint_markers={"jp": ["[Domain Name]"], "uk": ["Domain name:\n"]},
+    )
+    dispatcher = Dispatcher(registry)
+    assert dispatcher.detect(read_fixture("google.uk.txt")) is UkParser
+    assert registry.is_loaded("uk") is True
+    assert registry.is_loaded("jp") is False
+    # a parser without given markers is loaded to get them
+    assert registry.is_loaded("be") is True
+
+
+@pytest.mark.parametrize("suffix", list(PARSERS_MAP))
+def test_fingerprint_markers_of_parsers_map(suffix: str):
+    markers = PARSERS_MAP.get_fingerprint_markers(suffix)
+    assert markers == PARSERS_MAP[suffix].FINGERPRINT_MARKERS
+
+
+def test_detect_caches_positive_results():
+    dispatcher = Dispatcher(PARSERS_MAP)
+    assert dispatcher.detect("# whois.jprs.jp\nNo match!!\n") is BaseParser
+    assert dispatcher.detect(read_fixture("google.co.jp.txt")) is JpParser
+    # the server is known to be the one of JpParser
+    assert dispatcher.detect("# whois.jprs.jp\n[Domain]\n") is JpParser
+    assert dispatcher.detect("# whois.example\n[Domain]\n") is BaseParser
+
+
+@pytest.mark.parametrize("parsers_map", [{}, ParserRegistry()])
+def test_dispatch_follows_changes_of_map(parsers_map: dict):
+    dispatcher = Dispatcher(parsers_map)
+    raw_text = read_fixture("google.co.jp.txt")
+    assert dispatcher.get_parser("google.co.jp") is BaseParser
+    assert dispatcher.detect(raw_text) is BaseParser
+
+    parsers_map["co.jp"] = JpParser
+    assert dispatcher.get_parser("google.co.jp") is JpParser
+    assert dispatcher.detect(raw_text) is JpParser
+
+    del parsers_map["co.jp"]
+    assert dispatcher.get_parser("google.co.jp") is BaseParser
+    # a cached parser is dropped as well
+    assert dispatcher.detect(raw_text) is BaseParser
+
+
+def test_parsers_map_of_parser():
+    parser = WhoisParser({})
+    raw_text = read_fixture("google.co.jp.txt")
+    assert parser.parse(raw_text, hostname="google.co.jp").domain is None
+
+    parser.parsers_map = {"jp": JpParser}
+    assert parser.dispatcher.parsers_map is parser.parsers_map
+    assert parser.parse(raw_text, hostname="google.co.jp").domain == "google.co.jp"
+
+
+def test_detected_parsers_are_bounded():
+    dispatcher = Dispatcher(PARSERS_MAP, max_detected=2)
+    for server in ["a", "b", "c"]:
+        assert dispatcher.detect(f"# whois.{server}\n[Domain Name]\n") is JpParser
+
+    assert list(dispatcher._detected) == ["# whois.b", "# whois.c"]
+
+    with pytest.raises(ValueError):
+        Dispatcher(PARSERS_MAP, max_detected=0)
+
+
+def test_parse_without_hostname(parser: WhoisParser):
+    raw_text = read_fixture("google.co.jp.txt")
+
+    result = parser.parse(raw_text)
+    assert result == parser.parse(raw_text, hostname="google.co.jp")
+    assert result.domain == "google.co.jp"
@@ -0,0 +1,59 @@
+import pickle
+
+from tests.utils import read_fixture
+from whois_parser.hooks import CallbackHook, CostTable, FieldEvent, KeywordEvent
+from whois_parser.parser import WhoisParser
+
+
+def test_callback_hook(parser: WhoisParser):
+    raw_text = read_fixture("google.co.jp.txt")
+    field_events: list[FieldEvent] = []
+    keyword_events: list[KeywordEvent] = []
+    hook = CallbackHook(on_field=field_events.append, on_keyword=keyword_events.append)
+
+    record = WhoisParser(hooks=[hook]).parse(raw_text, hostname="google.co.jp")
+    assert record == parser.parse(raw_text, hostname="google.co.jp")
+
+    assert len(field_events) == 12
+    events = {event.field: event for event in field_events}
+    assert events["registered_at"].found
+    assert events["registered_at"].tld == "jp"
+    assert events["registered_at"].parser == "JpParser"
+    assert not events["expires_at"].found
+
+    matched = [event for event in keyword_events if event.matched]
+    assert ("registered_at", "[登録年月日]") in {(e.field, e.keyword) for e in matched}
+
+
+def test_callback_hook_with_projection():
+    field_events: list[FieldEvent] = []
+    hook = CallbackHook(on_field=field_events.append)
+
+    WhoisParser(hooks=[hook]).parse("Domain Name: example.com\n", fields=["domain"])
+    assert [event.field for event in field_events] == ["domain"]
+
+
+def test_cost_table():
+    table = CostTable()
+    parser = WhoisParser(hooks=[table])
+    parser.parse(read_fixture("google.com.txt"), hostname="google.com")
+    parser.parse(read_fixture("google.co.jp.txt"), hostname="google.co.jp")
+    parser.parse(read_fixture("google.uk.txt"), hostname="google.uk")
+
+    rows = table.rows()
+    assert {row["tld"] for row in rows} == {"com", "jp", "uk"}
+    assert len(rows) == 12 * 3
+    assert all(row["calls"] == 1 for row in rows)
+    assert rows[0]["total"] >= rows[-1]["total"]
+
+    keyword_rows = table.keyword_rows()
+    assert any(
+        row["tld"] == "uk" and row["field"] == "registrar" for row in keyword_rows
+    )
+    assert "registered_at" in table.format()
+
+    loaded = pickle.loads(pickle.dumps(table))
+    assert loaded.rows() == rows
+
+    table.reset()
+    assert table.rows() == []
@@ -0,0 +1,154 @@
+import pathlib
+from datetime import datetime
+
+import pytest
+
+from tests.utils import read_fixture
+from whois_parser.incremental import (
+    FieldChange,
+    Snapshot,
+    diff_lines,
+    get_affected_text,
+)
+from whois_parser.parser import WhoisParser
+from whois_parser.parsers import UkParser
+from whois_parser.parsers.abstract import FIELD_FINDERS
+
+FIXTURES = sorted(
+    path.name for path in (pathlib.Path(__file__).parent / "fixtures").glob("*.txt")
+)
+
+
+def test_diff_lines():
+    assert diff_lines(["a", "b", "c"], ["a", "b", "c"]) == ([], [])
+    assert diff_lines(["a", "b", "c"], ["a", "x", "c"]) == ([1], [1])
+    assert diff_lines(["a", "c"], ["a", "b", "c"]) == ([], [1])
+    assert diff_lines(["a", "b", "c"], ["a", "c"]) == ([1], [])
+
+
+def test_get_affected_text():
+    lines = ["a", "b", "", "c", "d", "e"]
+    # from the second non-blank line before to the first non-blank line after
+    assert get_affected_text(lines, [4]) == "b\n\nc\nd\ne"
+    assert get_affected_text(lines, [2]) == "a\nb\n\nc"
+    assert get_affected_text(lines, [0]) == "a\nb"
+    assert get_affected_text(lines, []) == ""
+
+
+def test_unchanged(parser: WhoisParser):
+    raw_text = read_fixture("google.com.txt")
+    snapshot = parser.snapshot(raw_text)
+
+    result = parser.reparse(snapshot, raw_text)
+    assert result.changes == []
+    assert result.evaluated == ["is_rate_limited"]
+    assert result.record == snapshot.record
+    assert result.record == parser.parse(raw_text)
+
+
+def test_changed_line(parser: WhoisParser):
+    raw_text = read_fixture("google.com.txt")
+    snapshot = parser.snapshot(raw_text)
+
+    new_raw_text = raw_text.replace(
+        "Registrar Registration Expiration Date: 2028-09-13T00:00:00-0700",
+        "Registrar Registration Expiration Date: 2029-09-13T00:00:00-0700",
+    ).replace("2021-05-30T02:45:43-0700", "2021-05-31T02:45:43-0700")
+    result = parser.reparse(snapshot, new_raw_text)
+
+    assert result.record == parser.parse(new_raw_text)
+    assert [change.field for change in result.changes] == ["expires_at"]
+    change = result.changes[0]
+    assert isinstance(change, FieldChange)
+    assert change.old == snapshot.record.expires_at
+    assert isinstance(change.new, datetime)
+    assert change.new.year == 2029
+
+    assert "expires_at" in result.evaluated
+    assert "name_servers" not in result.evaluated
+    assert "registrant" not in result.evaluated
+
+
+def test_new_keyword(parser: WhoisParser):
+    snapshot = parser.snapshot("Domain Name: example.com\n")
+    assert snapshot.record.registrar is None
+
+    result = parser.reparse(
+        snapshot, "Domain Name: example.com\nRegistrar: Example Registrar\n"
+    )
+    assert result.changes == [FieldChange("registrar", None, "Example Registrar")]
+
+
+@pytest.mark.parametrize(
+    "template",
+    [
+        # a value can be on a line after a key and a delimiter
+        "Domain Name: example.com\nRegistrar: \n\n{}\n",
+        "Domain Name: example.com\nRegistrar\n\n: {}\n",
+    ],
+)
+def test_value_after_blank_line(parser: WhoisParser, template: str):
+    snapshot = parser.snapshot(template.format("foo"))
+    assert snapshot.record.registrar == "foo"
+
+    result = parser.reparse(snapshot, template.format("bar"))
+    assert result.record == parser.parse(template.format("bar"))
+    assert result.changes == [FieldChange("registrar", "foo", "bar")]
+
+
+def test_expression_is_always_evaluated(parser: WhoisParser):
+    raw_text = read_fixture("google.uk.txt")
+    snapshot = parser.snapshot(raw_text, hostname="google.uk")
+    assert snapshot.parser is UkParser
+    assert snapshot.traces is not None
+    assert snapshot.traces["registrar"].is_opaque
+
+    result = parser.reparse(snapshot, raw_text + "\n", hostname="google.uk")
+    assert "registrar" in result.evaluated
+    assert result.changes == []
+
+
+def test_previous_record(parser: WhoisParser):
+    raw_text = read_fixture("google.com.txt")
+    record = parser.parse("Domain Name: example.com\n")
+
+    result = parser.reparse(record, raw_text)
+    assert result.evaluated == list(FIELD_FINDERS)
+    assert result.record == parser.parse(raw_text)
+    assert "domain" in [change.field for change in result.changes]
+
+
+def test_rate_limited(parser: WhoisParser):
+    snapshot = parser.snapshot(read_fixture("google.com.txt"))
+
+    result = parser.reparse(snapshot, "WHOIS LIMIT EXCEEDED\n")
+    assert result.record.is_rate_limited
+    assert FieldChange("is_rate_limited", False, True) in result.changes
+    assert isinstance(result.snapshot, Snapshot)
+    assert result.snapshot.traces is None
+
+    # the next version is fully parsed
+    result = parser.reparse(result.snapshot, read_fixture("google.com.txt"))
+    assert result.evaluated == list(FIELD_FINDERS)
+    assert not result.record.is_rate_limited
+
+
+@pytest.mark.parametrize("filename", FIXTURES)
+def test_same_as_full_parse(filename: str):
+    parser = WhoisParser(engine="regex")
+    raw_text = read_fixture(filename)
+    snapshot = parser.snapshot(raw_text)
+    lines = raw_text.split("\n")
+
+    # remove, indent and blank each line
+    for index in range(len(lines)):
+        for line in ("", "  " + lines[index]):
+            new_raw_text = "\n".join(lines[:index] + [line] + lines[index + 1 :])
+            assert parser.reparse(snapshot, new_raw_text).record == parser.parse(
+                new_raw_text
+            )
+
+        new_raw_text = "\n".join(lines[:index] + lines[index + 1 :])
+        assert parser.reparse(snapshot, new_raw_text).record == parser.parse(
+            new_raw_text
+        )
@@ -0,0 +1,40 @@
+import dataclasses
+import pickle
+
+from pytest_mock import MockerFixture
+
+from tests.utils import read_fixture
+from whois_parser.dataclasses import LazyWhoisRecord, WhoisRecord
+from whois_parser.parser import WhoisParser
+from whois_parser.parsers import BaseParser
+
+
+def test_lazy_record(parser: WhoisParser, mocker: MockerFixture):
+    raw_text = read_fixture("google.com.txt")
+    spy = mocker.spy(BaseParser, "_find_registrant")
+
+    record = WhoisParser(lazy=True).parse(raw_text, hostname="google.com")
+    assert isinstance(record, LazyWhoisRecord)
+    assert record.domain == "google.com"
+    assert spy.call_count == 0
+
+    assert record.registrant.organization == "Google LLC"
+    assert record.registrant.organization == "Google LLC"
+    assert spy.call_count == 1
+
+
+def test_lazy_record_compatibility(parser: WhoisParser):
+    raw_text = read_fixture("google.co.jp.txt")
+
+    expected = parser.parse(raw_text, hostname="google.co.jp")
+    record = WhoisParser(lazy=True).parse(raw_text, hostname="google.co.jp")
+    assert isinstance(record, LazyWhoisRecord)
+
+    assert record == expected
+    assert expected == record
+    assert dataclasses.asdict(record) == dataclasses.asdict(expected)
+    assert repr(record.evaluate()) == repr(expected)
+
+    loaded = pickle.loads(pickle.dumps(record))
+    assert type(loaded) is WhoisRecord
+    assert loaded == expected
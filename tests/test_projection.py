@@ -0,0 +1,57 @@
+import pytest
+from pytest_mock import MockerFixture
+
+from tests.utils import read_fixture
+from whois_parser.dataclasses import Registrant
+from whois_parser.parser import WhoisParser
+from whois_parser.parsers import BaseParser
+
+
+@pytest.mark.parametrize(
+    "filename,hostname",
+    [
+        ("google.com.txt", "google.com"),
+        ("google.co.jp.txt", "google.co.jp"),
+    ],
+)
+def test_projection(parser: WhoisParser, filename: str, hostname: str):
+    raw_text = read_fixture(filename)
+    expected = parser.parse(raw_text, hostname=hostname)
+
+    record = parser.parse(
+        raw_text, hostname=hostname, fields=["domain", "expires_at", "name_servers"]
+    )
+    assert record.raw_text == raw_text
+    assert record.domain == expected.domain
+    assert record.expires_at == expected.expires_at
+    assert record.name_servers == expected.name_servers
+
+    assert record.registrar is None
+    assert record.registered_at is None
+    assert record.statuses == []
+    assert record.registrant == Registrant()
+
+
+def test_projection_skips_finders(parser: WhoisParser, mocker: MockerFixture):
+    raw_text = read_fixture("google.com.txt")
+    spy = mocker.spy(BaseParser, "_find_registrant")
+
+    parser.parse(raw_text, hostname="google.com", fields=["domain"])
+    assert spy.call_count == 0
+
+    WhoisParser(lazy=True).parse(raw_text, hostname="google.com", fields=["domain"])
+    assert spy.call_count == 0
+
+
+def test_projection_with_parse_many(parser: WhoisParser):
+    raw_text = read_fixture("google.com.txt")
+
+    results = list(parser.parse_many([(raw_text, "google.com")], fields=["domain"]))
+    assert results[0].record is not None
+    assert results[0].record.domain == "google.com"
+    assert results[0].record.registrar is None
+
+
+def test_unknown_field(parser: WhoisParser):
+    with pytest.raises(ValueError):
+        parser.parse("", fields=["foo"])
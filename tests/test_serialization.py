@@ -0,0 +1,108 @@
+import io
+import pathlib
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Union
+
+import pytest
+
+from tests.utils import read_fixture
+from whois_parser import serialization
+from whois_parser.dataclasses import (
+    Registrant,
+    WhoisRecord,
+    decode_datetime,
+    encode_datetime,
+)
+from whois_parser.parser import WhoisParser
+
+FIXTURES = sorted(
+    path.name for path in (pathlib.Path(__file__).parent / "fixtures").glob("*.txt")
+)
+DATETIME_FIELDS = ("expires_at", "registered_at", "updated_at")
+
+
+@pytest.fixture
+def records() -> list[WhoisRecord]:
+    parser = WhoisParser(use_index=True)
+    return [
+        parser.parse(read_fixture(filename), hostname=filename.removesuffix(".txt"))
+        for filename in FIXTURES
+    ]
+
+
+def assert_identical(record: WhoisRecord, other: WhoisRecord):
+    assert record == other
+    for field in DATETIME_FIELDS:
+        # equality of datetimes ignores timezones
+        assert repr(getattr(record, field)) == repr(getattr(other, field))
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        None,
+        "2007. 03. 02",
+        datetime(2021, 4, 1, 1, 5, 22),
+        datetime(2021, 4, 1, 1, 5, 22, 123, tzinfo=timezone.utc),
+        datetime(2021, 4, 1, 1, 5, 22, tzinfo=timezone(timedelta(hours=9), "JST")),
+        datetime(2021, 4, 1, 1, 5, 22, tzinfo=timezone(timedelta(0), "Z")),
+        datetime(2021, 4, 1, tzinfo=timezone(timedelta(hours=-7))),
+    ],
+)
+def test_encode_datetime(value: Optional[Union[datetime, str]]):
+    decoded = decode_datetime(encode_datetime(value))
+    assert decoded == value
+    assert repr(decoded) == repr(value)
+
+
+def test_encode_datetime_tags_types():
+    assert encode_datetime("2021-04-01") == {"type": "string", "value": "2021-04-01"}
+    assert encode_datetime(datetime(2021, 4, 1)) == {
+        "type": "datetime",
+        "value": "2021-04-01T00:00:00",
+    }
+
+    with pytest.raises(ValueError):
+        decode_datetime({"type": "unknown", "value": ""})
+
+
+def test_to_dict(records: list[WhoisRecord]):
+    for record in records:
+        assert_identical(WhoisRecord.from_dict(record.to_dict()), record)
+
+
+def test_from_dict_with_missing_fields():
+    record = WhoisRecord.from_dict({"domain": "example.com"})
+    assert record.domain == "example.com"
+    assert record.registrant == Registrant()
+    assert record.raw_text == ""
+
+
+def test_lazy_record():
+    raw_text = read_fixture("google.co.jp.txt")
+    lazy = WhoisParser(lazy=True).parse(raw_text, hostname="google.co.jp")
+    record = WhoisParser().parse(raw_text, hostname="google.co.jp")
+    assert lazy.to_dict() == record.to_dict()
+
+
+def test_json(records: list[WhoisRecord]):
+    for record in records:
+        assert_identical(serialization.loads(serialization.dumps(record)), record)
+
+    fp = io.StringIO()
+    assert serialization.dump_json(records, fp) == len(records)
+    fp.seek(0)
+    for loaded, record in zip(serialization.load_json(fp), records):
+        assert_identical(loaded, record)
+
+
+def test_ndjson(records: list[WhoisRecord]):
+    fp = io.StringIO()
+    assert serialization.dump_ndjson(records, fp) == len(records)
+    assert fp.getvalue().count("\n") == len(records)
+
+    fp.seek(0)
+    loaded = list(serialization.iter_ndjson(fp))
+    assert len(loaded) == len(records)
+    for record, other in zip(loaded, records):
+        assert_identical(record, other)
@@ -0,0 +1,322 @@
+import asyncio
+import json
+import pathlib
+from typing import Any
+
+import pytest
+
+from tests.utils import read_fixture
+from whois_parser import server as server_module
+from whois_parser.dataclasses import WhoisRecord
+from whois_parser.parser import WhoisParser
+from whois_parser.server import WhoisServer, is_loopback, is_loopback_host_header
+
+
+async def request_lines(path: pathlib.Path, lines: list[Any]) -> list[Any]:
+    reader, writer = await asyncio.open_unix_connection(str(path))
+    # requests are pipelined
+    for line in lines:
+        data = line if isinstance(line, bytes) else json.dumps(line).encode()
+        writer.write(data + b"\n")
+
+    await writer.drain()
+    writer.write_eof()
+
+    responses = [json.loads(line) async for line in reader]
+    writer.close()
+    await writer.wait_closed()
+    return responses
+
+
+async def read_http_response(
+    reader: asyncio.StreamReader,
+) -> tuple[str, dict[str, str], str]:
+    status_line = (await reader.readline()).decode()
+    headers: dict[str, str] = {}
+    while True:
+        line = (await reader.readline()).decode().strip()
+        if line == "":
+            break
+
+        name, _, value = line.partition(":")
+        headers[name.lower()] = value.strip()
+
+    body = await reader.readexactly(int(headers["content-length"]))
+    return status_line.split(" ", 1)[1].strip(), headers, body.decode()
+
+
+async def request_http(port: int, request: bytes) -> tuple[str, dict[str, str], str]:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(request)
+    await writer.drain()
+
+    response = await read_http_response(reader)
+    writer.close()
+    await writer.wait_closed()
+    return response
+
+
+@pytest.mark.asyncio
+async def test_unix_socket(parser: WhoisParser, tmp_path: pathlib.Path):
+    path = tmp_path / "whois.sock"
+    items = [
+        (read_fixture("google.com.txt"), "google.com"),
+        (read_fixture("google.co.jp.txt"), "google.co.jp"),
+        (read_fixture("google.uk.txt"), "google.uk"),
+    ]
+
+    async with parser.create_server(kind="thread", concurrency=2) as server:
+        await server.start_unix(str(path))
+
+        responses = await request_lines(
+            path,
+            [
+                {"id": index, "raw_text": raw_text, "hostname": hostname}
+                for index, (raw_text, hostname) in enumerate(items)
+            ]
+            + [
+                {"id": "fields", "raw_text": items[0][0], "fields": ["domain"]},
+                {"id": "health", "method": "health"},
+            ],
+        )
+
+        # responses are in order of requests
+        assert [response["id"] for response in responses] == [
+            0,
+            1,
+            2,
+            "fields",
+            "health",
+        ]
+        for (raw_text, hostname), response in zip(items, responses):
+            record = WhoisRecord.from_dict(response["record"])
+            assert record == parser.parse(raw_text, hostname=hostname)
+
+        assert responses[3]["record"]["domain"] == "google.com"
+        assert responses[3]["record"]["registrar"] is None
+        assert responses[4] == {"id": "health", "status": "ok"}
+
+        stats = server.get_stats()
+        assert stats["records"] == 4
+        assert stats["requests"] == 5
+        assert stats["in_flight"] == 0
+
+    assert not path.exists()
+
+
+@pytest.mark.asyncio
+async def test_batch_and_errors(tmp_path: pathlib.Path):
+    path = tmp_path / "whois.sock"
+    parser = WhoisParser(raw_text_mode="drop")
+
+    async with WhoisServer(parser, kind="thread") as server:
+        await server.start_unix(str(path))
+
+        responses = await request_lines(
+            path,
+            [
+                [
+                    {"id": 1, "raw_text": "Domain Name: example.com\n"},
+                    {"id": 2, "raw_text": 1},
+                ],
+                b"{",
+                {"id": 3, "raw_text": "", "fields": ["foo"]},
+                {"id": 4, "method": "foo"},
+            ],
+        )
+        # a stats request reflects the requests which are handled
+        (stats,) = await request_lines(path, [{"id": 5, "method": "stats"}])
+
+    batch, invalid_json, invalid_fields, unknown_method = responses
+    assert batch[0] == {
+        "id": 1,
+        "record": {**batch[0]["record"], "domain": "example.com", "raw_text": ""},
+    }
+    assert batch[1] == {"id": 2, "error": "raw_text should be a string"}
+    assert invalid_json["id"] is None
+    assert invalid_json["error"].startswith("JSONDecodeError")
+    assert invalid_fields["id"] == 3 and "foo" in invalid_fields["error"]
+    assert unknown_method == {"id": 4, "error": "Unknown method: foo"}
+    assert stats["stats"]["records"] == 1
+    assert stats["stats"]["errors"] == 4
+
+
+@pytest.mark.asyncio
+async def test_executor_errors(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch):
+    def parse_in_worker(*args: Any) -> tuple[bool, str]:
+        raise RuntimeError("broken")
+
+    monkeypatch.setattr(server_module, "parse_in_worker", parse_in_worker)
+    path = tmp_path / "whois.sock"
+
+    async with WhoisServer(WhoisParser(), kind="thread", concurrency=1) as server:
+        await server.start_unix(str(path))
+
+        # the connection doesn't hang even if requests are more than the concurrency
+        responses = await asyncio.wait_for(
+            request_lines(path, [{"id": index, "raw_text": ""} for index in range(4)]),
+            timeout=10,
+        )
+
+    assert responses == [
+        {"id": index, "error": "RuntimeError: broken"} for index in range(4)
+    ]
+    assert server.stats.errors == 4
+
+
+@pytest.mark.asyncio
+async def test_line_too_long(tmp_path: pathlib.Path):
+    path = tmp_path / "whois.sock"
+
+    async with WhoisServer(WhoisParser(), kind="thread", max_line_size=64) as server:
+        await server.start_unix(str(path))
+
+        responses = await request_lines(path, [{"raw_text": "x" * 128}])
+        assert responses == [{"id": None, "error": "The line is too long"}]
+
+
+@pytest.mark.asyncio
+async def test_http(parser: WhoisParser):
+    raw_text = read_fixture("google.com.txt")
+
+    async with WhoisServer(parser, kind="process", workers=1) as server:
+        http_server = await server.start_http()
+        port = http_server.sockets[0].getsockname()[1]
+
+        body = "".join(
+            json.dumps({"id": index, "raw_text": raw_text}) + "\n" for index in range(3)
+        ).encode()
+        status, headers, text = await request_http(
+            port,
+            b"POST /parse HTTP/1.1\r\nContent-Length: %d\r\n\r\n" % len(body) + body,
+        )
+        assert status == "200 OK"
+        assert headers["content-type"].startswith("application/x-ndjson")
+        responses = [json.loads(line) for line in text.splitlines()]
+        assert [response["id"] for response in responses] == [0, 1, 2]
+        assert WhoisRecord.from_dict(responses[0]["record"]) == parser.parse(raw_text)
+
+        status, _, text = await request_http(port, b"GET /health HTTP/1.1\r\n\r\n")
+        assert status == "200 OK"
+        assert json.loads(text) == {"status": "ok"}
+
+        status, _, text = await request_http(port, b"GET /stats HTTP/1.1\r\n\r\n")
+        assert json.loads(text)["records"] == 3
+
+        status, _, _ = await request_http(port, b"GET /foo HTTP/1.1\r\n\r\n")
+        assert status == "404 Not Found"
+
+        status, _, _ = await request_http(port, b"GET /parse HTTP/1.1\r\n\r\n")
+        assert status == "405 Method Not Allowed"
+
+        status, _, _ = await request_http(port, b"POST /parse HTTP/1.1\r\n\r\n")
+        assert status == "411 Length Required"
+
+
+@pytest.mark.asyncio
+async def test_http_keep_alive(parser: WhoisParser):
+    async with WhoisServer(parser, kind="thread") as server:
+        http_server = await server.start_http()
+        port = http_server.sockets[0].getsockname()[1]
+
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        # bodies of errors are consumed not to be read as the next requests
+        writer.write(
+            b"POST /foo HTTP/1.1\r\nContent-Length: 15\r\n\r\nGET /foo HTTP/1.1"
+            b"GET /parse HTTP/1.1\r\nContent-Length: 2\r\n\r\n{}"
+            b"GET /health HTTP/1.1\r\n\r\n"
+        )
+        await writer.drain()
+
+        statuses = [(await read_http_response(reader))[0] for _ in range(3)]
+        assert statuses == ["404 Not Found", "405 Method Not Allowed", "200 OK"]
+
+        writer.close()
+        await writer.wait_closed()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "request_head,expected",
+    [
+        (b"POST /parse HTTP/1.1\r\nContent-Length: foo\r\n", "400 Bad Request"),
+        (b"POST /parse HTTP/1.1\r\nContent-Length: -1\r\n", "400 Bad Request"),
+        (
+            b"POST /parse HTTP/1.1\r\nTransfer-Encoding: chunked\r\n",
+            "411 Length Required",
+        ),
+        (
+            b"POST /parse HTTP/1.1\r\nContent-Length: 1000000000\r\n",
+            "413 Payload Too Large",
+        ),
+    ],
+)
+async def test_http_invalid_body(
+    parser: WhoisParser, request_head: bytes, expected: str
+):
+    async with WhoisServer(parser, kind="thread") as server:
+        http_server = await server.start_http()
+        port = http_server.sockets[0].getsockname()[1]
+
+        status, headers, _ = await request_http(port, request_head + b"\r\n")
+        assert status == expected
+        # the connection is closed since the next request can't be found
+        assert headers["connection"] == "close"
+
+
+@pytest.mark.asyncio
+async def test_http_host(parser: WhoisParser):
+    async with WhoisServer(parser, kind="thread") as server:
+        http_server = await server.start_http()
+        port = http_server.sockets[0].getsockname()[1]
+
+        status, _, _ = await request_http(
+            port, b"GET /health HTTP/1.1\r\nHost: localhost:%d\r\n\r\n" % port
+        )
+        assert status == "200 OK"
+
+        # e.g. DNS rebinding
+        status, headers, _ = await request_http(
+            port, b"GET /health HTTP/1.1\r\nHost: evil.example:%d\r\n\r\n" % port
+        )
+        assert status == "403 Forbidden"
+        assert headers["connection"] == "close"
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("127.0.0.1:8080", True),
+        ("[::1]:8080", True),
+        ("localhost", True),
+        ("LOCALHOST.", True),
+        ("evil.example", False),
+        ("evil.example:8080", False),
+        ("[::2]:8080", False),
+    ],
+)
+def test_is_loopback_host_header(value: str, expected: bool):
+    assert is_loopback_host_header(value) is expected
+
+
+@pytest.mark.asyncio
+async def test_http_on_non_loopback_address(parser: WhoisParser):
+    async with WhoisServer(parser, kind="thread") as server:
+        with pytest.raises(ValueError):
+            await server.start_http("0.0.0.0")
+
+
+@pytest.mark.parametrize(
+    "host,expected",
+    [("127.0.0.1", True), ("::1", True), ("localhost", True), ("0.0.0.0", False)],
+)
+def test_is_loopback(host: str, expected: bool):
+    assert is_loopback(host) is expected
+
+
+def test_invalid_arguments(parser: WhoisParser):
+    with pytest.raises(ValueError):
+        WhoisServer(parser, kind="foo")
+
+    with pytest.raises(ValueError):
+        WhoisServer(parser, concurrency=0)
@@ -1,6 +1,15 @@
-import importlib.metadata as importlib_metadata
+from typing import Any
 
 from .dataclasses import WhoisRecord  # noqa: F401
 from .parser import WhoisParser  # noqa: F401
 
-__version__ = importlib_metadata.version(__name__)
+
+def __getattr__(name: str) -> Any:
+    # importlib.metadata is slow to import thus the version is resolved on first access
+    if name == "__version__":
+        import importlib.metadata as importlib_metadata
+
+        version = globals()["__version__"] = importlib_metadata.version(__name__)
+        return version
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
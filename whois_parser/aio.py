@@ -0,0 +1,193 @@
+import asyncio
+import functools
+import weakref
+from collections import deque
+from collections.abc import AsyncIterator, Iterable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Optional
+
+from . import batch, compact, dataclasses
+from .parsers.abstract import validate_fields
+
+if TYPE_CHECKING:
+    from .parser import WhoisParser
+
+# process pools created by create_executor and the parsers sent to their workers
+_process_pools: "weakref.WeakKeyDictionary[Executor, WhoisParser]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def create_executor(
+    parser: "WhoisParser", *, kind: str = "thread", max_workers: Optional[int] = None
+) -> Executor:
+    """Create an executor to offload parsing
+
+    The parser is sent to each worker process once (not per record) and records are parsed by it.
+    Thus hooks (e.g. CostTable) and the in-memory tier of a cache are kept in worker processes.
+
+    Args:
+        parser (WhoisParser): Parser
+        kind (str, optional): "thread" or "process". Defaults to "thread".
+        max_workers (Optional[int], optional): Max number of workers. Defaults to None.
+
+    Returns:
+        Executor: Executor whose workers are warmed up
+    """
+    if kind == "thread":
+        batch.warm_up(parser)
+        return ThreadPoolExecutor(max_workers=max_workers)
+
+    if kind == "process":
+        executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=batch._initialize_worker,
+            initargs=(parser,),
+        )
+        _process_pools[executor] = parser
+        return executor
+
+    raise ValueError(f"{kind} is not supported. Use thread or process.")
+
+
+def _get_sent_parser(
+    parser: "WhoisParser", executor: Optional[Executor]
+) -> Optional["WhoisParser"]:
+    # None stands for the parser of a worker process which is the same as the parser
+    if executor is not None and _process_pools.get(executor) is parser:
+        return None
+
+    return parser
+
+
+def _get_worker_parser(parser: Optional["WhoisParser"]) -> "WhoisParser":
+    if parser is None:
+        parser = batch._worker_parser
+        assert parser is not None
+
+    return parser
+
+
+def _parse_in_worker(
+    parser: Optional["WhoisParser"],
+    raw_text: str,
+    hostname: Optional[str],
+    fields: Optional[frozenset[str]],
+) -> dataclasses.WhoisRecord:
+    return _get_worker_parser(parser).parse(raw_text, hostname=hostname, fields=fields)
+
+
+def _parse_item_in_worker(
+    parser: Optional["WhoisParser"],
+    item: batch.Item,
+    fields: Optional[frozenset[str]],
+) -> dataclasses.ParseResult:
+    return batch.parse_item(_get_worker_parser(parser), item, fields)
+
+
+def _restore_record(
+    parser: "WhoisParser", record: Optional[dataclasses.WhoisRecord]
+) -> None:
+    if parser.compact and record is not None:
+        # unpickled records have their own copies of the shared contacts
+        compact.compact_record(record, raw_text_mode="keep")
+
+
+async def aparse(
+    parser: "WhoisParser",
+    raw_text: str,
+    *,
+    hostname: Optional[str] = None,
+    executor: Optional[Executor] = None,
+    fields: Optional[Iterable[str]] = None,
+) -> dataclasses.WhoisRecord:
+    loop = asyncio.get_running_loop()
+    record = await loop.run_in_executor(
+        executor,
+        functools.partial(
+            _parse_in_worker,
+            _get_sent_parser(parser, executor),
+            raw_text,
+            hostname,
+            validate_fields(fields),
+        ),
+    )
+    _restore_record(parser, record)
+    return record
+
+
+async def aparse_many(
+    parser: "WhoisParser",
+    items: Iterable[tuple[str, Optional[str]]],
+    *,
+    executor: Optional[Executor] = None,
+    concurrency: int = 16,
+    ordered: bool = True,
+    fields: Optional[Iterable[str]] = None,
+) -> AsyncIterator[dataclasses.ParseResult]:
+    """Parse whois records in an executor with bounded concurrency
+
+    Args:
+        parser (WhoisParser): Parser
+        items (Iterable[tuple[str, Optional[str]]]): Pairs of a whois record and a hostname
+        executor (Optional[Executor], optional): Executor. Use the default executor of the loop if it's None. Defaults to None.
+        concurrency (int, optional): Max number of records submitted to the executor at once. Defaults to 16.
+        ordered (bool, optional): Whether to yield results in order of the input or as completed. Defaults to True.
+        fields (Optional[Iterable[str]], optional): Fields to parse. Defaults to None.
+
+    Yields:
+        AsyncIterator[dataclasses.ParseResult]: Parse results
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency should be greater than 0")
+
+    projection = validate_fields(fields)
+    sent_parser = _get_sent_parser(parser, executor)
+
+    loop = asyncio.get_running_loop()
+    iterator = enumerate(items)
+    pending: deque[asyncio.Future] = deque()
+
+    def submit() -> bool:
+        item = next(iterator, None)
+        if item is None:
+            return False
+
+        index, (raw_text, hostname) = item
+        pending.append(
+            loop.run_in_executor(
+                executor,
+                functools.partial(
+                    _parse_item_in_worker,
+                    sent_parser,
+                    (index, raw_text, hostname),
+                    projection,
+                ),
+            )
+        )
+        return True
+
+    try:
+        while len(pending) < concurrency and submit():
+            pass
+
+        while len(pending) > 0:
+            if ordered:
+                future = pending[0]
+                await asyncio.wait([future])
+            else:
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                future = next(f for f in pending if f in done)
+
+            pending.remove(future)
+            submit()
+
+            result = future.result()
+            _restore_record(parser, result.record)
+            yield result
+    finally:
+        # cancel queued work if the consumer is cancelled or stops iterating
+        for future in pending:
+            future.cancel()
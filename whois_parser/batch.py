@@ -0,0 +1,166 @@
+import itertools
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import TYPE_CHECKING, Optional
+
+from . import compact, dataclasses
+from .parsers import BaseParser
+from .parsers.abstract import validate_fields
+from .parsers.utils import warm_up_datetime
+
+if TYPE_CHECKING:
+    from .parser import WhoisParser
+
+# (index, raw_text, hostname)
+Item = tuple[int, str, Optional[str]]
+
+_worker_parser: Optional["WhoisParser"] = None
+
+
+def warm_up(parser: "WhoisParser") -> None:
+    """Compile grammars of all the parsers and load dateparser in advance
+
+    Args:
+        parser (WhoisParser): Parser
+    """
+    parser_classes: set[type[BaseParser]] = {BaseParser, *parser.parsers_map.values()}
+    for parser_class in parser_classes:
+        parser_class.warm_up()
+
+    warm_up_datetime()
+
+
+def parse_item(
+    parser: "WhoisParser", item: Item, fields: Optional[frozenset[str]] = None
+) -> dataclasses.ParseResult:
+    index, raw_text, hostname = item
+    try:
+        record = parser.parse(raw_text, hostname=hostname, fields=fields)
+    except Exception as e:
+        return dataclasses.ParseResult(index=index, error=f"{type(e).__name__}: {e}")
+
+    return dataclasses.ParseResult(index=index, record=record)
+
+
+def _initialize_worker(parser: "WhoisParser") -> None:
+    global _worker_parser
+
+    warm_up(parser)
+    _worker_parser = parser
+
+
+def _parse_chunk(
+    chunk: list[Item], fields: Optional[frozenset[str]] = None
+) -> list[dataclasses.ParseResult]:
+    assert _worker_parser is not None
+
+    results = [parse_item(_worker_parser, item, fields) for item in chunk]
+    if _worker_parser.raw_text_mode != "keep":
+        return results
+
+    # raw text is restored by the parent process not to send it back
+    for result in results:
+        if result.record is not None:
+            result.record.raw_text = ""
+
+    return results
+
+
+def _restore_results(
+    parser: "WhoisParser", chunk: list[Item], results: list[dataclasses.ParseResult]
+) -> list[dataclasses.ParseResult]:
+    for (_index, raw_text, _hostname), result in zip(chunk, results):
+        if result.record is None:
+            continue
+
+        if parser.raw_text_mode == "keep":
+            result.record.raw_text = raw_text
+
+        if parser.compact:
+            # unpickled records have their own copies of the shared contacts
+            compact.compact_record(result.record, raw_text_mode="keep")
+
+    return results
+
+
+def chunked(
+    items: Iterable[tuple[str, Optional[str]]], chunksize: int
+) -> Iterator[list[Item]]:
+    iterator = (
+        (index, raw_text, hostname) for index, (raw_text, hostname) in enumerate(items)
+    )
+    while True:
+        chunk = list(itertools.islice(iterator, chunksize))
+        if len(chunk) == 0:
+            return
+
+        yield chunk
+
+
+def parse_many(
+    parser: "WhoisParser",
+    items: Iterable[tuple[str, Optional[str]]],
+    *,
+    workers: Optional[int] = None,
+    chunksize: int = 64,
+    ordered: bool = True,
+    fields: Optional[Iterable[str]] = None,
+) -> Iterator[dataclasses.ParseResult]:
+    """Parse whois records in a process pool
+
+    Args:
+        parser (WhoisParser): Parser
+        items (Iterable[tuple[str, Optional[str]]]): Pairs of a whois record and a hostname
+        workers (Optional[int], optional): Number of worker processes. Parse records in the current process if it's None or 1. Defaults to None.
+        chunksize (int, optional): Number of records sent to a worker at once. Defaults to 64.
+        ordered (bool, optional): Whether to yield results in order of the input or as completed. Defaults to True.
+        fields (Optional[Iterable[str]], optional): Fields to parse. Defaults to None.
+
+    Yields:
+        Iterator[dataclasses.ParseResult]: Parse results
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize should be greater than 0")
+
+    projection = validate_fields(fields)
+
+    if workers is None or workers <= 1:
+        for chunk in chunked(items, chunksize):
+            for item in chunk:
+                yield parse_item(parser, item, projection)
+
+        return
+
+    # keep a bounded number of chunks in flight not to load all the items in memory
+    max_pending = workers * 2
+    chunks = chunked(items, chunksize)
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_initialize_worker, initargs=(parser,)
+    ) as executor:
+        pending: deque[tuple[list[Item], Future]] = deque()
+
+        def submit() -> bool:
+            chunk = next(chunks, None)
+            if chunk is None:
+                return False
+
+            pending.append((chunk, executor.submit(_parse_chunk, chunk, projection)))
+            return True
+
+        while len(pending) < max_pending and submit():
+            pass
+
+        while len(pending) > 0:
+            if ordered:
+                chunk, future = pending.popleft()
+            else:
+                wait([future for _, future in pending], return_when=FIRST_COMPLETED)
+                chunk, future = next((c, f) for c, f in pending if f.done())
+                pending.remove((chunk, future))
+
+            results = _restore_results(parser, chunk, future.result())
+            submit()
+
+            yield from results
@@ -0,0 +1,277 @@
+import functools
+import hashlib
+import importlib.metadata as importlib_metadata
+import pathlib
+import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass, replace
+from typing import Optional, Union
+
+from . import dataclasses, serialization
+from .parsers import BaseParser
+from .parsers.utils import find_last_section
+
+PACKAGE_DIR = pathlib.Path(__file__).parent
+
+
+@functools.lru_cache(maxsize=None)
+def get_cache_version() -> str:
+    """Get a version of cached results
+
+    Results of another version can't be reused since parsers may behave differently.
+    The version of the package can be missing (not installed) or stale (e.g. "0.0.0" of dynamic versioning),
+    thus a digest of the modules of the package is added to it.
+
+    Returns:
+        str: Version (e.g. "0.1.0+0123456789abcdef")
+    """
+    try:
+        version = importlib_metadata.version("whois-parser")
+    except importlib_metadata.PackageNotFoundError:
+        version = "unknown"
+
+    digest = hashlib.sha256()
+    for path in sorted(PACKAGE_DIR.rglob("*.py")):
+        digest.update(path.relative_to(PACKAGE_DIR).as_posix().encode())
+        digest.update(path.read_bytes())
+
+    return f"{version}+{digest.hexdigest()[:16]}"
+
+
+@functools.lru_cache(maxsize=256)
+def get_parser_fingerprint(parser: type[BaseParser]) -> str:
+    """Get a fingerprint of a parser
+
+    Parsers compiled from different specs (e.g. loaded by load_specs) can share a name.
+    Thus the specs of the parser and its bases are a part of the fingerprint.
+
+    Args:
+        parser (type[BaseParser]): Parser
+
+    Returns:
+        str: Fingerprint (a hex digest)
+    """
+    specs = [
+        repr(base.__dict__["SPEC"])
+        for base in parser.__mro__
+        if "SPEC" in base.__dict__
+    ]
+    fingerprint = "\0".join([f"{parser.__module__}.{parser.__qualname__}", *specs])
+    return hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()
+
+
+def _loads(value: bytes) -> dataclasses.WhoisRecord:
+    return serialization.loads(value.decode("utf-8"))
+
+
+@dataclass
+class CacheStats:
+    # hits of the in-memory tier
+    hits: int = 0
+    # hits of the on-disk tier
+    disk_hits: int = 0
+    misses: int = 0
+    # entries evicted from the in-memory tier
+    evictions: int = 0
+    # entries and bytes in the in-memory tier
+    entries: int = 0
+    bytes: int = 0
+
+
+class ResultCache:
+    """A cache of parsed whois records keyed by a hash of a parser and the last section of raw text
+
+    Records are stored as JSON (see WhoisRecord.to_dict). Thus a hit returns a new record which is equal to
+    the cached one (including timezones of datetimes) and it's safe to modify it.
+
+    The in-memory tier is an LRU bounded by entries and bytes. The optional on-disk tier is a SQLite
+    database which is written through and promotes hits into the in-memory tier.
+    Note that each worker process of parse_many has its own in-memory tier.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+        path: Optional[Union[str, pathlib.Path]] = None,
+    ):
+        """
+        Args:
+            max_entries (int, optional): Max number of entries in memory. Defaults to 1024.
+            max_bytes (int, optional): Max bytes of serialized records in memory. Defaults to 64 MiB.
+            path (Optional[Union[str, pathlib.Path]], optional): Path to a SQLite database of the on-disk tier. Defaults to None.
+
+        Raises:
+            ValueError: Raised if a bound is not positive
+        """
+        if max_entries < 1 or max_bytes < 1:
+            raise ValueError("max_entries and max_bytes should be positive")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.path = pathlib.Path(path) if path is not None else None
+
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._stats = CacheStats()
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+
+    def __getstate__(self) -> dict:
+        # a worker process starts with an empty in-memory tier and opens the database by itself
+        state = self.__dict__.copy()
+        state["_entries"] = OrderedDict()
+        state["_stats"] = CacheStats()
+        del state["_lock"]
+        state["_connection"] = None
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(
+        parser: type[BaseParser],
+        raw_text: str,
+        fields: Optional[Iterable[str]] = None,
+    ) -> str:
+        """Make a key of a whois record
+
+        Only the last section of the record is hashed since a parser (and its classifier) doesn't look at the others.
+        Thus responses which differ only in referral sections share a key.
+
+        Args:
+            parser (type[BaseParser]): Parser of the record
+            raw_text (str): Whois record
+            fields (Optional[Iterable[str]], optional): Fields to parse. Defaults to None.
+
+        Returns:
+            str: Key
+        """
+        projection = "*" if fields is None else ",".join(sorted(fields))
+        start = find_last_section(raw_text)
+        section = raw_text if start is None else raw_text[start:]
+        digest = hashlib.sha256()
+        for part in (
+            get_cache_version(),
+            get_parser_fingerprint(parser),
+            projection,
+            section,
+        ):
+            digest.update(part.encode("utf-8", "surrogatepass"))
+            digest.update(b"\0")
+
+        return digest.hexdigest()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            assert self.path is not None
+            self._connection = sqlite3.connect(
+                self.path, timeout=30, check_same_thread=False
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS records (key TEXT PRIMARY KEY, value BLOB NOT NULL)"
+            )
+            self._connection.commit()
+
+        return self._connection
+
+    def _remember(self, key: str, value: bytes) -> None:
+        # should be called with the lock
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._stats.bytes -= len(previous)
+
+        if len(value) <= self.max_bytes:
+            self._entries[key] = value
+            self._stats.bytes += len(value)
+
+        while (
+            len(self._entries) > self.max_entries or self._stats.bytes > self.max_bytes
+        ):
+            _, evicted = self._entries.popitem(last=False)
+            self._stats.bytes -= len(evicted)
+            self._stats.evictions += 1
+
+        self._stats.entries = len(self._entries)
+
+    def get(self, key: str) -> Optional[dataclasses.WhoisRecord]:
+        """Get a cached record
+
+        Args:
+            key (str): Key
+
+        Returns:
+            Optional[dataclasses.WhoisRecord]: Returns a cached record. Returns None if it's not cached. Note that raw_text of the record is empty.
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self._stats.hits += 1
+                return _loads(value)
+
+            if self.path is not None:
+                row = (
+                    self._get_connection()
+                    .execute("SELECT value FROM records WHERE key = ?", (key,))
+                    .fetchone()
+                )
+                if row is not None:
+                    value = bytes(row[0])
+                    try:
+                        record = _loads(value)
+                    except (ValueError, KeyError, TypeError, AttributeError):
+                        # e.g. a pickle of an older version
+                        record = None
+
+                    if record is not None:
+                        self._remember(key, value)
+                        self._stats.disk_hits += 1
+                        return record
+
+            self._stats.misses += 1
+            return None
+
+    def set(self, key: str, record: dataclasses.WhoisRecord) -> None:
+        """Cache a record
+
+        Args:
+            key (str): Key
+            record (dataclasses.WhoisRecord): Whois record. Its raw text is not stored.
+        """
+        value = serialization.dumps(replace(record, raw_text="")).encode("utf-8")
+        with self._lock:
+            self._remember(key, value)
+            if self.path is not None:
+                connection = self._get_connection()
+                connection.execute(
+                    "INSERT OR REPLACE INTO records (key, value) VALUES (?, ?)",
+                    (key, value),
+                )
+                connection.commit()
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return replace(self._stats)
+
+    def clear(self) -> None:
+        """Clear entries of all the tiers and statistics"""
+        with self._lock:
+            self._entries.clear()
+            self._stats = CacheStats()
+            if self.path is not None:
+                connection = self._get_connection()
+                connection.execute("DELETE FROM records")
+                connection.commit()
+
+    def close(self) -> None:
+        """Close the database of the on-disk tier"""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
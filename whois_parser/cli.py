@@ -0,0 +1,408 @@
+import argparse
+import csv
+import glob
+import itertools
+import os
+import pathlib
+import sys
+import time
+from collections import deque
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import datetime
+from typing import IO, Any, Optional, Union
+
+from . import corpus, dataclasses
+from .parser import WhoisParser
+from .parsers.abstract import FIELD_FINDERS, validate_fields
+from .parsers.spec import CONTACT_FIELDS
+from .serialization import ENCODER
+
+OUTPUT_FORMATS = ("ndjson", "csv")
+# separator of list values (e.g. name servers) in a CSV cell
+CSV_LIST_SEPARATOR = "|"
+GLOB_CHARS = frozenset("*?[")
+
+
+def expand_sources(sources: Iterable[str]) -> list[str]:
+    """Expand glob patterns of sources
+
+    Args:
+        sources (Iterable[str]): Paths or glob patterns. "-" is stdin.
+
+    Raises:
+        ValueError: Raised if a path doesn't exist or a pattern matches nothing
+
+    Returns:
+        list[str]: Paths (and "-")
+    """
+    paths: list[str] = []
+    for source in sources:
+        if source == "-" or pathlib.Path(source).exists():
+            paths.append(source)
+            continue
+
+        if GLOB_CHARS.isdisjoint(source):
+            raise ValueError(f"{source} does not exist")
+
+        matches = sorted(glob.glob(source, recursive=True))
+        if len(matches) == 0:
+            raise ValueError(f"{source} matches nothing")
+
+        paths.extend(matches)
+
+    return paths
+
+
+def iter_sources(
+    sources: Iterable[str],
+    *,
+    stdin: IO[bytes],
+    pattern: str = "*.txt",
+    input_format: str = "auto",
+    hostname: Optional[str] = None,
+    text_field: str = "raw_text",
+    hostname_field: Optional[str] = "hostname",
+    on_error: Optional[corpus.ErrorHandler] = None,
+) -> Iterator[corpus.Item]:
+    """Read whois records lazily from sources
+
+    Args:
+        sources (Iterable[str]): Paths of directories, files (plain, gzip, NDJSON or tar) and "-" (stdin)
+        stdin (IO[bytes]): Binary stream of stdin
+        pattern (str, optional): Glob pattern of files in a directory. Defaults to "*.txt".
+        input_format (str, optional): Format of stdin. "auto", "text" or "ndjson". Defaults to "auto".
+        hostname (Optional[str], optional): Hostname of a whois record in stdin. Defaults to None.
+        text_field (str, optional): Field of a whois record in NDJSON. Defaults to "raw_text".
+        hostname_field (Optional[str], optional): Field of a hostname in NDJSON. Defaults to "hostname".
+        on_error (Optional[corpus.ErrorHandler], optional): Called with an error message of an invalid NDJSON line. Defaults to None.
+
+    Yields:
+        Iterator[corpus.Item]: Pairs of a whois record and a hostname
+    """
+    for source in sources:
+        if source == "-":
+            yield from corpus.iter_stream(
+                stdin,
+                input_format=input_format,
+                hostname=hostname,
+                text_field=text_field,
+                hostname_field=hostname_field,
+                on_error=on_error,
+            )
+        else:
+            yield from corpus.iter_items(
+                source,
+                pattern=pattern,
+                text_field=text_field,
+                hostname_field=hostname_field,
+                on_error=on_error,
+            )
+
+
+def get_csv_columns(fields: Optional[frozenset[str]] = None) -> list[str]:
+    """Get columns of CSV output (contacts are flattened e.g. "registrant_email")
+
+    Args:
+        fields (Optional[frozenset[str]], optional): Fields to output. Defaults to None (all the fields).
+
+    Returns:
+        list[str]: Columns
+    """
+    columns = ["index", "hostname", "error"]
+    for name in FIELD_FINDERS:
+        if fields is not None and name not in fields:
+            continue
+
+        if name in CONTACT_FIELDS:
+            columns.extend(f"{name}_{subfield}" for subfield in CONTACT_FIELDS[name])
+        else:
+            columns.append(name)
+
+    return columns
+
+
+def to_csv_value(value: Any) -> Union[str, bool]:
+    if value is None:
+        return ""
+
+    if isinstance(value, datetime):
+        return value.isoformat()
+
+    if isinstance(value, list):
+        return CSV_LIST_SEPARATOR.join(value)
+
+    return value
+
+
+def to_csv_row(
+    result: dataclasses.ParseResult, hostname: Optional[str], columns: list[str]
+) -> list[Union[str, bool]]:
+    values: dict[str, Any] = {
+        "index": result.index,
+        "hostname": hostname,
+        "error": result.error,
+    }
+    record = result.record
+    if record is not None:
+        for name in FIELD_FINDERS:
+            value = getattr(record, name)
+            if name in CONTACT_FIELDS:
+                for subfield in CONTACT_FIELDS[name]:
+                    values[f"{name}_{subfield}"] = getattr(value, subfield)
+            else:
+                values[name] = value
+
+    return [to_csv_value(values.get(column)) for column in columns]
+
+
+def to_ndjson_line(result: dataclasses.ParseResult, hostname: Optional[str]) -> str:
+    value: dict[str, Any]
+    if result.record is None:
+        value = {"index": result.index, "hostname": hostname, "error": result.error}
+    else:
+        value = {
+            "index": result.index,
+            "hostname": hostname,
+            "record": result.record.to_dict(),
+        }
+
+    return ENCODER.encode(value) + "\n"
+
+
+class Stats:
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.records = 0
+        self.errors = 0
+
+    def add(self, result: dataclasses.ParseResult) -> None:
+        self.records += 1
+        if result.error is not None:
+            self.errors += 1
+
+    def format(self) -> str:
+        elapsed = time.perf_counter() - self.started_at
+        throughput = self.records / elapsed if elapsed > 0 else 0.0
+        return f"{self.records} records, {self.errors} errors in {elapsed:.2f}s ({throughput:.1f} records/s)\n"
+
+
+def write_results(
+    results: Iterable[tuple[dataclasses.ParseResult, Optional[str]]],
+    output: IO[str],
+    *,
+    output_format: str = "ndjson",
+    fields: Optional[frozenset[str]] = None,
+    stats: Optional[Stats] = None,
+) -> None:
+    """Stream parse results to an output
+
+    Args:
+        results (Iterable[tuple[dataclasses.ParseResult, Optional[str]]]): Pairs of a parse result and a hostname
+        output (IO[str]): Output
+        output_format (str, optional): "ndjson" or "csv". Defaults to "ndjson".
+        fields (Optional[frozenset[str]], optional): Fields of CSV columns. Defaults to None.
+        stats (Optional[Stats], optional): Stats to update. Defaults to None.
+    """
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"{output_format} is not supported. Use ndjson or csv.")
+
+    if output_format == "csv":
+        writer = csv.writer(output, lineterminator="\n")
+        columns = get_csv_columns(fields)
+        writer.writerow(columns)
+
+    for result, hostname in results:
+        if stats is not None:
+            stats.add(result)
+
+        if output_format == "csv":
+            writer.writerow(to_csv_row(result, hostname, columns))
+        else:
+            output.write(to_ndjson_line(result, hostname))
+
+
+def parse_items(
+    parser: WhoisParser,
+    items: Iterable[corpus.Item],
+    *,
+    workers: Optional[int] = None,
+    chunksize: int = 64,
+    ordered: bool = True,
+    fields: Optional[frozenset[str]] = None,
+    errors: Optional[list[str]] = None,
+) -> Iterator[tuple[dataclasses.ParseResult, Optional[str]]]:
+    """Parse whois records with their hostnames kept for output
+
+    Args:
+        parser (WhoisParser): Parser
+        items (Iterable[corpus.Item]): Pairs of a whois record and a hostname
+        workers (Optional[int], optional): Number of worker processes. Defaults to None.
+        chunksize (int, optional): Number of records sent to a worker at once. Defaults to 64.
+        ordered (bool, optional): Whether to yield results in order of the input or as completed. Defaults to True.
+        fields (Optional[frozenset[str]], optional): Fields to parse. Defaults to None.
+        errors (Optional[list[str]], optional): Error messages of invalid items, which are appended while reading items (see corpus.ErrorHandler). Each of them is yielded as an error result. Defaults to None.
+
+    Yields:
+        Iterator[tuple[dataclasses.ParseResult, Optional[str]]]: Pairs of a parse result and a hostname
+    """
+    errors = errors if errors is not None else []
+    # positions in the input of valid and invalid items
+    positions = itertools.count()
+    # hostnames and positions of records in flight (parse_many reads items lazily)
+    hostnames: dict[int, Optional[str]] = {}
+    indexes: dict[int, int] = {}
+    invalid_results: deque[dataclasses.ParseResult] = deque()
+
+    def collect_errors() -> None:
+        for error in errors:
+            invalid_results.append(
+                dataclasses.ParseResult(index=next(positions), error=error)
+            )
+
+        errors.clear()
+
+    def iter_with_hostnames() -> Iterator[corpus.Item]:
+        for index, (raw_text, hostname) in enumerate(items):
+            # errors are reported while reading items before this one
+            collect_errors()
+            indexes[index] = next(positions)
+            hostnames[index] = hostname
+            yield raw_text, hostname
+
+        collect_errors()
+
+    for result in parser.parse_many(
+        iter_with_hostnames(),
+        workers=workers,
+        chunksize=chunksize,
+        ordered=ordered,
+        fields=fields,
+    ):
+        hostname = hostnames.pop(result.index)
+        result.index = indexes.pop(result.index)
+        while len(invalid_results) > 0 and invalid_results[0].index < result.index:
+            yield invalid_results.popleft(), None
+
+        yield result, hostname
+
+    collect_errors()
+    for result in invalid_results:
+        yield result, None
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    arg_parser = argparse.ArgumentParser(
+        prog="whois-parser",
+        description="Parse whois records in bulk and stream them as NDJSON or CSV",
+        epilog="The exit status is 1 if any record failed (errors are output in order of the input).",
+    )
+    arg_parser.add_argument(
+        "sources",
+        nargs="*",
+        default=["-"],
+        help="files (plain, gzip, NDJSON or tar), directories or glob patterns. Read stdin if it's - or omitted.",
+    )
+    arg_parser.add_argument(
+        "-o", "--output", help="path to an output file (default: stdout)"
+    )
+    arg_parser.add_argument("--format", choices=OUTPUT_FORMATS, default="ndjson")
+    arg_parser.add_argument(
+        "--fields", help="comma separated fields to parse (default: all the fields)"
+    )
+    arg_parser.add_argument(
+        "--workers", type=int, help="number of worker processes (default: 1)"
+    )
+    arg_parser.add_argument("--chunksize", type=int, default=64)
+    arg_parser.add_argument(
+        "--unordered",
+        action="store_true",
+        help="output results as completed instead of in order of the input",
+    )
+    arg_parser.add_argument(
+        "--pattern",
+        default="*.txt",
+        help="glob pattern of files in directories (default: *.txt)",
+    )
+    arg_parser.add_argument(
+        "--input-format", choices=["auto", "text", "ndjson"], default="auto"
+    )
+    arg_parser.add_argument("--hostname", help="hostname of a whois record in stdin")
+    arg_parser.add_argument(
+        "--text-field", default="raw_text", help="field of a whois record in NDJSON"
+    )
+    arg_parser.add_argument(
+        "--hostname-field", default="hostname", help="field of a hostname in NDJSON"
+    )
+    arg_parser.add_argument("--engine", choices=["pyparsing", "regex"], default="regex")
+    arg_parser.add_argument(
+        "--raw-text-mode", choices=["keep", "drop", "digest"], default="drop"
+    )
+    arg_parser.add_argument(
+        "-q", "--quiet", action="store_true", help="don't print stats to stderr"
+    )
+    return arg_parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    arg_parser = build_arg_parser()
+    args = arg_parser.parse_args(argv)
+
+    try:
+        sources = expand_sources(args.sources)
+        fields = validate_fields(
+            args.fields.split(",") if args.fields is not None else None
+        )
+    except ValueError as e:
+        arg_parser.error(str(e))
+
+    parser = WhoisParser(engine=args.engine, raw_text_mode=args.raw_text_mode)
+    # invalid lines of NDJSON are output as errors instead of aborting
+    errors: list[str] = []
+    items = iter_sources(
+        sources,
+        stdin=sys.stdin.buffer,
+        pattern=args.pattern,
+        input_format=args.input_format,
+        hostname=args.hostname,
+        text_field=args.text_field,
+        hostname_field=args.hostname_field,
+        on_error=errors.append,
+    )
+    results = parse_items(
+        parser,
+        items,
+        workers=args.workers,
+        chunksize=args.chunksize,
+        ordered=not args.unordered,
+        fields=fields,
+        errors=errors,
+    )
+
+    stats = Stats()
+    output = (
+        open(args.output, "w", encoding="utf-8", newline="")
+        if args.output is not None
+        else sys.stdout
+    )
+    try:
+        write_results(
+            results, output, output_format=args.format, fields=fields, stats=stats
+        )
+    except BrokenPipeError:
+        # the reader (e.g. head) is closed. Python flushes stdout at exit thus it's redirected to devnull.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    finally:
+        if output is not sys.stdout:
+            output.close()
+        else:
+            output.flush()
+
+    if not args.quiet:
+        sys.stderr.write(stats.format())
+
+    return 1 if stats.errors > 0 else 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())
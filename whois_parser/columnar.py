@@ -0,0 +1,357 @@
+from abc import ABC, abstractmethod
+from array import array
+from collections.abc import Iterable
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+from . import dataclasses
+from .parsers.abstract import FIELD_FINDERS, validate_fields
+from .parsers.spec import CONTACT_FIELDS, DATETIME_FIELDS, LIST_FIELDS
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .parser import WhoisParser
+
+# same as NaT of numpy's datetime64
+NULL_TIMESTAMP = -(2**63)
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+MICROSECOND = timedelta(microseconds=1)
+
+BOOL_FIELDS = ("is_rate_limited",)
+
+
+def _import_numpy() -> Any:
+    try:
+        import numpy
+    except ImportError as e:  # pragma: no cover
+        raise ImportError(
+            "numpy is required to convert columns. Install it by 'pip install numpy'."
+        ) from e
+
+    return numpy
+
+
+def to_timestamp(value: datetime) -> int:
+    """Convert a datetime into microseconds since the epoch
+
+    Args:
+        value (datetime): Datetime. A naive one is regarded as UTC.
+
+    Returns:
+        int: Microseconds
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+
+    return (value - EPOCH) // MICROSECOND
+
+
+class Column(ABC):
+    """A column backed by arrays"""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        ...
+
+    @abstractmethod
+    def __getitem__(self, index: int) -> Any:
+        ...
+
+    @abstractmethod
+    def append(self, value: Any) -> None:
+        ...
+
+    @abstractmethod
+    def to_numpy(self, name: str) -> dict[str, Any]:
+        """Convert the column into NumPy arrays which share buffers of the column
+
+        Args:
+            name (str): Name of the column
+
+        Returns:
+            dict[str, Any]: Names and NumPy arrays
+        """
+
+    def to_list(self) -> list[Any]:
+        return [self[index] for index in range(len(self))]
+
+
+class StringColumn(Column):
+    """A column of strings encoded in UTF-8 and concatenated into a buffer
+
+    Value i is data[offsets[i]:offsets[i + 1]] and it's None if valid[i] is 0.
+    """
+
+    def __init__(self):
+        self.offsets = array("q", [0])
+        self.data = bytearray()
+        self.valid = bytearray()
+
+    def __len__(self) -> int:
+        return len(self.valid)
+
+    def __getitem__(self, index: int) -> Optional[str]:
+        if not self.valid[index]:
+            return None
+
+        start, end = self.offsets[index], self.offsets[index + 1]
+        return self.data[start:end].decode("utf-8", "surrogatepass")
+
+    def append(self, value: Optional[str]) -> None:
+        if value is not None:
+            self.data += value.encode("utf-8", "surrogatepass")
+
+        self.offsets.append(len(self.data))
+        self.valid.append(value is not None)
+
+    def to_numpy(self, name: str) -> dict[str, Any]:
+        np = _import_numpy()
+        return {
+            f"{name}.offsets": np.frombuffer(self.offsets, dtype=np.int64),
+            f"{name}.data": np.frombuffer(self.data, dtype=np.uint8),
+            f"{name}.valid": np.frombuffer(self.valid, dtype=np.bool_),
+        }
+
+
+class ListColumn(Column):
+    """A column of lists of strings
+
+    Value i is values[offsets[i]:offsets[i + 1]].
+    """
+
+    def __init__(self):
+        self.offsets = array("q", [0])
+        self.values = StringColumn()
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> list[str]:
+        start, end = self.offsets[index], self.offsets[index + 1]
+        return [self.values[i] or "" for i in range(start, end)]
+
+    def append(self, value: Iterable[str]) -> None:
+        for item in value:
+            self.values.append(item)
+
+        self.offsets.append(len(self.values))
+
+    def to_numpy(self, name: str) -> dict[str, Any]:
+        np = _import_numpy()
+        return {
+            f"{name}.offsets": np.frombuffer(self.offsets, dtype=np.int64),
+            **self.values.to_numpy(f"{name}.values"),
+        }
+
+
+class DatetimeColumn(Column):
+    """A column of datetimes as microseconds since the epoch (UTC)
+
+    A value which parse_datetime could not convert is kept in the unparsed column as it is.
+    Timestamps of None and unparsed values are NULL_TIMESTAMP.
+    A naive datetime is stored as UTC and flagged in the naive column thus it's returned naive.
+    """
+
+    def __init__(self):
+        self.timestamps = array("q")
+        self.unparsed = StringColumn()
+        self.naive = BoolColumn()
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def __getitem__(self, index: int) -> Optional[Union[datetime, str]]:
+        timestamp = self.timestamps[index]
+        if timestamp == NULL_TIMESTAMP:
+            return self.unparsed[index]
+
+        value = EPOCH + timestamp * MICROSECOND
+        if self.naive[index]:
+            return value.replace(tzinfo=None)
+
+        return value
+
+    def append(self, value: Optional[Union[datetime, str]]) -> None:
+        if isinstance(value, datetime):
+            self.timestamps.append(to_timestamp(value))
+            self.unparsed.append(None)
+            self.naive.append(value.tzinfo is None)
+        else:
+            self.timestamps.append(NULL_TIMESTAMP)
+            self.unparsed.append(value)
+            self.naive.append(False)
+
+    def to_numpy(self, name: str) -> dict[str, Any]:
+        np = _import_numpy()
+        return {
+            name: np.frombuffer(self.timestamps, dtype="datetime64[us]"),
+            **self.unparsed.to_numpy(f"{name}_unparsed"),
+            **self.naive.to_numpy(f"{name}_naive"),
+        }
+
+
+class BoolColumn(Column):
+    """A column of booleans"""
+
+    def __init__(self):
+        self.values = bytearray()
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, index: int) -> bool:
+        return bool(self.values[index])
+
+    def append(self, value: bool) -> None:
+        self.values.append(value)
+
+    def to_numpy(self, name: str) -> dict[str, Any]:
+        np = _import_numpy()
+        return {name: np.frombuffer(self.values, dtype=np.bool_)}
+
+
+class IntColumn(Column):
+    """A column of 64-bit integers"""
+
+    def __init__(self):
+        self.values = array("q")
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, index: int) -> int:
+        return self.values[index]
+
+    def append(self, value: int) -> None:
+        self.values.append(value)
+
+    def to_list(self) -> list[int]:
+        return self.values.tolist()
+
+    def to_numpy(self, name: str) -> dict[str, Any]:
+        np = _import_numpy()
+        return {name: np.frombuffer(self.values, dtype=np.int64)}
+
+
+class RecordColumns:
+    """Whois records in columns
+
+    Columns are named after fields of WhoisRecord and contact sub-fields are flattened
+    (e.g. "registrant_email"). "index" and "error" columns come from parse results.
+    Columns are backed by arrays. Thus they can be converted into NumPy arrays without copying them.
+    Note that a column can't be appended while NumPy arrays sharing its buffers are alive (BufferError).
+    """
+
+    def __init__(self, fields: Optional[Iterable[str]] = None):
+        """
+        Args:
+            fields (Optional[Iterable[str]], optional): Fields of WhoisRecord. All the fields (including raw_text) if it's None. Defaults to None.
+        """
+        projection = validate_fields(fields)
+        self.fields: tuple[str, ...] = tuple(
+            field
+            for field in FIELD_FINDERS
+            if projection is None or field in projection
+        )
+
+        self.columns: dict[str, Column] = {
+            "index": IntColumn(),
+            "error": StringColumn(),
+        }
+        if fields is None or "raw_text" in fields:
+            self.columns["raw_text"] = StringColumn()
+
+        for field in self.fields:
+            if field in CONTACT_FIELDS:
+                for subfield in CONTACT_FIELDS[field]:
+                    self.columns[f"{field}_{subfield}"] = StringColumn()
+            elif field in DATETIME_FIELDS:
+                self.columns[field] = DatetimeColumn()
+            elif field in LIST_FIELDS:
+                self.columns[field] = ListColumn()
+            elif field in BOOL_FIELDS:
+                self.columns[field] = BoolColumn()
+            else:
+                self.columns[field] = StringColumn()
+
+    def __len__(self) -> int:
+        return len(self.columns["index"])
+
+    def __getitem__(self, name: str) -> Column:
+        return self.columns[name]
+
+    def append(self, result: dataclasses.ParseResult) -> None:
+        """Append a parse result. Fields of a failed result are None (or empty / False)
+
+        Args:
+            result (dataclasses.ParseResult): Parse result
+        """
+        columns = self.columns
+        record = result.record
+
+        columns["index"].append(result.index)
+        columns["error"].append(result.error)
+        if "raw_text" in columns:
+            columns["raw_text"].append(record.raw_text if record is not None else None)
+
+        for field in self.fields:
+            value = getattr(record, field) if record is not None else None
+            if field in CONTACT_FIELDS:
+                for subfield in CONTACT_FIELDS[field]:
+                    columns[f"{field}_{subfield}"].append(
+                        getattr(value, subfield) if value is not None else None
+                    )
+            elif field in LIST_FIELDS:
+                columns[field].append(value or [])
+            elif field in BOOL_FIELDS:
+                columns[field].append(bool(value))
+            else:
+                columns[field].append(value)
+
+    def to_numpy(self) -> dict[str, Any]:
+        """Convert columns into NumPy arrays which share buffers of the columns
+
+        Strings are converted into "<name>.offsets", "<name>.data" (UTF-8) and "<name>.valid" arrays.
+        Lists are converted into "<name>.offsets" and "<name>.values.*" arrays.
+        Datetimes are converted into a datetime64[us] array (NaT for None or unparsed values) and
+        "<name>_unparsed.*" arrays.
+
+        Returns:
+            dict[str, Any]: Names and NumPy arrays
+        """
+        arrays: dict[str, Any] = {}
+        for name, column in self.columns.items():
+            arrays.update(column.to_numpy(name))
+
+        return arrays
+
+
+def parse_columns(
+    parser: "WhoisParser",
+    items: Iterable[tuple[str, Optional[str]]],
+    *,
+    workers: Optional[int] = None,
+    chunksize: int = 64,
+    fields: Optional[Iterable[str]] = None,
+) -> RecordColumns:
+    """Parse whois records into columns
+
+    Args:
+        parser (WhoisParser): Parser
+        items (Iterable[tuple[str, Optional[str]]]): Pairs of a whois record and a hostname
+        workers (Optional[int], optional): Number of worker processes. Defaults to None.
+        chunksize (int, optional): Number of records sent to a worker at once. Defaults to 64.
+        fields (Optional[Iterable[str]], optional): Fields to parse and store. Defaults to None.
+
+    Returns:
+        RecordColumns: Columns in order of the input
+    """
+    if fields is not None:
+        fields = list(fields)
+
+    columns = RecordColumns(fields)
+    for result in parser.parse_many(
+        items, workers=workers, chunksize=chunksize, fields=fields
+    ):
+        columns.append(result)
+
+    return columns
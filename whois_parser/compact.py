@@ -0,0 +1,147 @@
+import hashlib
+import sys
+from dataclasses import FrozenInstanceError, fields
+from typing import Any, Optional
+
+from . import dataclasses
+
+RAW_TEXT_MODES = ("keep", "drop", "digest")
+DIGEST_PREFIX = "sha256:"
+
+
+class SharedContact:
+    """A mixin of an empty contact shared by compact records
+
+    It's read-only since a change would be visible from all the compact records.
+    It's equal to an empty contact of its base class and it's copied (or unpickled) as a mutable one.
+    Constructing the class (e.g. dataclasses.replace) returns a mutable contact as well.
+    """
+
+    __slots__ = ()
+    # contact class which the shared contact stands for
+    base: type
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> Any:
+        return cls.base(*args, **kwargs)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise FrozenInstanceError(
+            f"{self.base.__name__} shared by compact records is read-only. Replace it with a new one instead."
+        )
+
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(
+            f"{self.base.__name__} shared by compact records is read-only."
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, self.base):
+            return NotImplemented
+
+        return all(
+            getattr(self, f.name) == getattr(other, f.name) for f in fields(self.base)
+        )
+
+    def __repr__(self) -> str:
+        return repr(self.copy())
+
+    def __reduce__(self):
+        return (self.base, tuple(getattr(self, f.name) for f in fields(self.base)))
+
+    def copy(self) -> Any:
+        """Copy the contact as a mutable one
+
+        Returns:
+            Any: Contact of the base class
+        """
+        return self.base(*(getattr(self, f.name) for f in fields(self.base)))
+
+
+def _create_shared_contact(base: type) -> Any:
+    shared_class = type(
+        f"Shared{base.__name__}",
+        (SharedContact, base),
+        {"__slots__": (), "base": base},
+    )
+    contact: Any = object.__new__(shared_class)
+    for f in fields(base):
+        object.__setattr__(contact, f.name, None)
+
+    return contact
+
+
+# empty contacts are shared by compact records
+EMPTY_CONTACTS: dict[type, Any] = {
+    base: _create_shared_contact(base)
+    for base in (
+        dataclasses.Registrant,
+        dataclasses.Admin,
+        dataclasses.Tech,
+        dataclasses.Abuse,
+    )
+}
+CONTACT_FIELDS = ("registrant", "admin", "tech", "abuse")
+
+
+def validate_raw_text_mode(raw_text_mode: str) -> str:
+    if raw_text_mode not in RAW_TEXT_MODES:
+        raise ValueError(
+            f"{raw_text_mode} is not supported. Use {', '.join(RAW_TEXT_MODES)}."
+        )
+
+    return raw_text_mode
+
+
+def digest_raw_text(raw_text: str) -> str:
+    """Compute a digest of a whois record to reference it in an external store
+
+    Args:
+        raw_text (str): Whois record
+
+    Returns:
+        str: Digest (e.g. "sha256:...")
+    """
+    return DIGEST_PREFIX + hashlib.sha256(raw_text.encode()).hexdigest()
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if value is not None else None
+
+
+def compact_record(
+    record: dataclasses.WhoisRecord,
+    *,
+    raw_text_mode: str = "keep",
+    share_contacts: bool = True,
+) -> dataclasses.WhoisRecord:
+    """Reduce memory held by a whois record in place
+
+    Note that shared contacts are read-only (see SharedContact). Replace a contact to change it.
+
+    Args:
+        record (dataclasses.WhoisRecord): Whois record
+        raw_text_mode (str, optional): "keep", "drop" (replace it with an empty string) or "digest" (replace it with a digest). Defaults to "keep".
+        share_contacts (bool, optional): Whether to share empty contacts and intern repeated strings or not. Defaults to True.
+
+    Returns:
+        dataclasses.WhoisRecord: The same whois record
+    """
+    if raw_text_mode == "drop":
+        record.raw_text = ""
+    elif raw_text_mode == "digest":
+        record.raw_text = digest_raw_text(record.raw_text)
+
+    if not share_contacts:
+        return record
+
+    for name in CONTACT_FIELDS:
+        contact = getattr(record, name)
+        empty = EMPTY_CONTACTS.get(type(contact))
+        if empty is not None and contact == empty:
+            setattr(record, name, empty)
+
+    # statuses and registrars are repeated across records
+    record.statuses = [sys.intern(status) for status in record.statuses]
+    record.registrar = _intern(record.registrar)
+
+    return record
@@ -0,0 +1,365 @@
+import gzip
+import io
+import json
+import mmap
+import pathlib
+import tarfile
+from collections.abc import Callable, Iterable, Iterator
+from typing import IO, Any, Optional, Union
+
+from . import dataclasses
+from .decoding import decode_raw_text
+from .dispatch import get_tld
+from .parser import WhoisParser
+from .parsers.abstract import validate_fields
+
+# (raw_text, hostname)
+Item = tuple[str, Optional[str]]
+PathLike = Union[str, pathlib.Path]
+# called with an error message of an invalid item (e.g. a malformed NDJSON line)
+ErrorHandler = Callable[[str], None]
+
+TEXT_SUFFIXES = (".txt", ".whois")
+NDJSON_SUFFIXES = (".ndjson", ".jsonl")
+TAR_SUFFIXES = (".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tar.xz")
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+def hostname_from_filename(filename: str) -> str:
+    """Infer a hostname from a filename (e.g. "google.co.jp.txt" -> "google.co.jp")
+
+    Args:
+        filename (str): Filename
+
+    Returns:
+        str: Hostname
+    """
+    name = pathlib.PurePath(filename).name
+    name = name.removesuffix(".gz")
+    for suffix in TEXT_SUFFIXES:
+        name = name.removesuffix(suffix)
+
+    return name
+
+
+def _decode(data: bytes, hostname: Optional[str]) -> str:
+    # legacy charsets are detected by the TLD of the hostname
+    return decode_raw_text(data, tld=get_tld(hostname))
+
+
+def _parse_ndjson_line(
+    line: bytes, *, text_field: str, hostname_field: Optional[str]
+) -> Optional[Item]:
+    line = line.strip()
+    if len(line) == 0:
+        return None
+
+    obj = json.loads(line)
+    if not isinstance(obj, dict):
+        raise ValueError("The line should be a JSON object")
+
+    raw_text = obj.get(text_field)
+    if not isinstance(raw_text, str):
+        raise ValueError(f"{text_field} should be a string")
+
+    hostname = obj.get(hostname_field) if hostname_field is not None else None
+    return raw_text, hostname
+
+
+def _iter_ndjson_lines(
+    lines: Iterable[bytes],
+    *,
+    text_field: str,
+    hostname_field: Optional[str],
+    name: str,
+    on_error: Optional[ErrorHandler] = None,
+) -> Iterator[Item]:
+    for line_number, line in enumerate(lines, start=1):
+        try:
+            item = _parse_ndjson_line(
+                line, text_field=text_field, hostname_field=hostname_field
+            )
+        except ValueError as e:
+            # JSONDecodeError and UnicodeDecodeError are ValueError as well
+            message = f"{name}:{line_number}: {type(e).__name__}: {e}"
+            if on_error is None:
+                raise ValueError(message) from e
+
+            on_error(message)
+            continue
+
+        if item is not None:
+            yield item
+
+
+def _iter_mmap_lines(path: PathLike) -> Iterator[bytes]:
+    with open(path, "rb") as f:
+        # mmap does not support an empty file
+        if pathlib.Path(path).stat().st_size == 0:
+            return
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            line = mm.readline()
+            while line:
+                yield line
+                line = mm.readline()
+
+
+def iter_text_file(path: PathLike, *, hostname: Optional[str] = None) -> Iterator[Item]:
+    """Read a whois record from a plain or a gzipped text file
+
+    Args:
+        path (PathLike): Path to a file
+        hostname (Optional[str], optional): Hostname. Inferred from the filename if it's None. Defaults to None.
+
+    Yields:
+        Iterator[Item]: A pair of a whois record and a hostname
+    """
+    path = pathlib.Path(path)
+    hostname = hostname or hostname_from_filename(path.name)
+
+    if path.suffix == ".gz":
+        with gzip.open(path, "rb") as f:
+            yield _decode(f.read(), hostname), hostname
+
+        return
+
+    # a record is decoded as a whole thus mmap would only copy it again
+    yield _decode(path.read_bytes(), hostname), hostname
+
+
+def iter_directory(path: PathLike, *, pattern: str = "*.txt") -> Iterator[Item]:
+    """Read whois records from files in a directory
+
+    Args:
+        path (PathLike): Path to a directory
+        pattern (str, optional): Glob pattern of files. Defaults to "*.txt".
+
+    Yields:
+        Iterator[Item]: Pairs of a whois record and a hostname inferred from the filename
+    """
+    for file_path in sorted(pathlib.Path(path).glob(pattern)):
+        if file_path.is_file():
+            yield from iter_text_file(file_path)
+
+
+def iter_ndjson(
+    source: Union[PathLike, IO[bytes]],
+    *,
+    text_field: str = "raw_text",
+    hostname_field: Optional[str] = "hostname",
+    on_error: Optional[ErrorHandler] = None,
+) -> Iterator[Item]:
+    """Read whois records from a NDJSON file (plain or gzipped) or a binary stream
+
+    Args:
+        source (Union[PathLike, IO[bytes]]): Path to a file or a binary stream
+        text_field (str, optional): Field of a whois record. Defaults to "raw_text".
+        hostname_field (Optional[str], optional): Field of a hostname. Defaults to "hostname".
+        on_error (Optional[ErrorHandler], optional): Called with an error message of an invalid line, which is skipped. Raise ValueError if it's None. Defaults to None.
+
+    Yields:
+        Iterator[Item]: Pairs of a whois record and a hostname
+    """
+    if not isinstance(source, (str, pathlib.Path)):
+        yield from _iter_ndjson_lines(
+            source,
+            text_field=text_field,
+            hostname_field=hostname_field,
+            name=getattr(source, "name", "<stream>"),
+            on_error=on_error,
+        )
+        return
+
+    path = pathlib.Path(source)
+    if path.suffix == ".gz":
+        with gzip.open(path, "rb") as f:
+            yield from _iter_ndjson_lines(
+                f,
+                text_field=text_field,
+                hostname_field=hostname_field,
+                name=str(path),
+                on_error=on_error,
+            )
+
+        return
+
+    yield from _iter_ndjson_lines(
+        _iter_mmap_lines(path),
+        text_field=text_field,
+        hostname_field=hostname_field,
+        name=str(path),
+        on_error=on_error,
+    )
+
+
+def iter_tar(
+    path: PathLike,
+    *,
+    text_field: str = "raw_text",
+    hostname_field: Optional[str] = "hostname",
+    on_error: Optional[ErrorHandler] = None,
+) -> Iterator[Item]:
+    """Read whois records from a (compressed) tar archive
+
+    Members are read one by one without extracting the archive.
+    A NDJSON member can contain multiple records and any other member is treated as a whois record.
+
+    Args:
+        path (PathLike): Path to an archive
+        text_field (str, optional): Field of a whois record in NDJSON members. Defaults to "raw_text".
+        hostname_field (Optional[str], optional): Field of a hostname in NDJSON members. Defaults to "hostname".
+        on_error (Optional[ErrorHandler], optional): Called with an error message of an invalid NDJSON line. Defaults to None.
+
+    Yields:
+        Iterator[Item]: Pairs of a whois record and a hostname
+    """
+    # "r|*" reads the archive as a stream with transparent decompression
+    with tarfile.open(path, mode="r|*") as tar:
+        for member in tar:
+            if not member.isfile():
+                continue
+
+            f = tar.extractfile(member)
+            if f is None:
+                continue
+
+            if member.name.endswith(NDJSON_SUFFIXES):
+                yield from _iter_ndjson_lines(
+                    f,
+                    text_field=text_field,
+                    hostname_field=hostname_field,
+                    name=f"{path}:{member.name}",
+                    on_error=on_error,
+                )
+                continue
+
+            hostname = hostname_from_filename(member.name)
+            yield _decode(f.read(), hostname), hostname
+
+
+def iter_stream(
+    stream: IO[bytes],
+    *,
+    input_format: str = "auto",
+    hostname: Optional[str] = None,
+    text_field: str = "raw_text",
+    hostname_field: Optional[str] = "hostname",
+    on_error: Optional[ErrorHandler] = None,
+) -> Iterator[Item]:
+    """Read whois records from a (gzipped) binary stream such as stdin
+
+    Args:
+        stream (IO[bytes]): Binary stream. A gzipped stream is detected by its magic number.
+        input_format (str, optional): "text" (the whole stream is a whois record), "ndjson" or "auto" (NDJSON if the stream starts with "{"). Defaults to "auto".
+        hostname (Optional[str], optional): Hostname of a whois record in text. Defaults to None.
+        text_field (str, optional): Field of a whois record in NDJSON. Defaults to "raw_text".
+        hostname_field (Optional[str], optional): Field of a hostname in NDJSON. Defaults to "hostname".
+        on_error (Optional[ErrorHandler], optional): Called with an error message of an invalid NDJSON line. Defaults to None.
+
+    Yields:
+        Iterator[Item]: Pairs of a whois record and a hostname
+    """
+    if input_format not in ("auto", "text", "ndjson"):
+        raise ValueError(f"{input_format} is not supported. Use auto, text or ndjson.")
+
+    # a buffered reader peeks the head of the stream without consuming it
+    reader: Any = (
+        stream if isinstance(stream, io.BufferedReader) else io.BufferedReader(stream)  # type: ignore[type-var]
+    )
+    if reader.peek(2)[:2] == GZIP_MAGIC:
+        reader = io.BufferedReader(gzip.GzipFile(fileobj=reader, mode="rb"))
+
+    if input_format == "auto":
+        input_format = "ndjson" if reader.peek(64).lstrip().startswith(b"{") else "text"
+
+    if input_format == "ndjson":
+        yield from _iter_ndjson_lines(
+            reader,
+            text_field=text_field,
+            hostname_field=hostname_field,
+            name=getattr(stream, "name", "<stream>"),
+            on_error=on_error,
+        )
+        return
+
+    yield _decode(reader.read(), hostname), hostname
+
+
+def iter_items(
+    source: PathLike,
+    *,
+    pattern: str = "*.txt",
+    text_field: str = "raw_text",
+    hostname_field: Optional[str] = "hostname",
+    on_error: Optional[ErrorHandler] = None,
+) -> Iterator[Item]:
+    """Read whois records lazily from a directory, a text file, a NDJSON file or a tar archive
+
+    Args:
+        source (PathLike): Path to a source
+        pattern (str, optional): Glob pattern of files in a directory. Defaults to "*.txt".
+        text_field (str, optional): Field of a whois record in NDJSON. Defaults to "raw_text".
+        hostname_field (Optional[str], optional): Field of a hostname in NDJSON. Defaults to "hostname".
+        on_error (Optional[ErrorHandler], optional): Called with an error message of an invalid NDJSON line. Defaults to None.
+
+    Yields:
+        Iterator[Item]: Pairs of a whois record and a hostname
+    """
+    path = pathlib.Path(source)
+    name = path.name
+
+    if path.is_dir():
+        yield from iter_directory(path, pattern=pattern)
+    elif name.endswith(TAR_SUFFIXES):
+        yield from iter_tar(
+            path,
+            text_field=text_field,
+            hostname_field=hostname_field,
+            on_error=on_error,
+        )
+    elif name.removesuffix(".gz").endswith(NDJSON_SUFFIXES):
+        yield from iter_ndjson(
+            path,
+            text_field=text_field,
+            hostname_field=hostname_field,
+            on_error=on_error,
+        )
+    else:
+        yield from iter_text_file(path)
+
+
+def parse_corpus(
+    source: PathLike,
+    *,
+    parser: Optional[WhoisParser] = None,
+    pattern: str = "*.txt",
+    text_field: str = "raw_text",
+    hostname_field: Optional[str] = "hostname",
+    fields: Optional[Iterable[str]] = None,
+    on_error: Optional[ErrorHandler] = None,
+) -> Iterator[dataclasses.WhoisRecord]:
+    """Parse whois records lazily from a source
+
+    Args:
+        source (PathLike): Path to a directory, a text file, a NDJSON file or a tar archive
+        parser (Optional[WhoisParser], optional): Parser. Defaults to None.
+        pattern (str, optional): Glob pattern of files in a directory. Defaults to "*.txt".
+        text_field (str, optional): Field of a whois record in NDJSON. Defaults to "raw_text".
+        hostname_field (Optional[str], optional): Field of a hostname in NDJSON. Defaults to "hostname".
+        fields (Optional[Iterable[str]], optional): Fields to parse. Defaults to None.
+        on_error (Optional[ErrorHandler], optional): Called with an error message of an invalid NDJSON line. Defaults to None.
+
+    Yields:
+        Iterator[dataclasses.WhoisRecord]: Parsed whois records
+    """
+    parser = parser or WhoisParser()
+    projection = validate_fields(fields)
+    for raw_text, hostname in iter_items(
+        source,
+        pattern=pattern,
+        text_field=text_field,
+        hostname_field=hostname_field,
+        on_error=on_error,
+    ):
+        yield parser.parse(raw_text, hostname=hostname, fields=projection)
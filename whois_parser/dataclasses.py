@@ -1,8 +1,104 @@
-from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Optional, Union
+from dataclasses import dataclass, field, fields
+from datetime import datetime, timezone
+from typing import Any, Callable, Optional, TypeVar, Union, cast
 
+T = TypeVar("T")
+ContactT = TypeVar("ContactT", bound="Contact")
 
+
+def with_slots(cls: type[T]) -> type[T]:
+    """Recreate a data class with __slots__ to drop the per-instance __dict__
+
+    It's an equivalent of dataclass(slots=True, weakref_slot=True) which is not available in Python 3.9.
+    Note that an instance can't have attributes other than fields. A subclass without __slots__
+    (e.g. LazyWhoisRecord) has __dict__ as usual.
+
+    Args:
+        cls (type[T]): Data class
+
+    Returns:
+        type[T]: Slotted data class
+    """
+    inherited = {
+        name for base in cls.__mro__[1:] for name in getattr(base, "__slots__", ())
+    }
+    names = tuple(f.name for f in fields(cls))  # type: ignore
+
+    namespace = dict(cls.__dict__)
+    for name in names:
+        # defaults are kept in the signature of __init__
+        namespace.pop(name, None)
+
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+    slots = tuple(name for name in names if name not in inherited)
+    # keep weak references working (a base which is slotted by this has the slot already)
+    if not any(hasattr(base, "__weakref__") for base in cls.__bases__):
+        slots += ("__weakref__",)
+
+    namespace["__slots__"] = slots
+
+    return cast(type[T], type(cls.__name__, cls.__bases__, namespace))
+
+
+def encode_datetime(value: Optional[Union[datetime, str]]) -> Optional[dict[str, str]]:
+    """Encode a date field into a JSON compatible dict tagged with its type
+
+    Args:
+        value (Optional[Union[datetime, str]]): Datetime or a string which could not be parsed
+
+    Returns:
+        Optional[dict[str, str]]: {"type": "datetime", "value": ISO 8601 string (, "tzname": name of the timezone)} or {"type": "string", "value": string}
+    """
+    if value is None:
+        return None
+
+    if isinstance(value, str):
+        return {"type": "string", "value": value}
+
+    encoded = {"type": "datetime", "value": value.isoformat()}
+    offset = value.utcoffset()
+    if offset is not None:
+        # keep a name of a timezone (e.g. "JST") which is lost by isoformat
+        tzname = value.tzname()
+        if tzname is not None and tzname != timezone(offset).tzname(None):
+            encoded["tzname"] = tzname
+
+    return encoded
+
+
+def decode_datetime(data: Optional[dict[str, str]]) -> Optional[Union[datetime, str]]:
+    """Decode a date field encoded by encode_datetime
+
+    Args:
+        data (Optional[dict[str, str]]): Encoded date field
+
+    Raises:
+        ValueError: Raised if the type is unknown
+
+    Returns:
+        Optional[Union[datetime, str]]: Datetime or string
+    """
+    if data is None:
+        return None
+
+    type_ = data.get("type")
+    if type_ == "string":
+        return data["value"]
+
+    if type_ != "datetime":
+        raise ValueError(f"Unknown type of a date field: {type_}")
+
+    value = datetime.fromisoformat(data["value"])
+    tzname = data.get("tzname")
+    offset = value.utcoffset()
+    if tzname is not None and offset is not None:
+        value = value.replace(tzinfo=timezone(offset, tzname))
+
+    return value
+
+
+@with_slots
 @dataclass
 class Contact:
     organization: Optional[str] = None
@@ -10,28 +106,57 @@ class Contact:
     name: Optional[str] = None
     telephone: Optional[str] = None
 
+    def to_dict(self) -> dict[str, Optional[str]]:
+        return {
+            "organization": self.organization,
+            "email": self.email,
+            "name": self.name,
+            "telephone": self.telephone,
+        }
+
+    @classmethod
+    def from_dict(cls: type[ContactT], data: dict[str, Any]) -> ContactT:
+        return cls(
+            organization=data.get("organization"),
+            email=data.get("email"),
+            name=data.get("name"),
+            telephone=data.get("telephone"),
+        )
+
 
+@with_slots
 @dataclass
 class Tech(Contact):
     pass
 
 
+@with_slots
 @dataclass
 class Registrant(Contact):
     pass
 
 
+@with_slots
 @dataclass
 class Admin(Contact):
     pass
 
 
+@with_slots
 @dataclass
 class Abuse:
     email: Optional[str] = None
     telephone: Optional[str] = None
 
+    def to_dict(self) -> dict[str, Optional[str]]:
+        return {"email": self.email, "telephone": self.telephone}
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Abuse":
+        return cls(email=data.get("email"), telephone=data.get("telephone"))
+
+
+@with_slots
 @dataclass
 class WhoisRecord:
     raw_text: str
@@ -52,3 +177,116 @@ class WhoisRecord:
     updated_at: Optional[Union[datetime, str]] = None
 
     is_rate_limited: bool = False
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the record into a JSON compatible dict
+
+        Dates are tagged with their types (see encode_datetime). It's faster than dataclasses.asdict.
+
+        Returns:
+            dict[str, Any]: Dict which can be converted back by from_dict
+        """
+        return {
+            "raw_text": self.raw_text,
+            "registrant": self.registrant.to_dict(),
+            "admin": self.admin.to_dict(),
+            "tech": self.tech.to_dict(),
+            "abuse": self.abuse.to_dict(),
+            "statuses": list(self.statuses),
+            "name_servers": list(self.name_servers),
+            "domain": self.domain,
+            "registrar": self.registrar,
+            "expires_at": encode_datetime(self.expires_at),
+            "registered_at": encode_datetime(self.registered_at),
+            "updated_at": encode_datetime(self.updated_at),
+            "is_rate_limited": self.is_rate_limited,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "WhoisRecord":
+        """Convert a dict made by to_dict into a record
+
+        Args:
+            data (dict[str, Any]): Dict. A missing field is a default value.
+
+        Returns:
+            WhoisRecord: Whois record
+        """
+        return WhoisRecord(
+            raw_text=data.get("raw_text", ""),
+            registrant=Registrant.from_dict(data.get("registrant") or {}),
+            admin=Admin.from_dict(data.get("admin") or {}),
+            tech=Tech.from_dict(data.get("tech") or {}),
+            abuse=Abuse.from_dict(data.get("abuse") or {}),
+            statuses=list(data.get("statuses") or []),
+            name_servers=list(data.get("name_servers") or []),
+            domain=data.get("domain"),
+            registrar=data.get("registrar"),
+            expires_at=decode_datetime(data.get("expires_at")),
+            registered_at=decode_datetime(data.get("registered_at")),
+            updated_at=decode_datetime(data.get("updated_at")),
+            is_rate_limited=data.get("is_rate_limited", False),
+        )
+
+
+class LazyField:
+    """A descriptor to evaluate a field of LazyWhoisRecord on first access"""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, instance: Optional["LazyWhoisRecord"], owner: type) -> Any:
+        if instance is None:
+            return self
+
+        value = instance._finders.pop(self.name)()
+        # cache the value in the instance dict which takes precedence over this descriptor
+        instance.__dict__[self.name] = value
+        return value
+
+
+class LazyWhoisRecord(WhoisRecord):
+    """A whois record whose fields are evaluated on first access and cached
+
+    It's compatible with WhoisRecord in terms of equality, repr, dataclasses.asdict and pickling
+    (they evaluate all the fields).
+    """
+
+    def __init__(self, raw_text: str, finders: dict[str, Callable[[], Any]]):
+        self.raw_text = raw_text
+        self._finders = finders
+
+    def evaluate(self) -> WhoisRecord:
+        """Evaluate all the fields and return them as a WhoisRecord
+
+        Returns:
+            WhoisRecord:
+        """
+        return WhoisRecord(*(getattr(self, f.name) for f in fields(WhoisRecord)))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, WhoisRecord):
+            return NotImplemented
+
+        return all(
+            getattr(self, f.name) == getattr(other, f.name) for f in fields(WhoisRecord)
+        )
+
+    def __reduce__(self):
+        return (WhoisRecord, tuple(getattr(self, f.name) for f in fields(WhoisRecord)))
+
+
+# shadow the fields (and their defaults) of WhoisRecord by the descriptors
+for _field in fields(WhoisRecord):
+    if _field.name != "raw_text":
+        setattr(LazyWhoisRecord, _field.name, LazyField(_field.name))
+
+
+@with_slots
+@dataclass
+class ParseResult:
+    # position of the item in the input
+    index: int
+    record: Optional[WhoisRecord] = None
+    # error message if the item could not be parsed
+    error: Optional[str] = None
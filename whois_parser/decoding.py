@@ -0,0 +1,51 @@
+from typing import Optional, Union
+
+from . import settings
+
+# a whois record in text or bytes (e.g. read from a socket)
+RawText = Union[str, bytes, bytearray, memoryview]
+
+# ISO-2022-JP (e.g. whois.jprs.jp) is 7-bit and switches to JIS X 0208 by an escape sequence
+ISO_2022_JP_ESCAPES = ("\x1b$@", "\x1b$B")
+# charsets tried after UTF-8 and legacy charsets of a TLD (Latin-1 is the last resort since it decodes any bytes)
+FALLBACK_CHARSETS = ("cp1252",)
+
+
+def _decode(data: Union[bytes, bytearray, memoryview], charset: str) -> Optional[str]:
+    try:
+        # str() decodes a buffer without copying it into bytes
+        return str(data, charset)
+    except UnicodeDecodeError:
+        return None
+
+
+def decode_raw_text(raw_text: RawText, *, tld: Optional[str] = None) -> str:
+    """Decode a whois record in bytes
+
+    Charsets are tried in order of UTF-8 (ISO-2022-JP if it has escape sequences), legacy charsets of
+    the TLD (settings.WHOIS_CHARSETS), cp1252 and Latin-1.
+
+    Args:
+        raw_text (RawText): Whois record. It's returned as it is if it's str.
+        tld (Optional[str], optional): TLD of the record. Defaults to None.
+
+    Returns:
+        str: Whois record
+    """
+    if isinstance(raw_text, str):
+        return raw_text
+
+    text = _decode(raw_text, "utf-8-sig")
+    if text is not None:
+        if any(escape in text for escape in ISO_2022_JP_ESCAPES):
+            return _decode(raw_text, "iso2022_jp") or text
+
+        return text
+
+    charsets = settings.WHOIS_CHARSETS.get(tld.lower(), ()) if tld is not None else ()
+    for charset in (*charsets, *FALLBACK_CHARSETS):
+        text = _decode(raw_text, charset)
+        if text is not None:
+            return text
+
+    return str(raw_text, "latin-1")
@@ -0,0 +1,232 @@
+from collections import OrderedDict
+from collections.abc import Hashable, Mapping
+from typing import Any, Optional
+
+from . import settings
+from .parsers import BaseParser
+from .parsers.abstract import find_last_section
+from .parsers.registry import ParserRegistry
+
+
+class SuffixTrie:
+    """A trie of domain suffixes (e.g. "jp" and "co.jp") keyed by labels from the right"""
+
+    def __init__(self, suffixes: Mapping[str, Any]):
+        """
+        Args:
+            suffixes (Mapping[str, Any]): Suffixes and their values
+        """
+        self._root: dict[str, Any] = {}
+        for suffix, value in suffixes.items():
+            node = self._root
+            for label in reversed(normalize_hostname(suffix).split(".")):
+                node = node.setdefault(label, {})
+
+            # "" is never a label of a normalized suffix
+            node[""] = value
+
+    def longest_match(self, hostname: str) -> Optional[tuple[str, Any]]:
+        """Find the longest suffix of a hostname
+
+        Args:
+            hostname (str): Hostname
+
+        Returns:
+            Optional[tuple[str, Any]]: Returns a pair of the suffix and its value. Returns None if nothing matched.
+        """
+        labels = normalize_hostname(hostname).split(".")
+
+        node = self._root
+        matched: Optional[tuple[str, Any]] = None
+        for depth, label in enumerate(reversed(labels), start=1):
+            child = node.get(label)
+            if child is None:
+                break
+
+            node = child
+            if "" in node:
+                matched = (".".join(labels[-depth:]), node[""])
+
+        return matched
+
+
+def normalize_hostname(hostname: str) -> str:
+    return hostname.strip().strip(".").lower()
+
+
+def get_tld(hostname: Optional[str]) -> Optional[str]:
+    if hostname is None:
+        return None
+
+    return hostname.split(".")[-1]
+
+
+def split_last_section(raw_text: str) -> tuple[Optional[str], str]:
+    """Split the last section of a whois record which is parsed (ref. normalize_raw_text)
+
+    Args:
+        raw_text (str): Whois record
+
+    Returns:
+        tuple[Optional[str], str]: Returns a pair of the comment line which starts the section (e.g. "# whois.jprs.jp") and the section. The comment is None if there is no such line.
+    """
+    index = find_last_section(raw_text)
+    if index is None:
+        return None, raw_text
+
+    end = raw_text.find("\n", index)
+    if end < 0:
+        return raw_text[index:].strip(), ""
+
+    return raw_text[index:end].strip(), raw_text[end + 1 :]
+
+
+class Dispatcher:
+    """A dispatcher which picks a parser of a whois record
+
+    A parser is picked by the longest suffix of a hostname in a parsers map (e.g. "co.jp" over "jp").
+    If there is no hostname, it's detected by FINGERPRINT_MARKERS of the parsers in the record.
+    Markers of a ParserRegistry are looked up without loading its parsers and only the detected one is loaded.
+    A suffix of a detected parser is cached per whois server (the comment line which starts the last section).
+
+    The trie and the caches follow changes of the map. A change of ParserRegistry is detected by its version
+    and any other mapping is checked by its length. Parsers are looked up from the map on each hit,
+    but use ParserRegistry (or set parsers_map again) to replace suffixes or markers of a mapping in place.
+    """
+
+    def __init__(
+        self,
+        parsers_map: Mapping[str, type[BaseParser]],
+        *,
+        max_detected: int = settings.DETECTED_PARSERS_CACHE_SIZE,
+    ):
+        """
+        Args:
+            parsers_map (Mapping[str, type[BaseParser]]): Suffixes and their parsers
+            max_detected (int, optional): Max number of whois servers whose detected parsers are cached. Defaults to settings.DETECTED_PARSERS_CACHE_SIZE.
+
+        Raises:
+            ValueError: Raised if max_detected is not positive
+        """
+        if max_detected < 1:
+            raise ValueError("max_detected should be positive")
+
+        self.parsers_map = parsers_map
+        self.max_detected = max_detected
+        self._version: Optional[Hashable] = None
+        self._trie: Optional[SuffixTrie] = None
+        self._markers: Optional[tuple[tuple[str, tuple[str, ...]], ...]] = None
+        self._detected: OrderedDict[str, str] = OrderedDict()
+
+    def __getstate__(self) -> dict:
+        # parsers are looked up again from the map (parsers compiled from specs are not picklable)
+        state = self.__dict__.copy()
+        state["_version"] = None
+        state["_trie"] = None
+        state["_markers"] = None
+        state["_detected"] = OrderedDict()
+        return state
+
+    def _get_version(self) -> Hashable:
+        if isinstance(self.parsers_map, ParserRegistry):
+            return self.parsers_map.version
+
+        # a cheap check not to copy the map on each lookup
+        return len(self.parsers_map)
+
+    def _refresh(self) -> None:
+        version = self._get_version()
+        if version == self._version:
+            return
+
+        self._version = version
+        self._trie = None
+        self._markers = None
+        self._detected.clear()
+
+    @property
+    def trie(self) -> SuffixTrie:
+        self._refresh()
+        if self._trie is None:
+            # values are suffixes not to import parsers of a lazy registry until they are hit
+            self._trie = SuffixTrie({suffix: suffix for suffix in self.parsers_map})
+
+        return self._trie
+
+    @property
+    def markers(self) -> tuple[tuple[str, tuple[str, ...]], ...]:
+        """Suffixes and FINGERPRINT_MARKERS of their parsers in order of the map without duplicates
+
+        Returns:
+            tuple[tuple[str, tuple[str, ...]], ...]: Pairs of a suffix and markers
+        """
+        self._refresh()
+        if self._markers is None:
+            markers: dict[tuple[str, ...], str] = {}
+            for suffix in self.parsers_map:
+                if isinstance(self.parsers_map, ParserRegistry):
+                    parser_markers = self.parsers_map.get_fingerprint_markers(suffix)
+                else:
+                    parser_markers = self.parsers_map[suffix].FINGERPRINT_MARKERS
+
+                if len(parser_markers) > 0:
+                    markers.setdefault(parser_markers, suffix)
+
+            self._markers = tuple(
+                (suffix, parser_markers) for parser_markers, suffix in markers.items()
+            )
+
+        return self._markers
+
+    def get_parser(
+        self, hostname: Optional[str], raw_text: str = ""
+    ) -> type[BaseParser]:
+        """Get a parser of a whois record
+
+        Args:
+            hostname (Optional[str]): Hostname
+            raw_text (str, optional): Whois record. Defaults to "".
+
+        Returns:
+            type[BaseParser]: Parser. Returns BaseParser if nothing matched.
+        """
+        if hostname is None:
+            return self.detect(raw_text)
+
+        matched = self.trie.longest_match(hostname)
+        if matched is None:
+            return BaseParser
+
+        return self.parsers_map[matched[1]]
+
+    def detect(self, raw_text: str) -> type[BaseParser]:
+        """Detect a parser by the content of a whois record
+
+        Args:
+            raw_text (str): Whois record
+
+        Returns:
+            type[BaseParser]: Parser. Returns BaseParser if nothing matched.
+        """
+        markers = self.markers
+        fingerprint, section = split_last_section(raw_text)
+        if fingerprint is not None:
+            cached = self._detected.get(fingerprint)
+            if cached is not None and cached in self.parsers_map:
+                self._detected.move_to_end(fingerprint)
+                return self.parsers_map[cached]
+
+            # lines of the section are stripped by normalize_raw_text before parsing
+            section = "\n".join(line.strip() for line in section.splitlines())
+
+        for suffix, parser_markers in markers:
+            if any(marker in section for marker in parser_markers):
+                # only a positive result is cached since an error response of a server (e.g. rate limit) has no marker
+                if fingerprint is not None:
+                    self._detected[fingerprint] = suffix
+                    if len(self._detected) > self.max_detected:
+                        self._detected.popitem(last=False)
+
+                return self.parsers_map[suffix]
+
+        return BaseParser
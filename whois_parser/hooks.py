@@ -0,0 +1,194 @@
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, NamedTuple, Optional
+
+# label of a record parsed without a hostname or a helper called outside of a finder
+UNKNOWN = "-"
+
+
+class FieldEvent(NamedTuple):
+    tld: Optional[str]
+    # class name of the parser
+    parser: str
+    field: str
+    # whether the field has a non-default value
+    found: bool
+    # seconds
+    elapsed: float
+
+
+class KeywordEvent(NamedTuple):
+    tld: Optional[str]
+    # class name of the parser
+    parser: str
+    # field being parsed. None if a helper is called outside of a finder
+    field: Optional[str]
+    # keyword or PyParsing expression tried
+    keyword: str
+    matched: bool
+    # seconds
+    elapsed: float
+
+
+class Hook:
+    """Base class of hooks which observe parsing
+
+    Hooks are called synchronously in the thread (and the process) which parses a record.
+    """
+
+    def on_field(self, event: FieldEvent) -> None:
+        """Called after a field is parsed
+
+        Args:
+            event (FieldEvent): Event
+        """
+
+    def on_keyword(self, event: KeywordEvent) -> None:
+        """Called after a keyword is tried by a _find* helper
+
+        Args:
+            event (KeywordEvent): Event
+        """
+
+
+class CallbackHook(Hook):
+    """A hook which calls plain callbacks"""
+
+    def __init__(
+        self,
+        *,
+        on_field: Optional[Callable[[FieldEvent], Any]] = None,
+        on_keyword: Optional[Callable[[KeywordEvent], Any]] = None,
+    ):
+        self._on_field = on_field
+        self._on_keyword = on_keyword
+
+    def on_field(self, event: FieldEvent) -> None:
+        if self._on_field is not None:
+            self._on_field(event)
+
+    def on_keyword(self, event: KeywordEvent) -> None:
+        if self._on_keyword is not None:
+            self._on_keyword(event)
+
+
+@dataclass
+class Cost:
+    calls: int = 0
+    # number of found fields or matched keywords
+    hits: int = 0
+    # seconds
+    total: float = 0.0
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.calls if self.calls > 0 else 0.0
+
+    def add(self, *, hit: bool, elapsed: float) -> None:
+        self.calls += 1
+        self.hits += int(hit)
+        self.total += elapsed
+
+
+class CostTable(Hook):
+    """A hook which aggregates costs per TLD and field (and keyword)"""
+
+    def __init__(self):
+        self.fields: dict[tuple[str, str], Cost] = {}
+        self.keywords: dict[tuple[str, str, str], Cost] = {}
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def on_field(self, event: FieldEvent) -> None:
+        key = (event.tld or UNKNOWN, event.field)
+        with self._lock:
+            cost = self.fields.get(key)
+            if cost is None:
+                cost = self.fields[key] = Cost()
+
+            cost.add(hit=event.found, elapsed=event.elapsed)
+
+    def on_keyword(self, event: KeywordEvent) -> None:
+        key = (event.tld or UNKNOWN, event.field or UNKNOWN, event.keyword)
+        with self._lock:
+            cost = self.keywords.get(key)
+            if cost is None:
+                cost = self.keywords[key] = Cost()
+
+            cost.add(hit=event.matched, elapsed=event.elapsed)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.fields.clear()
+            self.keywords.clear()
+
+    def rows(self) -> list[dict[str, Any]]:
+        """Return costs of fields from the most expensive one
+
+        Returns:
+            list[dict[str, Any]]: Rows of TLD, field, calls, hits, total and mean (seconds)
+        """
+        with self._lock:
+            items = list(self.fields.items())
+
+        return [
+            {
+                "tld": tld,
+                "field": field,
+                "calls": cost.calls,
+                "hits": cost.hits,
+                "total": cost.total,
+                "mean": cost.mean,
+            }
+            for (tld, field), cost in sorted(items, key=lambda item: -item[1].total)
+        ]
+
+    def keyword_rows(self) -> list[dict[str, Any]]:
+        """Return costs of keywords from the most expensive one
+
+        Returns:
+            list[dict[str, Any]]: Rows of TLD, field, keyword, calls, hits, total and mean (seconds)
+        """
+        with self._lock:
+            items = list(self.keywords.items())
+
+        return [
+            {
+                "tld": tld,
+                "field": field,
+                "keyword": keyword,
+                "calls": cost.calls,
+                "hits": cost.hits,
+                "total": cost.total,
+                "mean": cost.mean,
+            }
+            for (tld, field, keyword), cost in sorted(
+                items, key=lambda item: -item[1].total
+            )
+        ]
+
+    def format(self) -> str:
+        """Format costs of fields as a plain text table
+
+        Returns:
+            str: Table
+        """
+        lines = [
+            f"{'tld':<8}{'field':<16}{'calls':>8}{'hits':>8}{'total ms':>12}{'mean ms':>10}"
+        ]
+        for row in self.rows():
+            lines.append(
+                f"{row['tld']:<8}{row['field']:<16}{row['calls']:>8}{row['hits']:>8}"
+                f"{row['total'] * 1e3:>12.3f}{row['mean'] * 1e3:>10.3f}"
+            )
+
+        return "\n".join(lines)
@@ -0,0 +1,260 @@
+import difflib
+import string
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, Any, NamedTuple, Optional, Union
+
+from . import dataclasses
+from .dispatch import get_tld
+from .parsers import BaseParser
+from .parsers.abstract import FIELD_FINDERS
+from .parsers.classifier import classify
+from .parsers.index import KEY_WHITE_CHARS
+from .parsers.tracing import FieldTrace
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .parser import WhoisParser
+
+# characters of a line which can't be a part of a key or a value (a superset of whitespaces skipped by grammars)
+BLANK_CHARS = "".join(sorted(KEY_WHITE_CHARS | frozenset(string.whitespace)))
+# fields which don't depend on keywords (they are evaluated every time)
+ALWAYS_EVALUATED_FIELDS = ("is_rate_limited",)
+
+
+class FieldChange(NamedTuple):
+    field: str
+    old: Any
+    new: Any
+
+
+@dataclass
+class Snapshot:
+    """A parsed whois record with what's needed to re-parse its next version incrementally"""
+
+    record: dataclasses.WhoisRecord
+    parser: type[BaseParser]
+    # lines of the normalized raw text
+    lines: list[str] = field(default_factory=list)
+    # traces of fields. The next version is fully parsed if it's None (e.g. a rate limited response)
+    traces: Optional[dict[str, FieldTrace]] = None
+
+
+@dataclass
+class ReparseResult:
+    snapshot: Snapshot
+    # fields whose values changed
+    changes: list[FieldChange]
+    # fields which were evaluated (all the fields if the record was fully parsed)
+    evaluated: list[str]
+
+    @property
+    def record(self) -> dataclasses.WhoisRecord:
+        return self.snapshot.record
+
+
+def is_blank(line: str) -> bool:
+    return line.strip(BLANK_CHARS) == ""
+
+
+def diff_lines(old: Sequence[str], new: Sequence[str]) -> tuple[list[int], list[int]]:
+    """Diff two lists of lines
+
+    Args:
+        old (Sequence[str]): Old lines
+        new (Sequence[str]): New lines
+
+    Returns:
+        tuple[list[int], list[int]]: Returns a pair of indexes of removed / replaced old lines and inserted / replaced new lines
+    """
+    # common heads and tails are trimmed before matching since most lines don't change between versions
+    start = 0
+    limit = min(len(old), len(new))
+    while start < limit and old[start] == new[start]:
+        start += 1
+
+    old_end, new_end = len(old), len(new)
+    while old_end > start and new_end > start and old[old_end - 1] == new[new_end - 1]:
+        old_end -= 1
+        new_end -= 1
+
+    old_changed: list[int] = []
+    new_changed: list[int] = []
+    if start == old_end and start == new_end:
+        return old_changed, new_changed
+
+    matcher = difflib.SequenceMatcher(
+        None, old[start:old_end], new[start:new_end], autojunk=False
+    )
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag != "equal":
+            old_changed.extend(range(start + i1, start + i2))
+            new_changed.extend(range(start + j1, start + j2))
+
+    return old_changed, new_changed
+
+
+def get_affected_text(lines: Sequence[str], changed: Iterable[int]) -> str:
+    """Get lines whose keyword matches may be affected by changed lines
+
+    A match of a keyword on line i spans from the previous non-blank line (an indented key
+    matches only after an empty line) to the second non-blank line after it (a delimiter and
+    a value can follow blank lines). Thus a changed line c affects keywords from the second
+    non-blank line before c to the first non-blank line after c.
+
+    Args:
+        lines (Sequence[str]): Lines
+        changed (Iterable[int]): Indexes of changed lines
+
+    Returns:
+        str: Affected lines joined by newlines (tabs are expanded like PyParsing)
+    """
+    non_blanks = [index for index, line in enumerate(lines) if not is_blank(line)]
+
+    affected: set[int] = set()
+    for index in changed:
+        before = bisect_left(non_blanks, index)
+        start = non_blanks[before - 2] if before >= 2 else 0
+        after = bisect_right(non_blanks, index)
+        end = non_blanks[after] if after < len(non_blanks) else len(lines) - 1
+        affected.update(range(start, end + 1))
+
+    return "\n".join(lines[index].expandtabs() for index in sorted(affected))
+
+
+def copy_value(value: Any) -> Any:
+    # values of a record are shared by its next version
+    if isinstance(value, list):
+        return list(value)
+
+    if isinstance(value, (dataclasses.Contact, dataclasses.Abuse)):
+        return replace(value)
+
+    return value
+
+
+def get_changes(
+    old: dataclasses.WhoisRecord,
+    new: dataclasses.WhoisRecord,
+    fields: Iterable[str],
+) -> list[FieldChange]:
+    changes: list[FieldChange] = []
+    for name in fields:
+        old_value, new_value = getattr(old, name), getattr(new, name)
+        if old_value != new_value:
+            changes.append(FieldChange(name, old_value, new_value))
+
+    return changes
+
+
+def take_snapshot(
+    parser: "WhoisParser", raw_text: str, *, hostname: Optional[str] = None
+) -> Snapshot:
+    """Parse a whois record fully and take a snapshot of it
+
+    Args:
+        parser (WhoisParser): Parser
+        raw_text (str): Whois record
+        hostname (Optional[str], optional): Hostname. Defaults to None.
+
+    Returns:
+        Snapshot: Snapshot
+    """
+    tld = get_tld(hostname)
+    parser_class = parser.dispatcher.get_parser(hostname, raw_text)
+    if classify(raw_text) is not None:
+        # a response which can't contain data has no traces
+        record = parser_class.parse(raw_text, tld=tld)
+        return Snapshot(parser._compact(record), parser_class)
+
+    instance = parser_class(
+        raw_text,
+        use_index=parser.use_index,
+        hooks=parser.hooks,
+        tld=tld,
+        engine=parser.engine,
+    )
+    values, traces = instance._trace_fields(FIELD_FINDERS)
+    record = dataclasses.WhoisRecord(raw_text=raw_text, **values)
+    return Snapshot(
+        parser._compact(record),
+        parser_class,
+        instance._normalized_raw_text.split("\n"),
+        traces,
+    )
+
+
+def reparse(
+    parser: "WhoisParser",
+    previous: Union[Snapshot, dataclasses.WhoisRecord],
+    raw_text: str,
+    *,
+    hostname: Optional[str] = None,
+) -> ReparseResult:
+    """Parse a new version of a whois record re-evaluating only fields affected by changed lines
+
+    Normalized lines of the versions are diffed and a field is re-evaluated only if one of the keywords
+    looked up by its finder occurs around a changed line. Other fields are taken from the previous version.
+    The record is fully parsed if the previous version is a WhoisRecord (only changes are detected),
+    it was parsed by another parser or either version can't contain data (e.g. rate limited).
+
+    Args:
+        parser (WhoisParser): Parser
+        previous (Union[Snapshot, dataclasses.WhoisRecord]): Previous version
+        raw_text (str): Whois record
+        hostname (Optional[str], optional): Hostname. Defaults to None.
+
+    Returns:
+        ReparseResult: Snapshot of the new version and changed fields
+    """
+    parser_class = parser.dispatcher.get_parser(hostname, raw_text)
+    if (
+        not isinstance(previous, Snapshot)
+        or previous.parser is not parser_class
+        or previous.traces is None
+        or classify(raw_text) is not None
+    ):
+        snapshot = take_snapshot(parser, raw_text, hostname=hostname)
+        old = previous.record if isinstance(previous, Snapshot) else previous
+        return ReparseResult(
+            snapshot,
+            get_changes(old, snapshot.record, FIELD_FINDERS),
+            list(FIELD_FINDERS),
+        )
+
+    instance = parser_class(
+        raw_text,
+        use_index=parser.use_index,
+        hooks=parser.hooks,
+        tld=get_tld(hostname),
+        engine=parser.engine,
+    )
+    lines = instance._normalized_raw_text.split("\n")
+
+    old_changed, new_changed = diff_lines(previous.lines, lines)
+    text = "\n".join(
+        [
+            get_affected_text(previous.lines, old_changed),
+            get_affected_text(lines, new_changed),
+        ]
+    )
+    upper_text = text.upper()
+    is_changed = len(old_changed) > 0 or len(new_changed) > 0
+    evaluated = [
+        name
+        for name in FIELD_FINDERS
+        if name in ALWAYS_EVALUATED_FIELDS
+        or (is_changed and previous.traces[name].occurs_in(text, upper_text))
+    ]
+
+    values, traces = instance._trace_fields(evaluated)
+    for name in FIELD_FINDERS:
+        if name not in values:
+            values[name] = copy_value(getattr(previous.record, name))
+            traces[name] = previous.traces[name]
+
+    record = dataclasses.WhoisRecord(raw_text=raw_text, **values)
+    snapshot = Snapshot(parser._compact(record), parser_class, lines, traces)
+    return ReparseResult(
+        snapshot, get_changes(previous.record, snapshot.record, evaluated), evaluated
+    )
@@ -1,24 +1,47 @@
-from typing import Optional
-
-from whois_parser.parsers.be import BeParser
-from whois_parser.parsers.uk import UkParser
+from collections.abc import AsyncIterator, Iterable, Iterator, Mapping, Sequence
+from typing import TYPE_CHECKING, Optional, Union
 
+from . import compact as compact_module
 from . import dataclasses
-from .parsers import BaseParser, JpParser
+from .decoding import RawText, decode_raw_text
+from .dispatch import Dispatcher, get_tld
+from .hooks import Hook
+from .parsers import BaseParser
+from .parsers.abstract import validate_fields
+from .parsers.engines import get_engine_class
+from .parsers.registry import ParserRegistry
+
+# modules for batches and asyncio are imported on first use not to slow down "import whois_parser"
+if TYPE_CHECKING:  # pragma: no cover
+    from concurrent.futures import Executor
+
+    from .cache import ResultCache
+    from .columnar import RecordColumns
+    from .incremental import ReparseResult, Snapshot
+    from .server import WhoisServer
 
-PARSERS_MAP: dict[str, type[BaseParser]] = {
-    "jp": JpParser,
-    "uk": UkParser,
-    "be": BeParser,
-}
+# parsers are imported on the first hit of their suffixes.
+# FINGERPRINT_MARKERS (see the specs of the parsers) detect a parser of a record without a hostname.
+PARSERS_MAP: ParserRegistry = ParserRegistry(
+    {
+        "jp": "whois_parser.parsers.jp:JpParser",
+        "uk": "whois_parser.parsers.uk:UkParser",
+        "be": "whois_parser.parsers.be:BeParser",
+    },
+    fingerprint_markers={
+        "jp": ["[ドメイン名]", "[Domain Name]"],
+        "uk": ["Domain name:\n"],
+        "be": ["Registrar:\nName:"],
+    },
+)
 
 
-def get_default_parsers_map() -> dict[str, type[BaseParser]]:
+def get_default_parsers_map() -> Mapping[str, type[BaseParser]]:
     return PARSERS_MAP
 
 
 def get_parser(
-    tld: Optional[str], parsers_map: dict[str, type[BaseParser]]
+    tld: Optional[str], parsers_map: Mapping[str, type[BaseParser]]
 ) -> type[BaseParser]:
     if tld is None:
         return BaseParser
@@ -27,24 +50,289 @@ def get_parser(
 
 
 class WhoisParser:
-    def __init__(self, parsers_map: dict[str, type[BaseParser]] = PARSERS_MAP):
+    def __init__(
+        self,
+        parsers_map: Mapping[str, type[BaseParser]] = PARSERS_MAP,
+        *,
+        use_index: bool = False,
+        lazy: bool = False,
+        raw_text_mode: str = "keep",
+        compact: bool = False,
+        hooks: Sequence[Hook] = (),
+        engine: str = "pyparsing",
+        cache: Optional["ResultCache"] = None,
+    ):
+        """
+        Args:
+            parsers_map (Mapping[str, type[BaseParser]], optional): Domain suffixes (e.g. "jp" or "co.jp") and their parsers. The longest suffix of a hostname is used. Defaults to PARSERS_MAP.
+            use_index (bool, optional): Whether to resolve keywords by a line index or not. Defaults to False.
+            lazy (bool, optional): Whether to evaluate fields on first access or not. Defaults to False.
+            raw_text_mode (str, optional): How to retain raw text of a record. "keep", "drop" or "digest". Defaults to "keep".
+            compact (bool, optional): Whether to share empty contacts and intern repeated strings of records or not. Shared contacts are read-only (FrozenInstanceError is raised on a change) thus replace a contact (e.g. record.registrant = Registrant(name=...)) to change it. Defaults to False.
+            hooks (Sequence[Hook], optional): Hooks to observe parsing (e.g. CostTable). Note that hooks are called in worker processes by parse_many with workers. Defaults to ().
+            engine (str, optional): Matching engine of keyword lookups. "pyparsing" or "regex" (precompiled regexes which return the same results). Defaults to "pyparsing".
+            cache (Optional[ResultCache], optional): Cache of parsed records. Hooks are not called for a cached record. Defaults to None.
+        """
+        get_engine_class(engine)
+        compact_module.validate_raw_text_mode(raw_text_mode)
+        if lazy and (compact or raw_text_mode != "keep"):
+            raise ValueError("lazy can't be combined with compact or raw_text_mode")
+
+        if lazy and cache is not None:
+            raise ValueError("lazy can't be combined with cache")
+
         self.parsers_map = parsers_map
+        self.use_index = use_index
+        self.lazy = lazy
+        self.raw_text_mode = raw_text_mode
+        self.compact = compact
+        self.hooks = tuple(hooks)
+        self.engine = engine
+        self.cache = cache
+
+    @property
+    def parsers_map(self) -> Mapping[str, type[BaseParser]]:
+        return self.dispatcher.parsers_map
+
+    @parsers_map.setter
+    def parsers_map(self, parsers_map: Mapping[str, type[BaseParser]]) -> None:
+        self.dispatcher = Dispatcher(parsers_map)
 
     def parse(
-        self, raw_text: str, *, hostname: Optional[str] = None
+        self,
+        raw_text: RawText,
+        *,
+        hostname: Optional[str] = None,
+        fields: Optional[Iterable[str]] = None,
     ) -> dataclasses.WhoisRecord:
         """Parse a whois record and return it as a data class object
 
+        Args:
+            raw_text (RawText): Whois record. Bytes are decoded by decode_raw_text with the TLD of the hostname.
+            hostname (Optional[str], optional): Hostname. A parser is detected by the content of the record if it's None. Defaults to None.
+            fields (Optional[Iterable[str]], optional): Fields to parse. Other fields are left as default values. Parse all the fields if it's None. Defaults to None.
+
+        Returns:
+            dataclasses.WhoisRecord:
+        """
+        tld = get_tld(hostname)
+        raw_text = decode_raw_text(raw_text, tld=tld)
+        parser = self.dispatcher.get_parser(hostname, raw_text)
+
+        key: Optional[str] = None
+        record: Optional[dataclasses.WhoisRecord] = None
+        if self.cache is not None:
+            fields = validate_fields(fields)
+            key = self.cache.make_key(parser, raw_text, fields)
+            record = self.cache.get(key)
+            if record is not None:
+                record.raw_text = raw_text
+
+        if record is None:
+            record = parser.parse(
+                raw_text,
+                use_index=self.use_index,
+                lazy=self.lazy,
+                fields=fields,
+                hooks=self.hooks,
+                tld=tld,
+                engine=self.engine,
+            )
+            if key is not None and self.cache is not None:
+                self.cache.set(key, record)
+
+        return self._compact(record)
+
+    def _compact(self, record: dataclasses.WhoisRecord) -> dataclasses.WhoisRecord:
+        if self.raw_text_mode == "keep" and not self.compact:
+            return record
+
+        return compact_module.compact_record(
+            record, raw_text_mode=self.raw_text_mode, share_contacts=self.compact
+        )
+
+    def snapshot(self, raw_text: str, *, hostname: Optional[str] = None) -> "Snapshot":
+        """Parse a whois record and take a snapshot of it to re-parse its next version incrementally
+
+        Args:
+            raw_text (str): Whois record
+            hostname (Optional[str], optional): Hostname. Defaults to None.
+
+        Returns:
+            Snapshot: Snapshot. The record is evaluated eagerly and not cached.
+        """
+        from . import incremental
+
+        return incremental.take_snapshot(self, raw_text, hostname=hostname)
+
+    def reparse(
+        self,
+        previous: Union["Snapshot", dataclasses.WhoisRecord],
+        raw_text: str,
+        *,
+        hostname: Optional[str] = None,
+    ) -> "ReparseResult":
+        """Parse a new version of a whois record re-evaluating only fields affected by changed lines
+
+        Args:
+            previous (Union[Snapshot, dataclasses.WhoisRecord]): Snapshot of the previous version. The new version is fully parsed if it's a WhoisRecord.
+            raw_text (str): Whois record
+            hostname (Optional[str], optional): Hostname. Defaults to None.
+
+        Returns:
+            ReparseResult: Snapshot of the new version and a change set of fields
+        """
+        from . import incremental
+
+        return incremental.reparse(self, previous, raw_text, hostname=hostname)
+
+    def parse_many(
+        self,
+        items: Iterable[tuple[str, Optional[str]]],
+        *,
+        workers: Optional[int] = None,
+        chunksize: int = 64,
+        ordered: bool = True,
+        fields: Optional[Iterable[str]] = None,
+    ) -> Iterator[dataclasses.ParseResult]:
+        """Parse whois records in parallel
+
+        Args:
+            items (Iterable[tuple[str, Optional[str]]]): Pairs of a whois record and a hostname
+            workers (Optional[int], optional): Number of worker processes. Parse records in the current process if it's None or 1. Defaults to None.
+            chunksize (int, optional): Number of records sent to a worker at once. Defaults to 64.
+            ordered (bool, optional): Whether to yield results in order of the input or as completed. Defaults to True.
+            fields (Optional[Iterable[str]], optional): Fields to parse. Defaults to None.
+
+        Returns:
+            Iterator[dataclasses.ParseResult]: Parse results. An error is set to a result instead of raising it.
+        """
+        from . import batch
+
+        return batch.parse_many(
+            self,
+            items,
+            workers=workers,
+            chunksize=chunksize,
+            ordered=ordered,
+            fields=fields,
+        )
+
+    def parse_columns(
+        self,
+        items: Iterable[tuple[str, Optional[str]]],
+        *,
+        workers: Optional[int] = None,
+        chunksize: int = 64,
+        fields: Optional[Iterable[str]] = None,
+    ) -> "RecordColumns":
+        """Parse whois records into columns for analytics (see RecordColumns.to_numpy)
+
+        Args:
+            items (Iterable[tuple[str, Optional[str]]]): Pairs of a whois record and a hostname
+            workers (Optional[int], optional): Number of worker processes. Defaults to None.
+            chunksize (int, optional): Number of records sent to a worker at once. Defaults to 64.
+            fields (Optional[Iterable[str]], optional): Fields to parse and store. Defaults to None.
+
+        Returns:
+            RecordColumns: Columns in order of the input
+        """
+        from . import columnar
+
+        return columnar.parse_columns(
+            self, items, workers=workers, chunksize=chunksize, fields=fields
+        )
+
+    async def aparse(
+        self,
+        raw_text: str,
+        *,
+        hostname: Optional[str] = None,
+        executor: Optional["Executor"] = None,
+        fields: Optional[Iterable[str]] = None,
+    ) -> dataclasses.WhoisRecord:
+        """Parse a whois record in an executor without blocking the event loop
+
         Args:
             raw_text (str): Whois record
             hostname (Optional[str], optional): Defaults to None.
+            executor (Optional[Executor], optional): Executor. Use the default executor of the loop if it's None. Defaults to None.
+            fields (Optional[Iterable[str]], optional): Fields to parse. Defaults to None.
 
         Returns:
             dataclasses.WhoisRecord:
         """
-        tld: Optional[str] = None
-        if hostname is not None:
-            tld = hostname.split(".")[-1]
+        from . import aio
+
+        return await aio.aparse(
+            self, raw_text, hostname=hostname, executor=executor, fields=fields
+        )
+
+    def aparse_many(
+        self,
+        items: Iterable[tuple[str, Optional[str]]],
+        *,
+        executor: Optional["Executor"] = None,
+        concurrency: int = 16,
+        ordered: bool = True,
+        fields: Optional[Iterable[str]] = None,
+    ) -> AsyncIterator[dataclasses.ParseResult]:
+        """Parse whois records in an executor with bounded concurrency
+
+        Args:
+            items (Iterable[tuple[str, Optional[str]]]): Pairs of a whois record and a hostname
+            executor (Optional[Executor], optional): Executor. Use the default executor of the loop if it's None. Defaults to None.
+            concurrency (int, optional): Max number of records submitted to the executor at once. Defaults to 16.
+            ordered (bool, optional): Whether to yield results in order of the input or as completed. Defaults to True.
+            fields (Optional[Iterable[str]], optional): Fields to parse. Defaults to None.
+
+        Returns:
+            AsyncIterator[dataclasses.ParseResult]: Parse results. Queued work is cancelled when the iteration is cancelled or closed.
+        """
+        from . import aio
+
+        return aio.aparse_many(
+            self,
+            items,
+            executor=executor,
+            concurrency=concurrency,
+            ordered=ordered,
+            fields=fields,
+        )
+
+    def create_executor(
+        self, *, kind: str = "thread", max_workers: Optional[int] = None
+    ) -> "Executor":
+        """Create an executor for aparse / aparse_many whose workers are warmed up
+
+        Args:
+            kind (str, optional): "thread" or "process". Defaults to "thread".
+            max_workers (Optional[int], optional): Max number of workers. Defaults to None.
+
+        Returns:
+            Executor:
+        """
+        from . import aio
+
+        return aio.create_executor(self, kind=kind, max_workers=max_workers)
+
+    def create_server(
+        self,
+        *,
+        kind: str = "process",
+        workers: Optional[int] = None,
+        concurrency: int = 64,
+    ) -> "WhoisServer":
+        """Create a local daemon which serves parse requests of NDJSON by warmed workers
+
+        Args:
+            kind (str, optional): Kind of workers. "thread" or "process". Defaults to "process".
+            workers (Optional[int], optional): Number of workers. Defaults to None.
+            concurrency (int, optional): Max number of records submitted to workers at once. Defaults to 64.
+
+        Returns:
+            WhoisServer: Server. Start it by start_unix / start_http in an async with block.
+        """
+        from .server import WhoisServer
 
-        parser = get_parser(tld, parsers_map=self.parsers_map)
-        return parser.parse(raw_text)
+        return WhoisServer(self, kind=kind, workers=workers, concurrency=concurrency)
@@ -1,4 +1,19 @@
+import importlib
+from typing import Any
+
 from .base import BaseParser  # noqa
-from .be import BeParser  # noqa
-from .jp import JpParser  # noqa
-from .uk import UkParser  # noqa
+
+# parsers of ccTLDs are imported on first access
+LAZY_PARSERS: dict[str, str] = {
+    "BeParser": ".be",
+    "JpParser": ".jp",
+    "UkParser": ".uk",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = LAZY_PARSERS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    return getattr(importlib.import_module(module, __name__), name)
@@ -1,87 +1,404 @@
+import functools
+import time
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Sequence
 from datetime import datetime
-from typing import Optional, Union
+from typing import Any, Callable, ClassVar, Optional, TypeVar, Union, cast
 
 from pyparsing import ParserElement
 
-from .. import dataclasses, settings
+from .. import dataclasses
+from ..hooks import FieldEvent, Hook, KeywordEvent
+from .classifier import RATE_LIMITED, classify, is_rate_limited
 from .constants import ANY_CHARACTERS, DEILIMITER, SPACE_OR_TAB
-from .utils import build_common_prefix_pattern, find, find_all, parse_datetime
+from .dates import NO_HINTS, DateHints
+from .engines import Engine, get_engine_class
+from .grammars import GrammarRegistry, KeywordLookup
+from .index import LineIndex
+from .scanner import get_keyword_scanner
+from .spec import ParserSpec, install_spec
+from .tracing import FieldTrace
+from .utils import (  # noqa: F401
+    LINE_BOUNDARIES,
+    build_common_prefix_pattern,
+    find,
+    find_all,
+    find_last_section,
+    parse_datetime,
+)
+
+T = TypeVar("T")
 
 
 def normalize_raw_text(raw_text: str) -> str:
     """Normalize raw text
 
+    Only the lines of the last section are split and stripped. Others are not copied.
+
     Args:
         raw_text (str): whois record in plain text
 
     Returns:
         str: Returns whois record without the whois server section
     """
-    reversed_lines = raw_text.splitlines()
-    reversed_lines.reverse()
-
-    # find first comment which starts with "#"
-    sharp_index: Optional[int] = None
-    for index in range(len(reversed_lines)):
-        line = reversed_lines[index]
-        if line.startswith("#"):
-            sharp_index = index + 1
-            break
-
-    if sharp_index is None:
+    start = find_last_section(raw_text)
+    if start is None:
         return raw_text
 
-    lines: list[str] = []
-    for line in reversed_lines[:sharp_index]:
-        lines.append(line.strip())
+    return "\n".join(line.strip() for line in raw_text[start:].splitlines())
+
+
+def build_grammar(
+    prefix: ParserElement,
+    delimiter: Optional[ParserElement],
+    target: ParserElement,
+) -> ParserElement:
+    """Build a grammar which captures the target as "value"
+
+    Args:
+        prefix (ParserElement): Prefix
+        delimiter (Optional[ParserElement]): Delimiter between the prefix and the target
+        target (ParserElement): Target
+
+    Returns:
+        ParserElement: Grammar
+    """
+    grammar = prefix
+    if delimiter is not None:
+        grammar += delimiter
+    grammar += target("value")
+    return grammar
+
+
+def build_keyword_grammar(lookup: KeywordLookup) -> ParserElement:
+    """Build a grammar from a keyword lookup
+
+    Args:
+        lookup (KeywordLookup): Keyword lookup
+
+    Returns:
+        ParserElement: Grammar
+    """
+    prefix = build_common_prefix_pattern(
+        lookup.keyword,
+        is_case_sensitive=lookup.is_case_sensitive,
+        is_line_start_sensitive=lookup.is_line_start_sensitive,
+        delimiter=lookup.delimiter,
+    )
+    # a prefix without a delimiter consumes trailing whitespaces by itself
+    delimiter = SPACE_OR_TAB if lookup.delimiter is not None else None
+    return build_grammar(prefix, delimiter, ANY_CHARACTERS)
+
+
+# fields of WhoisRecord and methods to find them
+FIELD_FINDERS: dict[str, str] = {
+    "abuse": "_find_abuse",
+    "admin": "_find_admin",
+    "domain": "_find_domain",
+    "expires_at": "_find_expires_at",
+    "name_servers": "_find_name_servers",
+    "registered_at": "_find_registered_at",
+    "registrant": "_find_registrant",
+    "registrar": "_find_registrar",
+    "statuses": "_find_statuses",
+    "tech": "_find_tech",
+    "updated_at": "_find_updated_at",
+    "is_rate_limited": "_is_rate_limited",
+}
+
+# default values of fields which are not parsed
+FIELD_DEFAULTS: dict[str, Callable[[], Any]] = {
+    "abuse": dataclasses.Abuse,
+    "admin": dataclasses.Admin,
+    "domain": lambda: None,
+    "expires_at": lambda: None,
+    "name_servers": list,
+    "registered_at": lambda: None,
+    "registrant": dataclasses.Registrant,
+    "registrar": lambda: None,
+    "statuses": list,
+    "tech": dataclasses.Tech,
+    "updated_at": lambda: None,
+    "is_rate_limited": lambda: False,
+}
+
+
+def validate_fields(fields: Optional[Iterable[str]]) -> Optional[frozenset[str]]:
+    """Validate a projection of fields
+
+    Args:
+        fields (Optional[Iterable[str]]): Field names of WhoisRecord
+
+    Raises:
+        ValueError: Raised if there is an unknown field
+
+    Returns:
+        Optional[frozenset[str]]: Field names to parse
+    """
+    if fields is None:
+        return None
 
-    # revert reversed lines
-    lines.reverse()
+    projection = frozenset(fields) - {"raw_text"}
+    unknown = projection - FIELD_FINDERS.keys()
+    if len(unknown) > 0:
+        raise ValueError(
+            f"Unknown fields: {', '.join(sorted(unknown))}. Available fields are {', '.join(FIELD_FINDERS.keys())}."
+        )
 
-    return "\n".join(lines)
+    return projection
 
 
 class AbstractParser(ABC):
-    def __init__(self, raw_text: str):
+    # compiled grammars are shared by all the instances of a parser class
+    grammars: ClassVar[GrammarRegistry] = GrammarRegistry()
+    # substrings which identify the format of a record (used to detect a parser without a hostname)
+    FINGERPRINT_MARKERS: ClassVar[tuple[str, ...]] = ()
+    # a declarative definition of finders which are generated when a subclass is defined
+    SPEC: ClassVar[Optional[ParserSpec]] = None
+    # keywords (upper cased if case insensitive) of the specs which are scanned at once per record
+    SCAN_KEYWORDS: ClassVar[dict[bool, frozenset[str]]] = {}
+    # expected formats of date strings passed to parse_datetime
+    DATE_HINTS: ClassVar[DateHints] = NO_HINTS
+
+    def __init_subclass__(cls, **kwargs: Any):
+        super().__init_subclass__(**kwargs)
+        cls.grammars = GrammarRegistry()
+
+        spec = cls.__dict__.get("SPEC")
+        if spec is not None:
+            install_spec(cls, spec)
+
+    def __init__(
+        self,
+        raw_text: str,
+        *,
+        use_index: bool = False,
+        hooks: Sequence[Hook] = (),
+        tld: Optional[str] = None,
+        engine: str = "pyparsing",
+    ):
         self.raw_text: str = raw_text
         self._normalized_raw_text: str = normalize_raw_text(raw_text)
 
+        self.use_index: bool = use_index
+        self._line_indexes: dict[str, LineIndex] = {}
+
+        self._scan_texts: dict[bool, str] = {}
+        self._present_keywords: dict[bool, frozenset[str]] = {}
+
+        self.engine: Engine = get_engine_class(engine)(
+            self._normalized_raw_text, self._get_keyword_grammar
+        )
+
+        self.hooks: tuple[Hook, ...] = tuple(hooks)
+        self.tld: Optional[str] = tld
+        # field being parsed (only tracked when hooks are set)
+        self._field: Optional[str] = None
+        # trace of the field being parsed (only tracked by _trace_fields)
+        self._trace: Optional[FieldTrace] = None
+
     @classmethod
-    def parse(cls, raw_text: str) -> dataclasses.WhoisRecord:
+    def warm_up(cls) -> int:
+        """Compile all the grammars used by the parser in advance
+
+        Returns:
+            int: Number of compiled grammars in the registry
+        """
+        cls("")._parse()
+        return len(cls.grammars)
+
+    @classmethod
+    def parse(
+        cls,
+        raw_text: str,
+        *,
+        use_index: bool = False,
+        lazy: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        hooks: Sequence[Hook] = (),
+        tld: Optional[str] = None,
+        engine: str = "pyparsing",
+    ) -> dataclasses.WhoisRecord:
         """Parse a whois record and return it as a data class object
 
         Args:
             raw_text (str): Whois record
+            use_index (bool, optional): Whether to resolve keywords by a line index or not. Defaults to False.
+            lazy (bool, optional): Whether to evaluate fields on first access or not. Defaults to False.
+            fields (Optional[Iterable[str]], optional): Fields to parse. Other fields are left as default values. Parse all the fields if it's None. Defaults to None.
+            hooks (Sequence[Hook], optional): Hooks to observe parsing. Defaults to ().
+            tld (Optional[str], optional): TLD of the record passed to hooks. Defaults to None.
+            engine (str, optional): Matching engine of keyword lookups ("pyparsing" or "regex"). Defaults to "pyparsing".
 
         Returns:
             dataclasses.WhoisRecord: Parsed whois record
         """
-        instance = cls(raw_text)
-        return instance._parse()
+        projection = validate_fields(fields)
+
+        # a response which can't contain data is returned as it is without running finders
+        kind = classify(raw_text)
+        if kind is not None:
+            return cls._build_empty_record(raw_text, projection, kind=kind)
+
+        instance = cls(
+            raw_text, use_index=use_index, hooks=hooks, tld=tld, engine=engine
+        )
+        if lazy:
+            return instance._parse_lazy(projection)
+
+        return instance._parse(projection)
+
+    @staticmethod
+    def _build_empty_record(
+        raw_text: str, fields: Optional[frozenset[str]], *, kind: str
+    ) -> dataclasses.WhoisRecord:
+        """Build a record of a response which can't contain data
+
+        Args:
+            raw_text (str): Whois record
+            fields (Optional[frozenset[str]]): Fields to parse
+            kind (str): Kind of the response ("empty", "rate_limited" or "not_found")
+
+        Returns:
+            dataclasses.WhoisRecord: Whois record whose fields are default values
+        """
+        values = {field: default() for field, default in FIELD_DEFAULTS.items()}
+        if fields is None or "is_rate_limited" in fields:
+            values["is_rate_limited"] = kind == RATE_LIMITED
+
+        return dataclasses.WhoisRecord(raw_text=raw_text, **values)
+
+    def _get_finders(
+        self, fields: Optional[frozenset[str]] = None
+    ) -> dict[str, Callable[[], Any]]:
+        """Get finders of the fields of WhoisRecord
+
+        Args:
+            fields (Optional[frozenset[str]], optional): Fields to parse. A field which is not included returns a default value. Defaults to None.
+
+        Returns:
+            dict[str, Callable[[], Any]]: Field names and their finders
+        """
+        finders: dict[str, Callable[[], Any]] = {}
+        for field, name in FIELD_FINDERS.items():
+            if fields is not None and field not in fields:
+                finders[field] = FIELD_DEFAULTS[field]
+            elif len(self.hooks) > 0:
+                finders[field] = functools.partial(
+                    self._observe_field, field, getattr(self, name)
+                )
+            else:
+                finders[field] = getattr(self, name)
+
+        return finders
+
+    def _observe_field(self, field: str, finder: Callable[[], T]) -> T:
+        """Call a finder and notify hooks of it
+
+        Args:
+            field (str): Field name
+            finder (Callable[[], T]): Finder
+
+        Returns:
+            T: Value of the field
+        """
+        self._field = field
+        started = time.perf_counter()
+        value = finder()
+        elapsed = time.perf_counter() - started
+        self._field = None
+
+        event = FieldEvent(
+            tld=self.tld,
+            parser=type(self).__name__,
+            field=field,
+            found=value != FIELD_DEFAULTS[field](),
+            elapsed=elapsed,
+        )
+        for hook in self.hooks:
+            hook.on_field(event)
+
+        return value
+
+    def _observe_keyword(self, keyword: str, find: Callable[[], T]) -> T:
+        """Try a keyword and notify hooks of it
+
+        Args:
+            keyword (str): Keyword or PyParsing expression
+            find (Callable[[], T]): Function to find the keyword
+
+        Returns:
+            T: Matched text(s)
+        """
+        started = time.perf_counter()
+        value = find()
+        elapsed = time.perf_counter() - started
+
+        event = KeywordEvent(
+            tld=self.tld,
+            parser=type(self).__name__,
+            field=self._field,
+            keyword=keyword,
+            matched=value is not None and value != [],
+            elapsed=elapsed,
+        )
+        for hook in self.hooks:
+            hook.on_keyword(event)
+
+        return value
 
-    def _parse(self) -> dataclasses.WhoisRecord:
+    def _parse(
+        self, fields: Optional[frozenset[str]] = None
+    ) -> dataclasses.WhoisRecord:
         """Parse a whois record and return it as a data class object
 
+        Args:
+            fields (Optional[frozenset[str]], optional): Fields to parse. Defaults to None.
+
         Returns:
             dataclasses.WhoisRecord: Parsed whois record
         """
         return dataclasses.WhoisRecord(
             raw_text=self.raw_text,
-            abuse=self._find_abuse(),
-            admin=self._find_admin(),
-            domain=self._find_domain(),
-            expires_at=self._find_expires_at(),
-            name_servers=self._find_name_servers(),
-            registered_at=self._find_registered_at(),
-            registrant=self._find_registrant(),
-            registrar=self._find_registrar(),
-            statuses=self._find_statuses(),
-            tech=self._find_tech(),
-            updated_at=self._find_updated_at(),
-            is_rate_limited=self._is_rate_limited(),
+            **{field: finder() for field, finder in self._get_finders(fields).items()},
         )
 
+    def _trace_fields(
+        self, fields: Iterable[str]
+    ) -> tuple[dict[str, Any], dict[str, FieldTrace]]:
+        """Evaluate fields and record keywords looked up by their finders
+
+        Args:
+            fields (Iterable[str]): Fields to evaluate
+
+        Returns:
+            tuple[dict[str, Any], dict[str, FieldTrace]]: Returns a pair of values and traces of the fields
+        """
+        finders = self._get_finders()
+        values: dict[str, Any] = {}
+        traces: dict[str, FieldTrace] = {}
+        for field in fields:
+            self._trace = traces[field] = FieldTrace()
+            try:
+                values[field] = finders[field]()
+            finally:
+                self._trace = None
+
+        return values, traces
+
+    def _parse_lazy(
+        self, fields: Optional[frozenset[str]] = None
+    ) -> dataclasses.LazyWhoisRecord:
+        """Return a whois record whose fields are evaluated on first access
+
+        Args:
+            fields (Optional[frozenset[str]], optional): Fields to parse. Defaults to None.
+
+        Returns:
+            dataclasses.LazyWhoisRecord: Lazy whois record
+        """
+        return dataclasses.LazyWhoisRecord(self.raw_text, self._get_finders(fields))
+
     @abstractmethod
     def _find_tech(self) -> dataclasses.Tech:
         """Find tech fields
@@ -175,7 +492,7 @@ class AbstractParser(ABC):
         prefix: ParserElement,
         *,
         delimiter: Optional[ParserElement] = SPACE_OR_TAB,
-        target: ParserElement = ANY_CHARACTERS
+        target: ParserElement = ANY_CHARACTERS,
     ) -> Optional[str]:
         """Find text which matches with PyParsing expression
 
@@ -187,10 +504,18 @@ class AbstractParser(ABC):
         Returns:
             Optional[str]: Returns a first matched text. Returns None if nothing matched.
         """
-        grammar = prefix
-        if delimiter is not None:
-            grammar += delimiter
-        grammar += target("value")
+        grammar = self.grammars.get_prefix_grammar(
+            prefix, delimiter, target, build_grammar
+        )
+        if self._trace is not None:
+            self._trace.add_expression()
+
+        if len(self.hooks) > 0:
+            return self._observe_keyword(
+                str(prefix),
+                lambda: find(text=self._normalized_raw_text, grammar=grammar),
+            )
+
         return find(text=self._normalized_raw_text, grammar=grammar)
 
     def _find_datetime(
@@ -198,7 +523,7 @@ class AbstractParser(ABC):
         prefix: ParserElement,
         *,
         delimiter: Optional[ParserElement] = SPACE_OR_TAB,
-        target: ParserElement = ANY_CHARACTERS
+        target: ParserElement = ANY_CHARACTERS,
     ) -> Optional[Union[str, datetime]]:
         """Find text which matches with PyParsing expression and return it as a datetime
 
@@ -214,14 +539,14 @@ class AbstractParser(ABC):
         if value is None:
             return None
 
-        return parse_datetime(value)
+        return parse_datetime(value, self.DATE_HINTS)
 
     def _find_all(
         self,
         prefix: ParserElement,
         *,
         delimiter: Optional[ParserElement] = SPACE_OR_TAB,
-        target: ParserElement = ANY_CHARACTERS
+        target: ParserElement = ANY_CHARACTERS,
     ) -> list[str]:
         """Find a list of text which matches with a PyParsing expression
 
@@ -233,19 +558,191 @@ class AbstractParser(ABC):
         Returns:
             Optional[str]: Returns a list of matched text. Returns en empty list if nothing matched.
         """
-        grammar = prefix
-        if delimiter is not None:
-            grammar += delimiter
-        grammar += target("value")
+        grammar = self.grammars.get_prefix_grammar(
+            prefix, delimiter, target, build_grammar
+        )
+        if self._trace is not None:
+            self._trace.add_expression()
+
+        if len(self.hooks) > 0:
+            return self._observe_keyword(
+                str(prefix),
+                lambda: find_all(text=self._normalized_raw_text, grammar=grammar),
+            )
+
         return find_all(text=self._normalized_raw_text, grammar=grammar)
 
+    def _get_keyword_grammar(self, lookup: KeywordLookup) -> ParserElement:
+        """Get a compiled grammar of a keyword lookup from the registry
+
+        Args:
+            lookup (KeywordLookup): Keyword lookup
+
+        Returns:
+            ParserElement: Grammar
+        """
+        return self.grammars.get_keyword_grammar(lookup, build_keyword_grammar)
+
+    def _get_line_index(self, lookup: KeywordLookup) -> Optional[LineIndex]:
+        """Get a line index which can resolve a keyword lookup
+
+        Args:
+            lookup (KeywordLookup): Keyword lookup
+
+        Returns:
+            Optional[LineIndex]: Returns None if the index is disabled or the lookup is not indexable
+        """
+        if not self.use_index or not LineIndex.is_indexable(lookup):
+            return None
+
+        delimiter = cast(str, lookup.delimiter)
+        index = self._line_indexes.get(delimiter)
+        if index is None:
+            index = LineIndex(self._normalized_raw_text, delimiter=delimiter)
+            self._line_indexes[delimiter] = index
+
+        return index
+
+    def _get_scan_text(self, *, is_case_sensitive: bool) -> str:
+        """Get a text to be scanned by KeywordScanner
+
+        Args:
+            is_case_sensitive (bool): Whether a scan is case sensitive or not
+
+        Returns:
+            str: Tab expanded text (upper cased if it's not case sensitive)
+        """
+        text = self._scan_texts.get(is_case_sensitive)
+        if text is None:
+            # PyParsing expands tabs before parsing
+            text = self._normalized_raw_text.expandtabs()
+            if not is_case_sensitive:
+                text = text.upper()
+
+            self._scan_texts[is_case_sensitive] = text
+
+        return text
+
+    def _get_candidate_lookups(
+        self,
+        keywords: list[str],
+        *,
+        delimiter: Optional[str],
+        is_case_sensitive: bool,
+        is_line_start_sensitive: bool,
+    ) -> list[KeywordLookup]:
+        """Get lookups of keywords which occur in the text by a single scan
+
+        Keywords which do not occur can't match, thus they are skipped without scanning the text per keyword.
+        The order of keywords (priority) is kept.
+
+        Args:
+            keywords (list[str]): Keywords
+            delimiter (Optional[str]): Delimiter
+            is_case_sensitive (bool): Case sensitivity
+            is_line_start_sensitive (bool): Line start sensitivity
+
+        Returns:
+            list[KeywordLookup]: Lookups
+        """
+        if self._trace is not None:
+            self._trace.add_keywords(keywords, is_case_sensitive=is_case_sensitive)
+
+        lookups = [
+            KeywordLookup(
+                keyword,
+                delimiter=delimiter,
+                is_case_sensitive=is_case_sensitive,
+                is_line_start_sensitive=is_line_start_sensitive,
+            )
+            for keyword in keywords
+        ]
+        if len(lookups) <= 1:
+            return lookups
+
+        scan_keywords = self.SCAN_KEYWORDS.get(is_case_sensitive)
+        if scan_keywords is not None:
+            needles = [
+                keyword if is_case_sensitive else keyword.upper()
+                for keyword in keywords
+            ]
+            if scan_keywords.issuperset(needles):
+                present = self._get_present_keywords(
+                    is_case_sensitive=is_case_sensitive
+                )
+                return [
+                    lookup
+                    for lookup, needle in zip(lookups, needles)
+                    if needle == "" or needle in present
+                ]
+
+        scanner = get_keyword_scanner(
+            tuple(keywords), is_case_sensitive=is_case_sensitive
+        )
+        return scanner.filter(
+            lookups, self._get_scan_text(is_case_sensitive=is_case_sensitive)
+        )
+
+    def _get_present_keywords(self, *, is_case_sensitive: bool) -> frozenset[str]:
+        """Get SCAN_KEYWORDS which occur in the text
+
+        All the keywords of the specs are checked at once per record instead of scanning the text per finder.
+
+        Args:
+            is_case_sensitive (bool): Case sensitivity
+
+        Returns:
+            frozenset[str]: Keywords (upper cased if it's not case sensitive)
+        """
+        present = self._present_keywords.get(is_case_sensitive)
+        if present is None:
+            text = self._get_scan_text(is_case_sensitive=is_case_sensitive)
+            present = frozenset(
+                keyword
+                for keyword in self.SCAN_KEYWORDS[is_case_sensitive]
+                if keyword in text
+            )
+            self._present_keywords[is_case_sensitive] = present
+
+        return present
+
+    def _find_by_lookup(self, lookup: KeywordLookup) -> Optional[str]:
+        """Find text which matches with a keyword lookup
+
+        Args:
+            lookup (KeywordLookup): Keyword lookup
+
+        Returns:
+            Optional[str]: Returns a first matched text. Returns None if nothing matched.
+        """
+        index = self._get_line_index(lookup)
+        if index is not None:
+            return index.find(lookup)
+
+        return self.engine.find(lookup)
+
+    def _find_all_by_lookup(self, lookup: KeywordLookup) -> list[str]:
+        """Find a list of text which matches with a keyword lookup
+
+        Args:
+            lookup (KeywordLookup): Keyword lookup
+
+        Returns:
+            list[str]: Returns a list of matched text. Returns en empty list if nothing matched.
+        """
+        index = self._get_line_index(lookup)
+        if index is not None:
+            return index.find_all(lookup)
+
+        return self.engine.find_all(lookup)
+
     def _find_by_keywords(
         self,
         keywords: list[str],
         *,
         delimiter: Optional[str] = DEILIMITER,
         is_case_sensitive: bool = False,
-        is_line_start_sensitive: bool = True
+        is_line_start_sensitive: bool = True,
     ) -> Optional[str]:
         """Find text which matches with a keyword
 
@@ -258,15 +755,20 @@ class AbstractParser(ABC):
         Returns:
             Optional[str]: Returns a first matched text. Returns None if nothing matched.
         """
-        for keyword in keywords:
-            value = self._find(
-                build_common_prefix_pattern(
-                    keyword,
-                    is_case_sensitive=is_case_sensitive,
-                    is_line_start_sensitive=is_line_start_sensitive,
-                    delimiter=delimiter,
+        lookups = self._get_candidate_lookups(
+            keywords,
+            delimiter=delimiter,
+            is_case_sensitive=is_case_sensitive,
+            is_line_start_sensitive=is_line_start_sensitive,
+        )
+        for lookup in lookups:
+            if len(self.hooks) > 0:
+                value = self._observe_keyword(
+                    lookup.keyword, functools.partial(self._find_by_lookup, lookup)
                 )
-            )
+            else:
+                value = self._find_by_lookup(lookup)
+
             if value is not None:
                 return value
 
@@ -278,7 +780,7 @@ class AbstractParser(ABC):
         *,
         delimiter: Optional[str] = DEILIMITER,
         is_case_sensitive: bool = False,
-        is_line_start_sensitive: bool = True
+        is_line_start_sensitive: bool = True,
     ) -> Optional[Union[datetime, str]]:
         """Find text which matches with a keyword and return it as a datetime
 
@@ -291,19 +793,16 @@ class AbstractParser(ABC):
         Returns:
             Optional[Union[datetime, str]]: Returns a first matched text as a datetime. Returns str if it's not possible to convert. Also, returns None if nothing matched.
         """
-        for keyword in keywords:
-            value = self._find_datetime(
-                build_common_prefix_pattern(
-                    keyword,
-                    is_case_sensitive=is_case_sensitive,
-                    is_line_start_sensitive=is_line_start_sensitive,
-                    delimiter=delimiter,
-                )
-            )
-            if value is not None:
-                return value
+        value = self._find_by_keywords(
+            keywords,
+            delimiter=delimiter,
+            is_case_sensitive=is_case_sensitive,
+            is_line_start_sensitive=is_line_start_sensitive,
+        )
+        if value is None:
+            return None
 
-        return None
+        return parse_datetime(value, self.DATE_HINTS)
 
     def _find_all_by_keywords(
         self,
@@ -311,7 +810,7 @@ class AbstractParser(ABC):
         *,
         delimiter: Optional[str] = DEILIMITER,
         is_case_sensitive: bool = False,
-        is_line_start_sensitive: bool = True
+        is_line_start_sensitive: bool = True,
     ) -> list[str]:
         """Find a list of text which matches with a keyword
 
@@ -324,15 +823,20 @@ class AbstractParser(ABC):
         Returns:
             List[str]: Returns a list of matched text. Returns en empty list if nothing matched.
         """
-        for keyword in keywords:
-            values = self._find_all(
-                build_common_prefix_pattern(
-                    keyword,
-                    is_case_sensitive=is_case_sensitive,
-                    is_line_start_sensitive=is_line_start_sensitive,
-                    delimiter=delimiter,
+        lookups = self._get_candidate_lookups(
+            keywords,
+            delimiter=delimiter,
+            is_case_sensitive=is_case_sensitive,
+            is_line_start_sensitive=is_line_start_sensitive,
+        )
+        for lookup in lookups:
+            if len(self.hooks) > 0:
+                values = self._observe_keyword(
+                    lookup.keyword, functools.partial(self._find_all_by_lookup, lookup)
                 )
-            )
+            else:
+                values = self._find_all_by_lookup(lookup)
+
             if len(values) > 0:
                 return values
 
@@ -344,4 +848,4 @@ class AbstractParser(ABC):
         Returns:
             bool: Returns True if it's rate limited. Otherwise False.
         """
-        return self.raw_text.strip() in settings.WHOIS_RATE_LIMIT_MESSAGES
+        return is_rate_limited(self.raw_text)
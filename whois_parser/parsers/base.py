@@ -1,21 +1,17 @@
 from datetime import datetime
-from typing import Optional, Union
+from typing import Any, Callable, Optional, Union
 
 from .. import dataclasses
 from .abstract import AbstractParser
-
-
-class BaseParser(AbstractParser):
-    def _find_domain(self) -> Optional[str]:
-        value = self._find_by_keywords(["Domain Name", "domain"])
-        if value is not None:
-            value = value.lower()
-
-        return value
-
-    def _find_registered_at(self) -> Optional[Union[str, datetime]]:
-        return self._find_datetime_by_keywords(
-            [
+from .spec import parse_spec
+
+# keywords of fields of generic (e.g. gTLD) records. See ParserSpec for the format.
+BASE_SPEC: dict[str, Any] = {
+    # no date hints: the parser is the fallback of all the TLDs whose dates are in any language
+    "fields": {
+        "domain": {"keywords": ["Domain Name", "domain"], "post": ["lower"]},
+        "registered_at": {
+            "keywords": [
                 "Creation Date",
                 "registered",
                 "created",
@@ -27,12 +23,10 @@ class BaseParser(AbstractParser):
                 "Created On",
                 "registered on",
             ],
-            is_line_start_sensitive=False,
-        )
-
-    def _find_updated_at(self) -> Optional[Union[str, datetime]]:
-        return self._find_datetime_by_keywords(
-            [
+            "is_line_start_sensitive": False,
+        },
+        "updated_at": {
+            "keywords": [
                 "Updated Date",
                 "registered",
                 "updated",
@@ -43,12 +37,10 @@ class BaseParser(AbstractParser):
                 "domain_datelastmodified",
                 "Last Update",
             ],
-            is_line_start_sensitive=False,
-        )
-
-    def _find_expires_at(self) -> Optional[Union[str, datetime]]:
-        return self._find_datetime_by_keywords(
-            [
+            "is_line_start_sensitive": False,
+        },
+        "expires_at": {
+            "keywords": [
                 "Expiry Date",
                 "Expiration Date",
                 "expire",
@@ -63,12 +55,10 @@ class BaseParser(AbstractParser):
                 "Valid Until",
                 "validity",
             ],
-            is_line_start_sensitive=False,
-        )
-
-    def _find_registrar(self) -> Optional[str]:
-        return self._find_by_keywords(
-            [
+            "is_line_start_sensitive": False,
+        },
+        "registrar": {
+            "keywords": [
                 "Registrar",
                 "Registrar Name",
                 "Sponsoring Registrar",
@@ -79,55 +69,96 @@ class BaseParser(AbstractParser):
                 "Registration Service Provider",
                 "Account Name",
             ]
-        )
+        },
+        "statuses": {"keywords": ["Domain Status", "domaintype"]},
+        "name_servers": {
+            "keywords": ["Name server", "Nserver", "Host Name"],
+            "post": ["lower"],
+        },
+        "abuse": {
+            "email": {"keywords": ["Registrar Abuse Contact Email", "AC E-Mail"]},
+            "telephone": {
+                "keywords": ["Registrar Abuse Contact Phone", "AC Phone Number"]
+            },
+        },
+        "registrant": {
+            "name": {
+                "keywords": [
+                    "Registrant Name",
+                    "Registrant",
+                    "Registrant Contact Name",
+                    "Person",
+                    "registrant_contact_name",
+                    "Domain Holder",
+                    "personname",
+                    "responsible",
+                ]
+            },
+            "email": {"keywords": ["Registrant Email", "Registrant Contact Email"]},
+            "telephone": {"keywords": ["Registrant Phone"]},
+            "organization": {
+                "keywords": [
+                    "Registrant Organization",
+                    "org",
+                    "org-name",
+                    "Registrant Contact Organisation",
+                ]
+            },
+        },
+        "admin": {
+            "name": {"keywords": ["Admin Name"]},
+            "email": {"keywords": ["Admin Email"]},
+            "telephone": {"keywords": ["Admin Phone"]},
+            "organization": {"keywords": ["Admin Organization"]},
+        },
+        "tech": {
+            "name": {"keywords": ["Tech Name", "Tech Contact Name"]},
+            "email": {"keywords": ["Tech Email", "Tech Contact Email"]},
+            "telephone": {"keywords": ["Tech Phone"]},
+            "organization": {
+                "keywords": ["Tech Organization", "Tech Contact Organisation"]
+            },
+        },
+    },
+}
 
-    def _find_abuse_email(self) -> Optional[str]:
-        return self._find_by_keywords(["Registrar Abuse Contact Email", "AC E-Mail"])
 
-    def _find_abuse_telephone(self) -> Optional[str]:
-        return self._find_by_keywords(
-            ["Registrar Abuse Contact Phone", "AC Phone Number"]
-        )
+class BaseParser(AbstractParser):
+    """A parser of generic records whose finders of values are generated from BASE_SPEC
+
+    Contacts are composed of finders of their sub-fields (e.g. _find_registrant_name).
+    """
+
+    SPEC = parse_spec(BASE_SPEC)
+
+    # finders generated from the spec
+    _find_domain: Callable[[], Optional[str]]
+    _find_registrar: Callable[[], Optional[str]]
+    _find_registered_at: Callable[[], Optional[Union[str, datetime]]]
+    _find_updated_at: Callable[[], Optional[Union[str, datetime]]]
+    _find_expires_at: Callable[[], Optional[Union[str, datetime]]]
+    _find_statuses: Callable[[], list[str]]
+    _find_name_servers: Callable[[], list[str]]
+    _find_abuse_email: Callable[[], Optional[str]]
+    _find_abuse_telephone: Callable[[], Optional[str]]
+    _find_registrant_name: Callable[[], Optional[str]]
+    _find_registrant_email: Callable[[], Optional[str]]
+    _find_registrant_telephone: Callable[[], Optional[str]]
+    _find_registrant_organization: Callable[[], Optional[str]]
+    _find_admin_name: Callable[[], Optional[str]]
+    _find_admin_email: Callable[[], Optional[str]]
+    _find_admin_telephone: Callable[[], Optional[str]]
+    _find_admin_organization: Callable[[], Optional[str]]
+    _find_tech_name: Callable[[], Optional[str]]
+    _find_tech_email: Callable[[], Optional[str]]
+    _find_tech_telephone: Callable[[], Optional[str]]
+    _find_tech_organization: Callable[[], Optional[str]]
 
     def _find_abuse(self) -> dataclasses.Abuse:
         return dataclasses.Abuse(
             email=self._find_abuse_email(), telephone=self._find_abuse_telephone()
         )
 
-    def _find_registrant_name(self) -> Optional[str]:
-        return self._find_by_keywords(
-            [
-                "Registrant Name",
-                "Registrant",
-                "Registrant Contact Name",
-                "Person",
-                "registrant_contact_name",
-                "Domain Holder",
-                "personname",
-                "responsible",
-            ]
-        )
-
-    def _find_registrant_email(self) -> Optional[str]:
-        return self._find_by_keywords(["Registrant Email", "Registrant Contact Email"])
-
-    def _find_registrant_telephone(self) -> Optional[str]:
-        return self._find_by_keywords(
-            [
-                "Registrant Phone",
-            ]
-        )
-
-    def _find_registrant_organization(self) -> Optional[str]:
-        return self._find_by_keywords(
-            [
-                "Registrant Organization",
-                "org",
-                "org-name",
-                "Registrant Contact Organisation",
-            ]
-        )
-
     def _find_registrant(self) -> dataclasses.Registrant:
         return dataclasses.Registrant(
             name=self._find_registrant_name(),
@@ -136,34 +167,6 @@ class BaseParser(AbstractParser):
             organization=self._find_registrant_organization(),
         )
 
-    def _find_admin_name(self) -> Optional[str]:
-        return self._find_by_keywords(
-            [
-                "Admin Name",
-            ]
-        )
-
-    def _find_admin_email(self) -> Optional[str]:
-        return self._find_by_keywords(
-            [
-                "Admin Email",
-            ]
-        )
-
-    def _find_admin_telephone(self) -> Optional[str]:
-        return self._find_by_keywords(
-            [
-                "Admin Phone",
-            ]
-        )
-
-    def _find_admin_organization(self) -> Optional[str]:
-        return self._find_by_keywords(
-            [
-                "Admin Organization",
-            ]
-        )
-
     def _find_admin(self) -> dataclasses.Admin:
         return dataclasses.Admin(
             name=self._find_admin_name(),
@@ -172,24 +175,6 @@ class BaseParser(AbstractParser):
             organization=self._find_admin_organization(),
         )
 
-    def _find_tech_name(self) -> Optional[str]:
-        return self._find_by_keywords(["Tech Name", "Tech Contact Name"])
-
-    def _find_tech_email(self) -> Optional[str]:
-        return self._find_by_keywords(["Tech Email", "Tech Contact Email"])
-
-    def _find_tech_telephone(self) -> Optional[str]:
-        return self._find_by_keywords(
-            [
-                "Tech Phone",
-            ]
-        )
-
-    def _find_tech_organization(self) -> Optional[str]:
-        return self._find_by_keywords(
-            ["Tech Organization", "Tech Contact Organisation"]
-        )
-
     def _find_tech(self) -> dataclasses.Tech:
         return dataclasses.Tech(
             name=self._find_tech_name(),
@@ -197,10 +182,3 @@ class BaseParser(AbstractParser):
             telephone=self._find_tech_telephone(),
             organization=self._find_tech_organization(),
         )
-
-    def _find_statuses(self) -> list[str]:
-        return self._find_all_by_keywords(["Domain Status", "domaintype"])
-
-    def _find_name_servers(self) -> list[str]:
-        values = self._find_all_by_keywords(["Name server", "Nserver", "Host Name"])
-        return [value.lower() for value in values]
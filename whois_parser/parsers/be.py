@@ -1,15 +1,24 @@
-from typing import Optional
-
-from pyparsing import Regex
+from typing import Any
 
 from .base import BaseParser
+from .spec import parse_spec
 
+# values are in blocks (e.g. "Name:" of the "Registrar:" block)
+BE_SPEC: dict[str, Any] = {
+    "fingerprint_markers": ["Registrar:\nName:"],
+    # e.g. "Tue Dec 12 2000"
+    "date_hints": {"languages": ["en"], "date_formats": ["%a %b %d %Y"]},
+    "fields": {
+        "registrar": {
+            "block": "Registrar:",
+            "keywords": ["Name:"],
+            "is_case_sensitive": True,
+        },
+        # a registrant is not shown by DNS Belgium
+        "registrant": {"name": None},
+    },
+}
 
-class BeParser(BaseParser):
-    def _find_registrar(self) -> Optional[str]:
-        prefix = Regex("Registrar:\nName:")
-        return self._find(prefix, delimiter=None)
 
-    def _find_registrant_name(self) -> Optional[str]:
-        prefix = Regex("r'Registrant:\n")
-        return self._find(prefix, delimiter=None)
+class BeParser(BaseParser):
+    SPEC = parse_spec(BE_SPEC)
@@ -0,0 +1,166 @@
+import re
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import Optional
+
+from .. import settings
+from .utils import find_last_section
+
+# kinds of responses which can't contain data
+EMPTY = "empty"
+RATE_LIMITED = "rate_limited"
+NOT_FOUND = "not_found"
+
+# a line which has a key and a value (e.g. "Domain Name: example.com", "a. [ドメイン名] EXAMPLE.JP")
+KEY_VALUE_LINE_PATTERN = re.compile(
+    r"^[ \t]*(?:[^\s:][^:\n]*:[ \t]*\S|[^\n\[]*\[[^\]\n]+\][ \t]+\S)", re.MULTILINE
+)
+
+
+def get_last_section(raw_text: str) -> str:
+    """Get the last section of a response which is parsed (see normalize_raw_text)
+
+    Args:
+        raw_text (str): Whois record
+
+    Returns:
+        str: Last section
+    """
+    start = find_last_section(raw_text)
+    return raw_text if start is None else raw_text[start:]
+
+
+def has_key_value_line(text: str) -> bool:
+    return KEY_VALUE_LINE_PATTERN.search(text) is not None
+
+
+def _to_needles(messages: Iterable[str]) -> tuple[str, ...]:
+    return tuple(sorted({message.lower() for message in messages if message != ""}))
+
+
+class ResponseClassifier:
+    """A classifier which detects responses which can't contain data before parsing them
+
+    Only the last section of a response is classified since other sections (e.g. referrals)
+    are never parsed. The section is lower cased once and messages are searched in it as substrings.
+    str's substring search is faster than a regex alternation of the messages in CPython.
+    """
+
+    def __init__(
+        self,
+        *,
+        rate_limit_messages: Iterable[str] = (),
+        not_found_messages: Iterable[str] = (),
+    ):
+        """
+        Args:
+            rate_limit_messages (Iterable[str], optional): Messages of rate limited responses. Defaults to ().
+            not_found_messages (Iterable[str], optional): Messages of responses for domains which are not registered. Defaults to ().
+        """
+        self.rate_limit_needles = _to_needles(rate_limit_messages)
+        self.not_found_needles = _to_needles(not_found_messages)
+
+    def match_messages(self, text: str) -> Optional[str]:
+        """Match messages with a text
+
+        Args:
+            text (str): Text
+
+        Returns:
+            Optional[str]: Returns "rate_limited" or "not_found". Returns None if no message matches.
+        """
+        text = text.lower()
+        if any(needle in text for needle in self.rate_limit_needles):
+            return RATE_LIMITED
+
+        if any(needle in text for needle in self.not_found_needles):
+            return NOT_FOUND
+
+        return None
+
+    def match_lines(self, text: str) -> Optional[str]:
+        """Match messages with whole lines of a text
+
+        Args:
+            text (str): Text
+
+        Returns:
+            Optional[str]: Returns "rate_limited" or "not_found". Returns None if no line is a message.
+        """
+        lines = {line.strip().lower() for line in text.splitlines()}
+        if not lines.isdisjoint(self.rate_limit_needles):
+            return RATE_LIMITED
+
+        if not lines.isdisjoint(self.not_found_needles):
+            return NOT_FOUND
+
+        return None
+
+    def classify(self, raw_text: str) -> Optional[str]:
+        """Classify a response
+
+        A message short-circuits parsing only if the last section has no key / value lines.
+        Otherwise the section is parsed as it may contain data.
+
+        Args:
+            raw_text (str): Whois record
+
+        Returns:
+            Optional[str]: Returns "empty", "rate_limited" or "not_found". Returns None if the response may contain data.
+        """
+        section = get_last_section(raw_text)
+        if section == "" or section.isspace():
+            return EMPTY
+
+        if has_key_value_line(section):
+            return None
+
+        return self.match_messages(section)
+
+
+@lru_cache(maxsize=8)
+def get_classifier(
+    rate_limit_messages: frozenset[str], not_found_messages: frozenset[str]
+) -> ResponseClassifier:
+    return ResponseClassifier(
+        rate_limit_messages=rate_limit_messages, not_found_messages=not_found_messages
+    )
+
+
+def get_default_classifier() -> ResponseClassifier:
+    return get_classifier(
+        frozenset(settings.WHOIS_RATE_LIMIT_MESSAGES),
+        frozenset(settings.WHOIS_NOT_FOUND_MESSAGES),
+    )
+
+
+def classify(raw_text: str) -> Optional[str]:
+    """Classify a response by the messages in the settings
+
+    Args:
+        raw_text (str): Whois record
+
+    Returns:
+        Optional[str]: Returns "empty", "rate_limited" or "not_found". Returns None if the response may contain data.
+    """
+    return get_default_classifier().classify(raw_text)
+
+
+def is_rate_limited(raw_text: str) -> bool:
+    """Check whether the last section of a response has a rate limit message
+
+    A message is searched as a substring only if the section has no key / value lines.
+    Otherwise it should be a whole line not to flag a record with data whose banner or remark has a message.
+
+    Args:
+        raw_text (str): Whois record
+
+    Returns:
+        bool: Returns True if it's rate limited
+    """
+    classifier = get_default_classifier()
+    section = get_last_section(raw_text)
+    if has_key_value_line(section):
+        return classifier.match_lines(section) == RATE_LIMITED
+
+    return classifier.match_messages(section) == RATE_LIMITED
@@ -0,0 +1,266 @@
+import re
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone, tzinfo
+from typing import Callable, NamedTuple, Optional
+
+MONTHS: dict[str, int] = {
+    "jan": 1,
+    "feb": 2,
+    "mar": 3,
+    "apr": 4,
+    "may": 5,
+    "jun": 6,
+    "jul": 7,
+    "aug": 8,
+    "sep": 9,
+    "oct": 10,
+    "nov": 11,
+    "dec": 12,
+}
+
+TIMEZONE_ABBREVIATIONS: dict[str, timedelta] = {
+    "UTC": timedelta(0),
+    "GMT": timedelta(0),
+    "JST": timedelta(hours=9),
+    "KST": timedelta(hours=9),
+}
+
+UTC = timezone(timedelta(0), "Z")
+
+# e.g. "Z", "-0700", "+09:00"
+OFFSET_PATTERN = re.compile(r"Z|[+-]\d{2}:?\d{2}")
+
+# e.g. "2021-11-25T02:48:55Z", "2019-09-09T08:39:04-0700", "2007-09-24"
+ISO_8601_PATTERN = re.compile(
+    r"(?P<year>\d{4})-(?P<month>\d{2})-(?P<day>\d{2})"
+    r"(?:[T ](?P<hour>\d{2}):(?P<minute>\d{2})(?::(?P<second>\d{2})(?:\.(?P<fraction>\d{1,6}))?)?"
+    r"\s*(?P<offset>Z|[+-]\d{2}:?\d{2})?)?"
+)
+# e.g. "2001/03/22", "2021/04/01 01:05:22 (JST)"
+SLASH_PATTERN = re.compile(
+    r"(?P<year>\d{4})/(?P<month>\d{2})/(?P<day>\d{2})"
+    r"(?: (?P<hour>\d{2}):(?P<minute>\d{2}):(?P<second>\d{2})(?: \((?P<abbreviation>[A-Z]{3})\))?)?"
+)
+# e.g. "11-Jun-2014"
+DAY_MONTH_YEAR_PATTERN = re.compile(
+    r"(?P<day>\d{2})-(?P<month_name>[A-Za-z]{3})-(?P<year>\d{4})"
+)
+# e.g. "2007. 03. 02."
+DOTTED_PATTERN = re.compile(r"(?P<year>\d{4})\. (?P<month>\d{2})\. (?P<day>\d{2})\.")
+# e.g. "Tue Dec 12 2000"
+WEEKDAY_MONTH_DAY_YEAR_PATTERN = re.compile(
+    r"(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun) (?P<month_name>[A-Z][a-z]{2}) (?P<day>\d{2}) (?P<year>\d{4})"
+)
+
+
+class DateHints(NamedTuple):
+    """Expected formats of date strings of a registry
+
+    dateparser only considers the languages / locales of hints instead of detecting them
+    across all the locales. It makes date parsing faster and deterministic per registry.
+    """
+
+    # languages (e.g. "ja") which dateparser considers. All the languages are detected if empty.
+    languages: tuple[str, ...] = ()
+    # locales (e.g. "en-GB") which dateparser considers
+    locales: tuple[str, ...] = ()
+    # strptime formats tried in order when the fast path fails (before dateparser)
+    date_formats: tuple[str, ...] = ()
+    # timezone of naive datetimes (an abbreviation of TIMEZONE_ABBREVIATIONS or an offset e.g. "+09:00")
+    timezone: Optional[str] = None
+
+
+NO_HINTS = DateHints()
+
+
+@dataclass
+class DatetimeStats:
+    # number of date strings converted by the fast path (or the formats of hints)
+    fast_path: int = 0
+    # number of date strings passed to dateparser
+    fallback: int = 0
+    # number of date strings which could not be converted
+    unparsed: int = 0
+
+    def reset(self) -> None:
+        self.fast_path = 0
+        self.fallback = 0
+        self.unparsed = 0
+
+
+STATS = DatetimeStats()
+
+
+def build_offset_timezone(offset: str) -> tzinfo:
+    """Build a timezone from an ISO 8601 offset
+
+    Args:
+        offset (str): Offset (e.g. "Z", "-0700", "+09:00")
+
+    Returns:
+        tzinfo: Timezone named in the same manner as dateparser
+    """
+    if offset == "Z":
+        return UTC
+
+    sign = offset[0]
+    digits = offset[1:].replace(":", "")
+    hours, minutes = int(digits[:2]), int(digits[2:])
+    delta = timedelta(hours=hours, minutes=minutes)
+    if sign == "-":
+        delta = -delta
+
+    return timezone(delta, f"UTC\\{sign}{digits[:2]}:{digits[2:]}")
+
+
+def get_timezone(name: str) -> tzinfo:
+    """Get a timezone by its abbreviation or offset
+
+    Args:
+        name (str): Abbreviation (e.g. "JST") or offset (e.g. "+09:00")
+
+    Raises:
+        ValueError: Raised if the name is unknown
+
+    Returns:
+        tzinfo: Timezone
+    """
+    delta = TIMEZONE_ABBREVIATIONS.get(name)
+    if delta is not None:
+        return timezone(delta, name)
+
+    if OFFSET_PATTERN.fullmatch(name) is not None:
+        return build_offset_timezone(name)
+
+    raise ValueError(
+        f"Unknown timezone: {name}. Use an offset (e.g. +09:00) or one of {', '.join(TIMEZONE_ABBREVIATIONS)}."
+    )
+
+
+def _int(value: Optional[str]) -> int:
+    return int(value) if value is not None else 0
+
+
+def _parse_iso_8601(match: re.Match) -> Optional[datetime]:
+    fraction = match.group("fraction")
+    microsecond = int(fraction.ljust(6, "0")) if fraction is not None else 0
+
+    offset = match.group("offset")
+    return datetime(
+        int(match.group("year")),
+        int(match.group("month")),
+        int(match.group("day")),
+        _int(match.group("hour")),
+        _int(match.group("minute")),
+        _int(match.group("second")),
+        microsecond,
+        tzinfo=build_offset_timezone(offset) if offset is not None else None,
+    )
+
+
+def _parse_slash(match: re.Match) -> Optional[datetime]:
+    abbreviation = match.group("abbreviation")
+    tz: Optional[tzinfo] = None
+    if abbreviation is not None:
+        delta = TIMEZONE_ABBREVIATIONS.get(abbreviation)
+        if delta is None:
+            return None
+
+        tz = timezone(delta, abbreviation)
+
+    return datetime(
+        int(match.group("year")),
+        int(match.group("month")),
+        int(match.group("day")),
+        _int(match.group("hour")),
+        _int(match.group("minute")),
+        _int(match.group("second")),
+        tzinfo=tz,
+    )
+
+
+def _parse_month_name(match: re.Match) -> Optional[datetime]:
+    month = MONTHS.get(match.group("month_name").lower())
+    if month is None:
+        return None
+
+    return datetime(int(match.group("year")), month, int(match.group("day")))
+
+
+def _parse_dotted(match: re.Match) -> Optional[datetime]:
+    return datetime(
+        int(match.group("year")), int(match.group("month")), int(match.group("day"))
+    )
+
+
+FAST_PATHS: list[tuple[re.Pattern, Callable[[re.Match], Optional[datetime]]]] = [
+    (ISO_8601_PATTERN, _parse_iso_8601),
+    (SLASH_PATTERN, _parse_slash),
+    (DAY_MONTH_YEAR_PATTERN, _parse_month_name),
+    (DOTTED_PATTERN, _parse_dotted),
+    (WEEKDAY_MONTH_DAY_YEAR_PATTERN, _parse_month_name),
+]
+
+
+def fast_parse_datetime(date_string: str) -> Optional[datetime]:
+    """Convert a date string in a common registry format into a datetime
+
+    Args:
+        date_string (str): Date string
+
+    Returns:
+        Optional[datetime]: Returns None if the format is unknown or the date is invalid
+    """
+    date_string = date_string.strip()
+
+    for pattern, converter in FAST_PATHS:
+        match = pattern.fullmatch(date_string)
+        if match is None:
+            continue
+
+        try:
+            return converter(match)
+        except ValueError:
+            # e.g. "2021-02-30"
+            return None
+
+    return None
+
+
+def parse_with_formats(
+    date_string: str, date_formats: tuple[str, ...]
+) -> Optional[datetime]:
+    """Convert a date string into a datetime by strptime formats
+
+    Args:
+        date_string (str): Date string
+        date_formats (tuple[str, ...]): Formats tried in order
+
+    Returns:
+        Optional[datetime]: Returns None if no format matches
+    """
+    date_string = date_string.strip()
+
+    for date_format in date_formats:
+        try:
+            return datetime.strptime(date_string, date_format)
+        except ValueError:
+            continue
+
+    return None
+
+
+def localize(dt: datetime, hints: DateHints) -> datetime:
+    """Set the default timezone of hints to a naive datetime
+
+    Args:
+        dt (datetime): Datetime
+        hints (DateHints): Hints
+
+    Returns:
+        datetime: Datetime
+    """
+    if hints.timezone is None or dt.tzinfo is not None:
+        return dt
+
+    return dt.replace(tzinfo=get_timezone(hints.timezone))
@@ -0,0 +1,240 @@
+import re
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
+from typing import Callable, ClassVar, NamedTuple, Optional
+
+from pyparsing import ParserElement
+
+from .grammars import KeywordLookup
+from .index import (
+    DELIMITER_MATCH_CHARS,
+    DELIMITER_SKIP_CHARS,
+    KEY_GAP_MATCH_CHARS,
+    KEY_GAP_SKIP_CHARS,
+    KEY_WHITE_CHARS,
+    VALUE_SKIP_CHARS,
+    WHITE_CHARS,
+)
+from .utils import find, find_all
+
+
+class Engine(ABC):
+    """A matching engine which resolves keyword lookups in a text"""
+
+    name: ClassVar[str]
+
+    def __init__(
+        self, text: str, get_grammar: Callable[[KeywordLookup], ParserElement]
+    ):
+        """
+        Args:
+            text (str): Text
+            get_grammar (Callable[[KeywordLookup], ParserElement]): Function to get a compiled grammar of a lookup
+        """
+        self.text = text
+        self.get_grammar = get_grammar
+
+    @abstractmethod
+    def find(self, lookup: KeywordLookup) -> Optional[str]:
+        """Find a first value which matches with a keyword lookup
+
+        Args:
+            lookup (KeywordLookup): Keyword lookup
+
+        Returns:
+            Optional[str]: Returns a first matched value. Returns None if nothing matched.
+        """
+
+    @abstractmethod
+    def find_all(self, lookup: KeywordLookup) -> list[str]:
+        """Find a list of values which match with a keyword lookup
+
+        Args:
+            lookup (KeywordLookup): Keyword lookup
+
+        Returns:
+            list[str]: Returns a list of matched values. Returns an empty list if nothing matched.
+        """
+
+
+class PyparsingEngine(Engine):
+    """An engine which scans a text with PyParsing grammars"""
+
+    name = "pyparsing"
+
+    def find(self, lookup: KeywordLookup) -> Optional[str]:
+        return find(text=self.text, grammar=self.get_grammar(lookup))
+
+    def find_all(self, lookup: KeywordLookup) -> list[str]:
+        return find_all(text=self.text, grammar=self.get_grammar(lookup))
+
+
+def _char_class(chars: Iterable[str]) -> str:
+    chars = sorted(chars)
+    if len(chars) == 0:
+        # never matches
+        return "(?!)"
+
+    return "[" + "".join(re.escape(char) for char in chars) + "]"
+
+
+def _atomic(pattern: str, name: str) -> str:
+    # an atomic group which does not backtrack like PyParsing (Python 3.9 does not support "(?>...)")
+    return f"(?=(?P<{name}>{pattern}))(?P={name})"
+
+
+KEY_WHITE = _char_class(KEY_WHITE_CHARS)
+KEY_GAP_MATCH = _char_class(KEY_GAP_MATCH_CHARS)
+KEY_GAP_SKIP = _char_class(KEY_GAP_SKIP_CHARS)
+DELIMITER_SKIP = _char_class(DELIMITER_SKIP_CHARS)
+DELIMITER_MATCH = _char_class(DELIMITER_MATCH_CHARS)
+VALUE_SKIP = _char_class(VALUE_SKIP_CHARS)
+
+# LineStart() matches with a key at the start of a line or an indented key after an empty line
+LINE_START = rf"(?:\A|(?<=\n))(?:\n{KEY_GAP_MATCH}*)?"
+# whitespaces between a key and a delimiter (ref. index.is_valid_key_gap)
+KEY_GAP = rf"(?:{KEY_WHITE}*{KEY_GAP_MATCH}|{KEY_GAP_SKIP}*)"
+# whitespaces consumed by ZeroOrMore(White()) after a key without a delimiter
+KEY_TAIL = _atomic(KEY_GAP, "tail")
+# whitespaces between a delimiter and a value (ref. index.find_value)
+VALUE_PAD = _atomic(
+    rf"{DELIMITER_SKIP}*{DELIMITER_MATCH}+{VALUE_SKIP}*",
+    "pad",
+)
+VALUE = r"(?P<value>[^\n]+)"
+
+
+class CompiledLookup(NamedTuple):
+    pattern: re.Pattern
+    # upper cased keyword to verify a case insensitive match in the same manner as CaselessLiteral
+    upper_keyword: Optional[str]
+
+
+def is_compilable(lookup: KeywordLookup) -> bool:
+    """Check whether a lookup can be compiled into a regex or not
+
+    Args:
+        lookup (KeywordLookup): Keyword lookup
+
+    Returns:
+        bool: Returns True if it's possible
+    """
+    keyword = lookup.keyword
+    delimiter = lookup.delimiter
+    return (
+        keyword != ""
+        and keyword == keyword.strip(WHITE_CHARS)
+        and "\n" not in keyword
+        and (
+            delimiter is None
+            or (delimiter != "" and delimiter == delimiter.strip(WHITE_CHARS))
+        )
+    )
+
+
+@lru_cache(maxsize=None)
+def compile_lookup(lookup: KeywordLookup) -> Optional[CompiledLookup]:
+    """Compile a keyword lookup into a regex which matches as the keyword grammar does
+
+    Args:
+        lookup (KeywordLookup): Keyword lookup
+
+    Returns:
+        Optional[CompiledLookup]: Returns None if the lookup is not compilable
+    """
+    if not is_compilable(lookup):
+        return None
+
+    pattern = LINE_START if lookup.is_line_start_sensitive else ""
+    pattern += f"(?P<key>{re.escape(lookup.keyword)})"
+
+    if lookup.delimiter is not None:
+        pattern += KEY_GAP + re.escape(lookup.delimiter) + VALUE_PAD
+    else:
+        pattern += KEY_TAIL
+
+    pattern += VALUE
+
+    flags = 0 if lookup.is_case_sensitive else re.IGNORECASE
+    return CompiledLookup(
+        pattern=re.compile(pattern, flags),
+        upper_keyword=None if lookup.is_case_sensitive else lookup.keyword.upper(),
+    )
+
+
+class RegexEngine(Engine):
+    """An engine which scans a text with precompiled regexes
+
+    A lookup which can't be compiled falls back to the PyParsing grammar.
+    """
+
+    name = "regex"
+
+    def __init__(
+        self, text: str, get_grammar: Callable[[KeywordLookup], ParserElement]
+    ):
+        super().__init__(text, get_grammar)
+        # PyParsing expands tabs before parsing
+        self._expanded_text = text.expandtabs()
+
+    def _iter_matches(self, compiled: CompiledLookup) -> Iterator[re.Match]:
+        text = self._expanded_text
+        position = 0
+        while True:
+            match = compiled.pattern.search(text, position)
+            if match is None:
+                return
+
+            if (
+                compiled.upper_keyword is not None
+                and match.group("key").upper() != compiled.upper_keyword
+            ):
+                # IGNORECASE is looser than CaselessLiteral for some characters
+                position = match.start() + 1
+                continue
+
+            yield match
+            position = match.end()
+
+    def find(self, lookup: KeywordLookup) -> Optional[str]:
+        compiled = compile_lookup(lookup)
+        if compiled is None:
+            return find(text=self.text, grammar=self.get_grammar(lookup))
+
+        for match in self._iter_matches(compiled):
+            return match.group("value")
+
+        return None
+
+    def find_all(self, lookup: KeywordLookup) -> list[str]:
+        compiled = compile_lookup(lookup)
+        if compiled is None:
+            return find_all(text=self.text, grammar=self.get_grammar(lookup))
+
+        return [match.group("value") for match in self._iter_matches(compiled)]
+
+
+ENGINES: dict[str, type[Engine]] = {
+    PyparsingEngine.name: PyparsingEngine,
+    RegexEngine.name: RegexEngine,
+}
+
+
+def get_engine_class(name: str) -> type[Engine]:
+    """Get an engine class by its name
+
+    Args:
+        name (str): Name of an engine ("pyparsing" or "regex")
+
+    Raises:
+        ValueError: Raised if the engine is unknown
+
+    Returns:
+        type[Engine]: Engine class
+    """
+    engine_class = ENGINES.get(name)
+    if engine_class is None:
+        raise ValueError(f"{name} is not supported. Use {', '.join(ENGINES)}.")
+
+    return engine_class
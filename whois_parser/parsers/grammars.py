@@ -0,0 +1,83 @@
+import weakref
+from collections.abc import Iterator
+from typing import Callable, NamedTuple, Optional
+
+from pyparsing import ParserElement
+
+from .constants import DEILIMITER
+
+
+class KeywordLookup(NamedTuple):
+    """A keyword based lookup which is compiled into a grammar"""
+
+    keyword: str
+    delimiter: Optional[str] = DEILIMITER
+    is_case_sensitive: bool = False
+    is_line_start_sensitive: bool = True
+
+
+class GrammarRegistry:
+    """A registry of compiled PyParsing grammars
+
+    Keyword based grammars are kept for the lifetime of the registry.
+    Grammars which are built from a prefix element are kept as long as the prefix element is alive,
+    thus prefixes should be built once (e.g. as a class attribute) to be reused.
+    """
+
+    def __init__(self) -> None:
+        self._keywords: dict[KeywordLookup, ParserElement] = {}
+        self._prefixes: weakref.WeakKeyDictionary[
+            ParserElement,
+            dict[tuple[Optional[ParserElement], ParserElement], ParserElement],
+        ] = weakref.WeakKeyDictionary()
+
+    def get_keyword_grammar(
+        self,
+        lookup: KeywordLookup,
+        factory: Callable[[KeywordLookup], ParserElement],
+    ) -> ParserElement:
+        grammar = self._keywords.get(lookup)
+        if grammar is None:
+            grammar = factory(lookup)
+            self._keywords[lookup] = grammar
+
+        return grammar
+
+    def get_prefix_grammar(
+        self,
+        prefix: ParserElement,
+        delimiter: Optional[ParserElement],
+        target: ParserElement,
+        factory: Callable[
+            [ParserElement, Optional[ParserElement], ParserElement], ParserElement
+        ],
+    ) -> ParserElement:
+        grammars = self._prefixes.get(prefix)
+        if grammars is None:
+            grammars = {}
+            self._prefixes[prefix] = grammars
+
+        grammar = grammars.get((delimiter, target))
+        if grammar is None:
+            # copy the prefix not to keep a strong reference to the key of the weak dict
+            grammar = factory(prefix.copy(), delimiter, target)
+            grammars[(delimiter, target)] = grammar
+
+        return grammar
+
+    def keyword_lookups(self) -> list[KeywordLookup]:
+        return list(self._keywords.keys())
+
+    def clear(self) -> None:
+        self._keywords.clear()
+        self._prefixes.clear()
+
+    def __len__(self) -> int:
+        return len(self._keywords) + sum(
+            len(grammars) for grammars in self._prefixes.values()
+        )
+
+    def __iter__(self) -> Iterator[ParserElement]:
+        yield from self._keywords.values()
+        for grammars in list(self._prefixes.values()):
+            yield from grammars.values()
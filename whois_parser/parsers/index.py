@@ -0,0 +1,285 @@
+from typing import NamedTuple, Optional
+
+from pyparsing import White
+
+from .constants import ANY_CHARACTERS, SPACE_OR_TAB
+from .grammars import KeywordLookup
+
+# whitespaces which are skipped / matched by the keyword grammar
+# (ref. build_common_prefix_pattern & AbstractParser._find)
+WHITE_CHARS = "".join(White.whiteStrs.keys())
+KEY_WHITE_CHARS = frozenset(WHITE_CHARS)
+LINE_START_WHITE_CHARS = " \t\r"
+# whitespaces which are matched by White() between a key and a delimiter
+KEY_GAP_MATCH_CHARS = frozenset(" \t\r\n")
+KEY_GAP_SKIP_CHARS = KEY_WHITE_CHARS - KEY_GAP_MATCH_CHARS
+DELIMITER_SKIP_CHARS = frozenset(SPACE_OR_TAB.whiteChars)
+DELIMITER_MATCH_CHARS = frozenset(SPACE_OR_TAB.matchWhite)
+VALUE_SKIP_CHARS = frozenset(ANY_CHARACTERS.whiteChars)
+
+
+class LineIndexEntry(NamedTuple):
+    """An occurrence of a delimiter in a text"""
+
+    key: str
+    # None if there is no value which is found by the keyword grammar
+    value: Optional[str]
+    line: int
+    # position of the start of the line of the key
+    line_start: int
+    # positions where a line start sensitive keyword grammar matches with the key
+    line_start_anchors: tuple[int, ...]
+    # position of the end of the key
+    key_end: int
+    # position of the end of the value
+    end: int
+
+
+def is_valid_key_gap(gap: str) -> bool:
+    """Check whether whitespaces between a key and a delimiter are matched by the keyword grammar
+
+    Args:
+        gap (str): Whitespaces
+
+    Returns:
+        bool: Returns True if it's matched
+    """
+    if gap == "" or gap[-1] in KEY_GAP_MATCH_CHARS:
+        return True
+
+    return all(char in KEY_GAP_SKIP_CHARS for char in gap)
+
+
+def find_line_start_anchors(
+    text: str, line_start: int, key_start: int
+) -> tuple[int, ...]:
+    """Find positions where a line start sensitive keyword grammar can start matching
+
+    A grammar matches at the start of the line of the key if the key has no indentation.
+    Otherwise it matches only at preceding empty lines.
+
+    Args:
+        text (str): Text
+        line_start (int): Position of the start of the line of the key
+        key_start (int): Position of the start of the key
+
+    Returns:
+        tuple[int, ...]: Positions in ascending order
+    """
+    start = line_start
+    while start > 0 and text[start - 1] in KEY_GAP_MATCH_CHARS:
+        start -= 1
+
+    anchors = [
+        index
+        for index in range(start, line_start)
+        if text[index] == "\n" and (index == 0 or text[index - 1] == "\n")
+    ]
+    if line_start == key_start:
+        anchors.append(line_start)
+
+    return tuple(anchors)
+
+
+def find_value(text: str, position: int) -> tuple[Optional[str], int]:
+    """Find a value which follows a delimiter in the same manner as the keyword grammar
+
+    Args:
+        text (str): Text
+        position (int): Position next to a delimiter
+
+    Returns:
+        tuple[Optional[str], int]: Value (or None if not found) and its end position
+    """
+    length = len(text)
+
+    index = position
+    while index < length and text[index] in DELIMITER_SKIP_CHARS:
+        index += 1
+
+    # at least one space or tab is required
+    if index >= length or text[index] not in DELIMITER_MATCH_CHARS:
+        return None, position
+
+    while index < length and text[index] in DELIMITER_MATCH_CHARS:
+        index += 1
+
+    while index < length and text[index] in VALUE_SKIP_CHARS:
+        index += 1
+
+    if index >= length:
+        return None, position
+
+    end = text.find("\n", index)
+    if end == -1:
+        end = length
+
+    return text[index:end], end
+
+
+class LineIndex:
+    """An ordered multimap of keys and values in a text
+
+    A text is tokenized once by a delimiter and keyword lookups are resolved by the index.
+    It returns the same results as the keyword grammars do.
+    """
+
+    def __init__(self, text: str, *, delimiter: str = ":"):
+        # PyParsing expands tabs before parsing
+        self.text = text.expandtabs()
+        self.delimiter = delimiter
+        self.entries: list[LineIndexEntry] = []
+        self._keys: dict[str, list[LineIndexEntry]] = {}
+
+        self._build()
+
+    def _build(self) -> None:
+        text = self.text
+        delimiter = self.delimiter
+
+        line = 0
+        line_start = 0
+
+        position = text.find(delimiter)
+        while position != -1:
+            key_end = position
+            while key_end > 0 and text[key_end - 1] in KEY_WHITE_CHARS:
+                key_end -= 1
+
+            if not is_valid_key_gap(text[key_end:position]):
+                position = text.find(delimiter, position + 1)
+                continue
+
+            # keep track of the line of the key
+            newlines = text.count("\n", line_start, key_end)
+            if newlines > 0:
+                line += newlines
+                line_start = text.rfind("\n", 0, key_end) + 1
+
+            key = text[line_start:key_end].lstrip(LINE_START_WHITE_CHARS)
+            value, end = find_value(text, position + len(delimiter))
+
+            entry = LineIndexEntry(
+                key=key,
+                value=value,
+                line=line,
+                line_start=line_start,
+                line_start_anchors=find_line_start_anchors(
+                    text, line_start, key_end - len(key)
+                ),
+                key_end=key_end,
+                end=end,
+            )
+            self.entries.append(entry)
+            self._keys.setdefault(key.upper(), []).append(entry)
+
+            position = text.find(delimiter, position + 1)
+
+    def keys(self) -> list[str]:
+        return [entries[0].key for entries in self._keys.values()]
+
+    def get(self, key: str) -> list[LineIndexEntry]:
+        """Get entries which have a key (case insensitive)
+
+        Args:
+            key (str): Key
+
+        Returns:
+            list[LineIndexEntry]: Entries in order of appearance
+        """
+        return [
+            entry
+            for entry in self._keys.get(key.upper(), [])
+            if len(entry.key) == len(key)
+        ]
+
+    @staticmethod
+    def is_indexable(lookup: KeywordLookup) -> bool:
+        """Check whether a lookup can be resolved by the index or not
+
+        Args:
+            lookup (KeywordLookup): Keyword lookup
+
+        Returns:
+            bool: Returns True if it's possible
+        """
+        keyword = lookup.keyword
+        return (
+            lookup.delimiter is not None
+            and lookup.delimiter != ""
+            and lookup.delimiter == lookup.delimiter.strip(WHITE_CHARS)
+            and keyword != ""
+            and keyword == keyword.strip(WHITE_CHARS)
+            and "\n" not in keyword
+            and (lookup.is_line_start_sensitive or lookup.delimiter not in keyword)
+        )
+
+    def _matches(self, lookup: KeywordLookup) -> list[tuple[int, LineIndexEntry]]:
+        keyword = lookup.keyword
+
+        if lookup.is_line_start_sensitive:
+            entries = self.get(keyword)
+            if lookup.is_case_sensitive:
+                entries = [entry for entry in entries if entry.key == keyword]
+
+            return [
+                (entry.line_start_anchors[-1], entry)
+                for entry in entries
+                if len(entry.line_start_anchors) > 0
+            ]
+
+        size = len(keyword)
+        upper_keyword = keyword.upper()
+
+        matches: list[tuple[int, LineIndexEntry]] = []
+        for entry in self.entries:
+            if len(entry.key) < size:
+                continue
+
+            start = entry.key_end - size
+            candidate = self.text[start : entry.key_end]
+            if lookup.is_case_sensitive:
+                if candidate != keyword:
+                    continue
+            elif candidate.upper() != upper_keyword:
+                continue
+
+            matches.append((start, entry))
+
+        return matches
+
+    def find(self, lookup: KeywordLookup) -> Optional[str]:
+        """Find a first value which matches with a keyword lookup
+
+        Args:
+            lookup (KeywordLookup): Keyword lookup
+
+        Returns:
+            Optional[str]: Returns a first matched value. Returns None if nothing matched.
+        """
+        for _start, entry in self._matches(lookup):
+            if entry.value is not None:
+                return entry.value
+
+        return None
+
+    def find_all(self, lookup: KeywordLookup) -> list[str]:
+        """Find a list of values which match with a keyword lookup
+
+        Args:
+            lookup (KeywordLookup): Keyword lookup
+
+        Returns:
+            list[str]: Returns a list of matched values. Returns an empty list if nothing matched.
+        """
+        values: list[str] = []
+
+        last_end = 0
+        for start, entry in self._matches(lookup):
+            if entry.value is None or start < last_end:
+                continue
+
+            values.append(entry.value)
+            last_end = entry.end
+
+        return values
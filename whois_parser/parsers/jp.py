@@ -1,59 +1,27 @@
-from datetime import datetime
-from typing import Optional, Union
+from typing import Any
 
 from .base import BaseParser
-from .utils import build_common_prefix_pattern
+from .spec import parse_spec
+
+# bracketed keys (e.g. "[ドメイン名]") which are followed by values without a delimiter
+JP_SPEC: dict[str, Any] = {
+    "fingerprint_markers": ["[ドメイン名]", "[Domain Name]"],
+    "defaults": {"delimiter": None, "is_line_start_sensitive": False},
+    # e.g. "2001/03/22", "2021/04/01 01:05:22 (JST)". Dates without a timezone are kept naive.
+    "date_hints": {
+        "languages": ["ja", "en"],
+        "date_formats": ["%Y/%m/%d", "%Y年%m月%d日"],
+    },
+    "fields": {
+        "domain": {"keywords": ["[ドメイン名]"], "post": ["lower"]},
+        "registrant": {"organization": {"keywords": ["[組織名]"]}},
+        "registered_at": {"keywords": ["[登録年月日]"]},
+        "updated_at": {"keywords": ["[最終更新]"]},
+        "statuses": {"keywords": ["[状態]"]},
+        "name_servers": {"keywords": ["[ネームサーバ]"]},
+    },
+}
 
 
 class JpParser(BaseParser):
-    def _find_domain(self) -> Optional[str]:
-        prefix = build_common_prefix_pattern(
-            "[ドメイン名]",
-            is_line_start_sensitive=False,
-            delimiter=None,
-        )
-        value = self._find(prefix, delimiter=None)
-        if value is not None:
-            value = value.lower()
-
-        return value
-
-    def _find_registrant_organization(self) -> Optional[str]:
-        prefix = build_common_prefix_pattern(
-            "[組織名]",
-            is_line_start_sensitive=False,
-            delimiter=None,
-        )
-        return self._find(prefix, delimiter=None)
-
-    def _find_registered_at(self) -> Optional[Union[str, datetime]]:
-        prefix = build_common_prefix_pattern(
-            "[登録年月日]",
-            is_line_start_sensitive=False,
-            delimiter=None,
-        )
-        return self._find_datetime(prefix, delimiter=None)
-
-    def _find_updated_at(self) -> Optional[Union[str, datetime]]:
-        prefix = build_common_prefix_pattern(
-            "[最終更新]",
-            is_line_start_sensitive=False,
-            delimiter=None,
-        )
-        return self._find_datetime(prefix, delimiter=None)
-
-    def _find_statuses(self) -> list[str]:
-        prefix = build_common_prefix_pattern(
-            "[状態]",
-            is_line_start_sensitive=False,
-            delimiter=None,
-        )
-        return self._find_all(prefix, delimiter=None)
-
-    def _find_name_servers(self) -> list[str]:
-        prefix = build_common_prefix_pattern(
-            "[ネームサーバ]",
-            is_line_start_sensitive=False,
-            delimiter=None,
-        )
-        return self._find_all(prefix, delimiter=None)
+    SPEC = parse_spec(JP_SPEC)
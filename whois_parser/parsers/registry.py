@@ -0,0 +1,130 @@
+import importlib
+from collections.abc import Iterator, Mapping, MutableMapping, Sequence
+from typing import Optional, Union
+
+from .base import BaseParser
+from .spec import ParserSpec, compile_spec
+
+# a parser class, its import path ("module:class") or a spec which is compiled on first lookup
+ParserRef = Union[str, type[BaseParser], ParserSpec]
+
+
+def import_parser(path: str) -> type[BaseParser]:
+    """Import a parser class by its path
+
+    Args:
+        path (str): Import path of a parser class (e.g. "whois_parser.parsers.jp:JpParser")
+
+    Raises:
+        ValueError: Raised if the path is not "module:class" or the class is not a parser
+
+    Returns:
+        type[BaseParser]: Parser class
+    """
+    module_name, sep, class_name = path.partition(":")
+    if sep == "" or module_name == "" or class_name == "":
+        raise ValueError(f"{path} is not a path of a parser (module:class)")
+
+    parser = getattr(importlib.import_module(module_name), class_name)
+    if not (isinstance(parser, type) and issubclass(parser, BaseParser)):
+        raise ValueError(f"{path} is not a subclass of BaseParser")
+
+    return parser
+
+
+def get_parser_name(suffix: str) -> str:
+    # e.g. "co.jp" -> "CoJpParser"
+    return "".join(label.capitalize() for label in suffix.split(".")) + "Parser"
+
+
+class ParserRegistry(MutableMapping[str, type[BaseParser]]):
+    """Domain suffixes and their parsers whose modules are imported (or specs are compiled) on first lookup
+
+    It can be used in place of a dict of parsers (e.g. parsers_map of WhoisParser).
+    FINGERPRINT_MARKERS of parsers which are not loaded are looked up without loading them (see get_fingerprint_markers).
+    """
+
+    def __init__(
+        self,
+        parsers: Optional[Mapping[str, ParserRef]] = None,
+        *,
+        fingerprint_markers: Optional[Mapping[str, Sequence[str]]] = None,
+    ):
+        """
+        Args:
+            parsers (Optional[Mapping[str, ParserRef]], optional): Suffixes and parser classes or their import paths. Defaults to None.
+            fingerprint_markers (Optional[Mapping[str, Sequence[str]]], optional): Suffixes and FINGERPRINT_MARKERS of the parsers of import paths. Defaults to None.
+        """
+        self._parsers: dict[str, ParserRef] = dict(parsers or {})
+        # markers of parsers which are imported on first lookup
+        self._markers: dict[str, tuple[str, ...]] = {
+            suffix: tuple(markers)
+            for suffix, markers in (fingerprint_markers or {}).items()
+        }
+        # specs of compiled parsers (classes compiled from specs are not picklable)
+        self._specs: dict[str, ParserSpec] = {}
+        # incremented on every change of suffixes or parsers (e.g. to invalidate Dispatcher)
+        self.version = 0
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_parsers"] = {**self._parsers, **self._specs}
+        state["_specs"] = {}
+        return state
+
+    def __getitem__(self, suffix: str) -> type[BaseParser]:
+        parser = self._parsers[suffix]
+        if isinstance(parser, str):
+            parser = self._parsers[suffix] = import_parser(parser)
+        elif isinstance(parser, ParserSpec):
+            self._specs[suffix] = parser
+            parser = self._parsers[suffix] = compile_spec(
+                parser, name=get_parser_name(suffix)
+            )
+
+        return parser
+
+    def __setitem__(self, suffix: str, parser: ParserRef) -> None:
+        self._parsers[suffix] = parser
+        self._specs.pop(suffix, None)
+        self._markers.pop(suffix, None)
+        self.version += 1
+
+    def __delitem__(self, suffix: str) -> None:
+        del self._parsers[suffix]
+        self._specs.pop(suffix, None)
+        self._markers.pop(suffix, None)
+        self.version += 1
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._parsers)
+
+    def __len__(self) -> int:
+        return len(self._parsers)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._parsers!r})"
+
+    def is_loaded(self, suffix: str) -> bool:
+        return not isinstance(self._parsers[suffix], (str, ParserSpec))
+
+    def get_fingerprint_markers(self, suffix: str) -> tuple[str, ...]:
+        """Get FINGERPRINT_MARKERS of the parser of a suffix
+
+        A parser of an import path is imported only if its markers are not given to the registry.
+
+        Args:
+            suffix (str): Suffix
+
+        Returns:
+            tuple[str, ...]: Markers
+        """
+        parser = self._parsers[suffix]
+        if isinstance(parser, ParserSpec):
+            # an empty spec inherits markers of BaseParser
+            return parser.fingerprint_markers or BaseParser.FINGERPRINT_MARKERS
+
+        if isinstance(parser, str) and suffix in self._markers:
+            return self._markers[suffix]
+
+        return self[suffix].FINGERPRINT_MARKERS
@@ -0,0 +1,75 @@
+import re
+from collections.abc import Sequence
+from functools import lru_cache
+
+from .grammars import KeywordLookup
+
+
+class KeywordScanner:
+    """A scanner which finds keywords occurring in a text by a single scan
+
+    Keywords are compiled into one alternation. A keyword which does not occur in a text
+    can't be matched by its grammar, thus only the occurring keywords need to be tried.
+    """
+
+    def __init__(self, keywords: Sequence[str], *, is_case_sensitive: bool = False):
+        self.is_case_sensitive = is_case_sensitive
+        self.needles: frozenset[str] = frozenset(
+            self.to_needle(keyword) for keyword in keywords if keyword != ""
+        )
+        # longer keywords first to find all the keywords at a position (see scan)
+        alternatives = sorted(self.needles, key=lambda needle: (-len(needle), needle))
+        # a lookahead to find overlapping occurrences
+        self.pattern = re.compile(
+            "(?=(" + "|".join(re.escape(needle) for needle in alternatives) + "))"
+        )
+
+    def to_needle(self, keyword: str) -> str:
+        # CaselessLiteral compares upper cased strings
+        return keyword if self.is_case_sensitive else keyword.upper()
+
+    def scan(self, text: str) -> frozenset[str]:
+        """Scan a text and return keywords (needles) occurring in it
+
+        Args:
+            text (str): Text (should be upper cased if the scanner is case insensitive)
+
+        Returns:
+            frozenset[str]: Needles
+        """
+        if len(self.needles) == 0:
+            return frozenset()
+
+        found = {match.group(1) for match in self.pattern.finditer(text)}
+        # the longest keyword is reported at a position and its prefixes occur there as well
+        return frozenset(
+            needle
+            for needle in self.needles
+            if needle in found or any(other.startswith(needle) for other in found)
+        )
+
+    def filter(
+        self, lookups: Sequence[KeywordLookup], text: str
+    ) -> list[KeywordLookup]:
+        """Filter lookups whose keywords occur in a text keeping their priority order
+
+        Args:
+            lookups (Sequence[KeywordLookup]): Lookups
+            text (str): Text (should be upper cased if the scanner is case insensitive)
+
+        Returns:
+            list[KeywordLookup]: Lookups
+        """
+        present = self.scan(text)
+        return [
+            lookup
+            for lookup in lookups
+            if lookup.keyword == "" or self.to_needle(lookup.keyword) in present
+        ]
+
+
+@lru_cache(maxsize=None)
+def get_keyword_scanner(
+    keywords: tuple[str, ...], *, is_case_sensitive: bool = False
+) -> KeywordScanner:
+    return KeywordScanner(keywords, is_case_sensitive=is_case_sensitive)
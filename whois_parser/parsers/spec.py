@@ -0,0 +1,386 @@
+import json
+import pathlib
+import re
+from collections.abc import Iterable, Mapping
+from dataclasses import fields
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple, Optional, Union
+
+from pyparsing import Regex
+
+from ..dataclasses import Abuse, Admin, Registrant, Tech
+from .constants import DEILIMITER
+from .dates import DateHints, get_timezone
+from .utils import parse_datetime
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .base import BaseParser
+
+# fields of WhoisRecord which are found as lists / datetimes
+LIST_FIELDS = frozenset({"statuses", "name_servers"})
+DATETIME_FIELDS = frozenset({"registered_at", "updated_at", "expires_at"})
+VALUE_FIELDS = (
+    "domain",
+    "registrar",
+    "registered_at",
+    "updated_at",
+    "expires_at",
+    "statuses",
+    "name_servers",
+)
+# contacts and their sub-fields (e.g. "registrant_name" is found by _find_registrant_name)
+CONTACT_FIELDS: dict[str, tuple[str, ...]] = {
+    name: tuple(field.name for field in fields(contact))
+    for name, contact in (
+        ("registrant", Registrant),
+        ("admin", Admin),
+        ("tech", Tech),
+        ("abuse", Abuse),
+    )
+}
+
+# post-processors of found values
+POST_PROCESSORS: dict[str, Callable[[str], str]] = {
+    "lower": str.lower,
+    "upper": str.upper,
+    "strip": str.strip,
+}
+
+
+class FieldSpec(NamedTuple):
+    """A declarative definition of how to find a field"""
+
+    # keywords in order of priority
+    keywords: tuple[str, ...] = ()
+    delimiter: Optional[str] = DEILIMITER
+    is_case_sensitive: bool = False
+    is_line_start_sensitive: bool = True
+    # a header line of a block whose next line has the value (e.g. "Registrar:" of .uk).
+    # keywords are prefixes of the next line if they are set.
+    block: Optional[str] = None
+    # names of POST_PROCESSORS applied to each value in order (a datetime is parsed after them)
+    post: tuple[str, ...] = ()
+
+
+class ParserSpec(NamedTuple):
+    """A declarative definition of a parser
+
+    Finders of the fields are generated from the field specs. A field whose spec is None is never found.
+    Fields which are not defined are inherited from the base class.
+    """
+
+    fields: dict[str, Optional[FieldSpec]]
+    # substrings which identify the format of a record (see AbstractParser.FINGERPRINT_MARKERS)
+    fingerprint_markers: tuple[str, ...] = ()
+    # expected formats of date strings (see AbstractParser.DATE_HINTS)
+    date_hints: Optional[DateHints] = None
+
+    def keywords(self, *, is_case_sensitive: bool) -> frozenset[str]:
+        """Get keywords looked up by the finders of the spec
+
+        Args:
+            is_case_sensitive (bool): Case sensitivity of lookups
+
+        Returns:
+            frozenset[str]: Keywords (upper cased if lookups are case insensitive)
+        """
+        return frozenset(
+            keyword if is_case_sensitive else keyword.upper()
+            for field_spec in self.fields.values()
+            if field_spec is not None
+            and field_spec.block is None
+            and field_spec.is_case_sensitive == is_case_sensitive
+            for keyword in field_spec.keywords
+        )
+
+
+def parse_field_spec(name: str, data: Mapping[str, Any]) -> FieldSpec:
+    """Parse a field spec from a dict
+
+    Args:
+        name (str): Field name (used in error messages)
+        data (Mapping[str, Any]): Options of FieldSpec
+
+    Raises:
+        ValueError: Raised if the spec is invalid
+
+    Returns:
+        FieldSpec: Field spec
+    """
+    unknown = set(data) - set(FieldSpec._fields)
+    if len(unknown) > 0:
+        raise ValueError(
+            f"Unknown options of {name}: {', '.join(sorted(unknown))}. Available options are {', '.join(FieldSpec._fields)}."
+        )
+
+    options: dict[str, Any] = {
+        key: tuple(value) if key in ("keywords", "post") else value
+        for key, value in data.items()
+    }
+    field_spec = FieldSpec(**options)
+    if len(field_spec.keywords) == 0 and field_spec.block is None:
+        raise ValueError(f"{name} should have keywords or a block")
+
+    for post in field_spec.post:
+        if post not in POST_PROCESSORS:
+            raise ValueError(
+                f"Unknown post-processor of {name}: {post}. Available ones are {', '.join(POST_PROCESSORS)}."
+            )
+
+    return field_spec
+
+
+def parse_date_hints(data: Mapping[str, Any]) -> DateHints:
+    """Parse date hints from a dict
+
+    Args:
+        data (Mapping[str, Any]): Options of DateHints
+
+    Raises:
+        ValueError: Raised if the hints are invalid
+
+    Returns:
+        DateHints: Date hints
+    """
+    unknown = set(data) - set(DateHints._fields)
+    if len(unknown) > 0:
+        raise ValueError(
+            f"Unknown options of date_hints: {', '.join(sorted(unknown))}. Available options are {', '.join(DateHints._fields)}."
+        )
+
+    options: dict[str, Any] = {
+        key: value if key == "timezone" else tuple(value) for key, value in data.items()
+    }
+    hints = DateHints(**options)
+    if hints.timezone is not None:
+        # fail fast instead of on the first naive datetime
+        get_timezone(hints.timezone)
+
+    return hints
+
+
+def parse_spec(data: Union[ParserSpec, Mapping[str, Any]]) -> ParserSpec:
+    """Parse a parser spec from a dict (e.g. loaded from JSON)
+
+    The dict has "fields" and optional "defaults", "fingerprint_markers" and "date_hints".
+    "fields" maps a field of WhoisRecord to options of FieldSpec (or None) and a contact
+    (e.g. "registrant") to a dict of its sub-fields. "defaults" are options shared by the fields
+    and "date_hints" are options of DateHints.
+
+    Args:
+        data (Union[ParserSpec, Mapping[str, Any]]): Spec
+
+    Raises:
+        ValueError: Raised if the spec is invalid
+
+    Returns:
+        ParserSpec: Parser spec
+    """
+    if isinstance(data, ParserSpec):
+        return data
+
+    unknown = set(data) - {"fields", "defaults", "fingerprint_markers", "date_hints"}
+    if len(unknown) > 0:
+        raise ValueError(f"Unknown keys of a spec: {', '.join(sorted(unknown))}")
+
+    defaults: Mapping[str, Any] = data.get("defaults", {})
+
+    def parse_field(
+        name: str, value: Optional[Mapping[str, Any]]
+    ) -> Optional[FieldSpec]:
+        if value is None:
+            return None
+
+        return parse_field_spec(name, {**defaults, **value})
+
+    field_specs: dict[str, Optional[FieldSpec]] = {}
+    for name, value in data.get("fields", {}).items():
+        if name in CONTACT_FIELDS:
+            for subfield, subvalue in value.items():
+                if subfield not in CONTACT_FIELDS[name]:
+                    raise ValueError(
+                        f"Unknown field: {name}.{subfield}. Available fields are {', '.join(CONTACT_FIELDS[name])}."
+                    )
+
+                field_specs[f"{name}_{subfield}"] = parse_field(
+                    f"{name}.{subfield}", subvalue
+                )
+        elif name in VALUE_FIELDS:
+            field_specs[name] = parse_field(name, value)
+        else:
+            raise ValueError(
+                f"Unknown field: {name}. Available fields are {', '.join((*VALUE_FIELDS, *CONTACT_FIELDS))}."
+            )
+
+    return ParserSpec(
+        fields=field_specs,
+        fingerprint_markers=tuple(data.get("fingerprint_markers", ())),
+        date_hints=(
+            parse_date_hints(data["date_hints"]) if "date_hints" in data else None
+        ),
+    )
+
+
+def load_specs(path: Union[str, pathlib.Path]) -> dict[str, ParserSpec]:
+    """Load specs of domain suffixes from a JSON or TOML (Python 3.11+) file
+
+    Args:
+        path (Union[str, pathlib.Path]): Path to a file which maps a suffix (e.g. "jp") to a spec
+
+    Returns:
+        dict[str, ParserSpec]: Suffixes and their specs. They can be added to a ParserRegistry.
+    """
+    path = pathlib.Path(path)
+    if path.suffix == ".toml":
+        import tomllib  # type: ignore[import-not-found,unused-ignore]
+
+        data = tomllib.loads(path.read_text(encoding="utf-8"))
+    else:
+        data = json.loads(path.read_text(encoding="utf-8"))
+
+    return {suffix: parse_spec(spec) for suffix, spec in data.items()}
+
+
+def build_block_prefix(field_spec: FieldSpec) -> Regex:
+    """Build a prefix which matches with a block header (and a keyword of the next line)
+
+    Args:
+        field_spec (FieldSpec): Field spec
+
+    Returns:
+        Regex: Prefix
+    """
+    assert field_spec.block is not None
+
+    pattern = re.escape(field_spec.block) + "\n"
+    if len(field_spec.keywords) > 0:
+        pattern += "(?:" + "|".join(re.escape(k) for k in field_spec.keywords) + ")"
+
+    flags = 0 if field_spec.is_case_sensitive else re.IGNORECASE
+    return Regex(pattern, flags=flags)
+
+
+def _post_process(value: str, post: Iterable[Callable[[str], str]]) -> str:
+    for func in post:
+        value = func(value)
+
+    return value
+
+
+def build_finder(name: str, field_spec: Optional[FieldSpec]) -> Callable[[Any], Any]:
+    """Build a finder method of a field from its spec
+
+    Args:
+        name (str): Field name (e.g. "domain" or "registrant_name")
+        field_spec (Optional[FieldSpec]): Field spec
+
+    Returns:
+        Callable[[Any], Any]: Finder which takes a parser
+    """
+    is_list = name in LIST_FIELDS
+    is_datetime = name in DATETIME_FIELDS
+
+    if field_spec is None:
+        return lambda self: [] if is_list else None
+
+    post = tuple(POST_PROCESSORS[post] for post in field_spec.post)
+
+    if field_spec.block is not None:
+        # a prefix is built once not to build its grammar per call (see GrammarRegistry)
+        prefix = build_block_prefix(field_spec)
+
+        def find_value(self: Any) -> Optional[str]:
+            return self._find(prefix, delimiter=None)
+
+        def find_values(self: Any) -> list[str]:
+            return self._find_all(prefix, delimiter=None)
+
+    else:
+        keywords = list(field_spec.keywords)
+        options = {
+            "delimiter": field_spec.delimiter,
+            "is_case_sensitive": field_spec.is_case_sensitive,
+            "is_line_start_sensitive": field_spec.is_line_start_sensitive,
+        }
+
+        def find_value(self: Any) -> Optional[str]:
+            return self._find_by_keywords(keywords, **options)
+
+        def find_values(self: Any) -> list[str]:
+            return self._find_all_by_keywords(keywords, **options)
+
+    if is_list:
+
+        def finder(self: Any) -> Any:
+            return [_post_process(value, post) for value in find_values(self)]
+
+    else:
+
+        def finder(self: Any) -> Any:
+            value = find_value(self)
+            if value is None:
+                return None
+
+            value = _post_process(value, post)
+            return parse_datetime(value, self.DATE_HINTS) if is_datetime else value
+
+    finder.__name__ = f"_find_{name}"
+    return finder
+
+
+def install_spec(parser: type[Any], spec: ParserSpec) -> None:
+    """Install finders generated from a spec into a parser class
+
+    Args:
+        parser (type[Any]): Parser class
+        spec (ParserSpec): Spec
+    """
+    for name, field_spec in spec.fields.items():
+        setattr(parser, f"_find_{name}", build_finder(name, field_spec))
+
+    if len(spec.fingerprint_markers) > 0:
+        parser.FINGERPRINT_MARKERS = spec.fingerprint_markers
+
+    if spec.date_hints is not None:
+        parser.DATE_HINTS = spec.date_hints
+
+    # keywords of all the specs of the class are scanned at once per record (see AbstractParser._get_candidate_lookups)
+    parser.SCAN_KEYWORDS = {
+        is_case_sensitive: frozenset().union(
+            *(
+                base.__dict__["SPEC"].keywords(is_case_sensitive=is_case_sensitive)
+                for base in parser.__mro__
+                if base.__dict__.get("SPEC") is not None
+            )
+        )
+        for is_case_sensitive in (False, True)
+    }
+
+
+def compile_spec(
+    spec: Union[ParserSpec, Mapping[str, Any]],
+    *,
+    name: str = "SpecParser",
+    base: Optional[type["BaseParser"]] = None,
+    module: Optional[str] = None,
+) -> type["BaseParser"]:
+    """Compile a spec into a parser class
+
+    Args:
+        spec (Union[ParserSpec, Mapping[str, Any]]): Spec
+        name (str, optional): Class name. Defaults to "SpecParser".
+        base (Optional[type[BaseParser]], optional): Base class. Defaults to BaseParser.
+        module (Optional[str], optional): Module of the class. Set it to a module which has the class as an attribute to pickle it. Defaults to None.
+
+    Returns:
+        type[BaseParser]: Parser class
+    """
+    if base is None:
+        from .base import BaseParser
+
+        base = BaseParser
+
+    namespace: dict[str, Any] = {"SPEC": parse_spec(spec)}
+    if module is not None:
+        namespace["__module__"] = module
+
+    return type(name, (base,), namespace)
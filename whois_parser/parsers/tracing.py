@@ -0,0 +1,48 @@
+from collections.abc import Iterable
+
+
+class FieldTrace:
+    """Keywords which a finder looked up to evaluate a field
+
+    A finder takes the same path and returns the same value as long as the results of its lookups
+    don't change. Thus a field needs to be re-evaluated only if one of its keywords occurs around
+    a changed line (see whois_parser.incremental).
+    """
+
+    def __init__(self):
+        # pairs of a keyword and its case sensitivity
+        self.keywords: set[tuple[str, bool]] = set()
+        # whether a match can't be located by keywords (e.g. a PyParsing expression)
+        self.is_opaque: bool = False
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(keywords={self.keywords!r}, is_opaque={self.is_opaque!r})"
+
+    def add_keywords(self, keywords: Iterable[str], *, is_case_sensitive: bool) -> None:
+        for keyword in keywords:
+            # an empty keyword occurs everywhere and a keyword over lines can't be found per line
+            if keyword == "" or "\n" in keyword or "\t" in keyword:
+                self.is_opaque = True
+            else:
+                self.keywords.add((keyword, is_case_sensitive))
+
+    def add_expression(self) -> None:
+        self.is_opaque = True
+
+    def occurs_in(self, text: str, upper_text: str) -> bool:
+        """Check whether a keyword of the trace occurs in a text
+
+        Args:
+            text (str): Tab expanded text
+            upper_text (str): Upper cased text (CaselessLiteral compares upper cased strings)
+
+        Returns:
+            bool: Returns True if a keyword occurs or the trace is opaque
+        """
+        if self.is_opaque:
+            return True
+
+        return any(
+            keyword in text if is_case_sensitive else keyword.upper() in upper_text
+            for keyword, is_case_sensitive in self.keywords
+        )
@@ -1,15 +1,19 @@
-from typing import Optional
-
-from pyparsing import Regex
+from typing import Any
 
 from .base import BaseParser
+from .spec import parse_spec
 
+# values are on the next lines of block headers (e.g. "Registrar:")
+UK_SPEC: dict[str, Any] = {
+    "fingerprint_markers": ["Domain name:\n"],
+    # e.g. "11-Jun-2014"
+    "date_hints": {"locales": ["en-GB"], "date_formats": ["%d-%b-%Y"]},
+    "fields": {
+        "registrar": {"block": "Registrar:", "is_case_sensitive": True},
+        "registrant": {"name": {"block": "Registrant:", "is_case_sensitive": True}},
+    },
+}
 
-class UkParser(BaseParser):
-    def _find_registrar(self) -> Optional[str]:
-        prefix = Regex("Registrar:\n")
-        return self._find(prefix, delimiter=None)
 
-    def _find_registrant_name(self) -> Optional[str]:
-        prefix = Regex("Registrant:\n")
-        return self._find(prefix, delimiter=None)
+class UkParser(BaseParser):
+    SPEC = parse_spec(UK_SPEC)
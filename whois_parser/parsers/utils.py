@@ -1,7 +1,7 @@
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional, Union, cast
 
-import dateparser
 from pyparsing import (
     CaselessLiteral,
     LineStart,
@@ -11,6 +11,37 @@ from pyparsing import (
     ZeroOrMore,
 )
 
+from .. import settings
+from .dates import (
+    NO_HINTS,
+    STATS,
+    DateHints,
+    fast_parse_datetime,
+    localize,
+    parse_with_formats,
+)
+
+# characters which split lines (same as str.splitlines)
+LINE_BOUNDARIES = frozenset("\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029")
+
+
+def find_last_section(raw_text: str) -> Optional[int]:
+    """Find the last line which starts with "#" (a comment of a whois server) by a reverse scan
+
+    Args:
+        raw_text (str): whois record in plain text
+
+    Returns:
+        Optional[int]: Returns an offset of the line. Returns None if there is no such line.
+    """
+    end = len(raw_text)
+    while True:
+        index = raw_text.rfind("#", 0, end)
+        if index <= 0 or raw_text[index - 1] in LINE_BOUNDARIES:
+            return index if index >= 0 else None
+
+        end = index
+
 
 def build_common_prefix_pattern(
     keyword: str,
@@ -52,13 +83,72 @@ def find_all(text: str, grammar: ParserElement, *, id: str = "value") -> list[st
     return values
 
 
-def parse_datetime(date_string: str) -> Union[datetime, str]:
+@lru_cache(maxsize=settings.DATETIME_CACHE_SIZE)
+def parse_datetime(
+    date_string: str, hints: DateHints = NO_HINTS
+) -> Union[datetime, str]:
+    """Convert a date string into a datetime
+
+    Args:
+        date_string (str): Date string
+        hints (DateHints, optional): Expected formats of a registry. Defaults to NO_HINTS.
+
+    Returns:
+        Union[datetime, str]: Returns the date string if it's not possible to convert
+    """
     # remove ". " to support the following format
     # "2007. 03. 02."
     date_string = date_string.replace(" .", "")
 
-    dt = dateparser.parse(date_string)
+    dt = fast_parse_datetime(date_string)
+    if dt is None and len(hints.date_formats) > 0:
+        dt = parse_with_formats(date_string, hints.date_formats)
+
+    if dt is not None:
+        STATS.fast_path += 1
+        return localize(dt, hints)
+
+    STATS.fallback += 1
+    # dateparser takes hundreds of milliseconds to import (its locale data) thus it's imported on first use
+    import dateparser
+
+    dt = dateparser.parse(
+        date_string,
+        languages=list(hints.languages) or None,
+        locales=list(hints.locales) or None,
+    )
     if dt is None:
+        STATS.unparsed += 1
         return date_string
 
-    return dt
+    return localize(dt, hints)
+
+
+def get_datetime_stats() -> dict[str, int]:
+    """Get statistics of datetime parsing
+
+    Returns:
+        dict[str, int]: Numbers of fast path conversions, dateparser fallbacks, unparsed strings and cache hits / misses
+    """
+    cache_info = parse_datetime.cache_info()
+    return {
+        "fast_path": STATS.fast_path,
+        "fallback": STATS.fallback,
+        "unparsed": STATS.unparsed,
+        "cache_hits": cache_info.hits,
+        "cache_misses": cache_info.misses,
+        "cache_size": cache_info.currsize,
+    }
+
+
+def warm_up_datetime() -> None:
+    """Load the locale data of dateparser in advance"""
+    import dateparser
+
+    dateparser.parse("1 January 2000")
+
+
+def clear_datetime_cache() -> None:
+    """Clear the cache and the statistics of datetime parsing"""
+    parse_datetime.cache_clear()
+    STATS.reset()
@@ -0,0 +1,101 @@
+import json
+from collections.abc import Iterable, Iterator
+from typing import IO
+
+from .dataclasses import WhoisRecord
+
+ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+DECODER = json.JSONDecoder()
+
+
+def dumps(record: WhoisRecord) -> str:
+    """Serialize a record into JSON
+
+    Args:
+        record (WhoisRecord): Whois record
+
+    Returns:
+        str: JSON
+    """
+    return ENCODER.encode(record.to_dict())
+
+
+def loads(text: str) -> WhoisRecord:
+    """Deserialize a record from JSON made by dumps
+
+    Args:
+        text (str): JSON
+
+    Returns:
+        WhoisRecord: Whois record
+    """
+    return WhoisRecord.from_dict(DECODER.decode(text))
+
+
+def dump_json(records: Iterable[WhoisRecord], fp: IO[str]) -> int:
+    """Write records into a file as a JSON array
+
+    Args:
+        records (Iterable[WhoisRecord]): Whois records
+        fp (IO[str]): File
+
+    Returns:
+        int: Number of records
+    """
+    count = 0
+    fp.write("[")
+    for record in records:
+        if count > 0:
+            fp.write(",")
+
+        fp.write(ENCODER.encode(record.to_dict()))
+        count += 1
+
+    fp.write("]")
+    return count
+
+
+def load_json(fp: IO[str]) -> list[WhoisRecord]:
+    """Read records from a JSON array made by dump_json
+
+    Args:
+        fp (IO[str]): File
+
+    Returns:
+        list[WhoisRecord]: Whois records
+    """
+    return [WhoisRecord.from_dict(data) for data in DECODER.decode(fp.read())]
+
+
+def dump_ndjson(records: Iterable[WhoisRecord], fp: IO[str]) -> int:
+    """Write records into a file as NDJSON (a record per line)
+
+    Args:
+        records (Iterable[WhoisRecord]): Whois records
+        fp (IO[str]): File
+
+    Returns:
+        int: Number of records
+    """
+    count = 0
+    for record in records:
+        fp.write(ENCODER.encode(record.to_dict()))
+        fp.write("\n")
+        count += 1
+
+    return count
+
+
+def iter_ndjson(fp: IO[str]) -> Iterator[WhoisRecord]:
+    """Read records from NDJSON made by dump_ndjson lazily
+
+    Args:
+        fp (IO[str]): File
+
+    Yields:
+        Iterator[WhoisRecord]: Whois records
+    """
+    for line in fp:
+        line = line.strip()
+        if len(line) > 0:
+            yield WhoisRecord.from_dict(DECODER.decode(line))
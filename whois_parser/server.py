@@ -0,0 +1,704 @@
+import argparse
+import asyncio
+import functools
+import ipaddress
+import os
+import signal
+import sys
+import time
+from collections.abc import Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Optional
+
+from . import batch
+from .parsers.abstract import validate_fields
+from .serialization import DECODER, ENCODER
+
+if TYPE_CHECKING:
+    from .parser import WhoisParser
+
+# max size of a request line (or an HTTP body) in bytes
+DEFAULT_MAX_LINE_SIZE = 16 * 1024 * 1024
+
+HTTP_REASONS: dict[int, str] = {
+    200: "OK",
+    400: "Bad Request",
+    403: "Forbidden",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    411: "Length Required",
+    413: "Payload Too Large",
+}
+
+
+@dataclass
+class ServerStats:
+    started_at: float = field(default_factory=time.monotonic)
+    connections: int = 0
+    # number of requests including health / stats requests and invalid ones
+    requests: int = 0
+    # number of parsed records
+    records: int = 0
+    errors: int = 0
+    # number of records being parsed by workers
+    in_flight: int = 0
+    # total seconds taken by workers to parse records
+    busy: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        uptime = time.monotonic() - self.started_at
+        return {
+            "uptime": uptime,
+            "connections": self.connections,
+            "requests": self.requests,
+            "records": self.records,
+            "errors": self.errors,
+            "in_flight": self.in_flight,
+            "records_per_second": self.records / uptime if uptime > 0 else 0.0,
+            "average_latency": self.busy / self.records if self.records > 0 else 0.0,
+        }
+
+
+def parse_in_worker(
+    parser: Optional["WhoisParser"],
+    raw_text: str,
+    hostname: Optional[str],
+    fields: Optional[frozenset[str]],
+) -> tuple[bool, str]:
+    """Parse a whois record and encode it into JSON in a worker
+
+    Args:
+        parser (Optional[WhoisParser]): Parser. Use the parser of a worker process if it's None.
+        raw_text (str): Whois record
+        hostname (Optional[str]): Hostname
+        fields (Optional[frozenset[str]]): Fields to parse
+
+    Returns:
+        tuple[bool, str]: Returns a pair of whether it's parsed and JSON of the record (or of an error message)
+    """
+    if parser is None:
+        parser = batch._worker_parser
+        assert parser is not None
+
+    result = batch.parse_item(parser, (0, raw_text, hostname), fields)
+    if result.record is None:
+        return False, ENCODER.encode(result.error)
+
+    # records are encoded in workers not to send them back as pickles
+    return True, ENCODER.encode(result.record.to_dict())
+
+
+def _noop() -> None:
+    pass
+
+
+def encode_response(request_id: Any, key: str, value: str) -> str:
+    return f'{{"id":{ENCODER.encode(request_id)},"{key}":{value}}}'
+
+
+def is_loopback(host: str) -> bool:
+    if host == "localhost":
+        return True
+
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def is_loopback_host_header(value: str) -> bool:
+    """Check whether a Host header of a HTTP request names a loopback address
+
+    A browser sends a Host header of the original domain to a rebound address (DNS rebinding).
+
+    Args:
+        value (str): Host header (e.g. "127.0.0.1:8080", "[::1]:8080" or "localhost")
+
+    Returns:
+        bool: Whether it's a loopback address
+    """
+    host = value.strip()
+    if host.startswith("["):
+        host = host[1 : host.find("]")]
+    elif host.count(":") == 1:
+        host = host.partition(":")[0]
+
+    return is_loopback(host.rstrip(".").lower())
+
+
+def get_content_length(headers: dict[str, str]) -> Optional[int]:
+    """Get Content-Length of a HTTP request
+
+    Args:
+        headers (dict[str, str]): Headers whose names are lowercased
+
+    Returns:
+        Optional[int]: Returns 0 if there is no Content-Length. Returns None if it's not a non-negative integer.
+    """
+    value = headers.get("content-length", "0")
+    if not (value.isascii() and value.isdigit()):
+        return None
+
+    return int(value)
+
+
+class WhoisServer:
+    """A local daemon which keeps warmed parsers in a worker pool and serves parse requests of NDJSON
+
+    A request is a line of a JSON object: {"id": ..., "raw_text": ..., "hostname": ..., "fields": [...]}
+    ("hostname", "fields" and "id" are optional) or {"id": ..., "method": "health" / "stats"}.
+    A line of a JSON array is a batch of requests and its responses are returned as a line of an array.
+    A response is {"id": ..., "record": ...} (see WhoisRecord.to_dict) or {"id": ..., "error": ...}.
+
+    Requests are pipelined: records of a connection are parsed concurrently while the next lines are read,
+    and responses are written in order of the requests. Over HTTP, POST /parse takes NDJSON and returns
+    NDJSON, and GET /health and GET /stats return JSON.
+    """
+
+    def __init__(
+        self,
+        parser: "WhoisParser",
+        *,
+        kind: str = "process",
+        workers: Optional[int] = None,
+        concurrency: int = 64,
+        max_line_size: int = DEFAULT_MAX_LINE_SIZE,
+    ):
+        """
+        Args:
+            parser (WhoisParser): Parser. Create it with raw_text_mode="drop" not to send raw text back.
+            kind (str, optional): Kind of workers. "thread" or "process". Defaults to "process".
+            workers (Optional[int], optional): Number of workers. Defaults to None (the default of the executor).
+            concurrency (int, optional): Max number of records submitted to workers at once. Defaults to 64.
+            max_line_size (int, optional): Max size of a request line (or an HTTP body) in bytes. Defaults to DEFAULT_MAX_LINE_SIZE.
+        """
+        if kind not in ("thread", "process"):
+            raise ValueError(f"{kind} is not supported. Use thread or process.")
+
+        if concurrency < 1:
+            raise ValueError("concurrency should be greater than 0")
+
+        self.parser = parser
+        self.kind = kind
+        self.workers = workers
+        self.concurrency = concurrency
+        self.max_line_size = max_line_size
+
+        self.stats = ServerStats()
+        self.servers: list[asyncio.Server] = []
+
+        self._executor: Optional[Executor] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        # tasks which handle connections
+        self._connections: set[asyncio.Task] = set()
+        self._socket_paths: list[str] = []
+
+    async def __aenter__(self) -> "WhoisServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    async def start(self) -> None:
+        """Start workers and wait for them to be warmed up"""
+        if self._executor is not None:
+            return
+
+        loop = asyncio.get_running_loop()
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+
+        if self.kind == "thread":
+            batch.warm_up(self.parser)
+            self._executor = ThreadPoolExecutor(max_workers=self.workers)
+            return
+
+        # the parser is sent to a worker process once (not per record)
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=batch._initialize_worker,
+            initargs=(self.parser,),
+        )
+        await asyncio.gather(
+            *(
+                loop.run_in_executor(self._executor, _noop)
+                for _ in range(self.workers or os.cpu_count() or 1)
+            )
+        )
+
+    async def close(self) -> None:
+        """Stop accepting connections and shut down workers"""
+        for server in self.servers:
+            server.close()
+            await server.wait_closed()
+
+        self.servers = []
+
+        for task in self._connections:
+            task.cancel()
+
+        await asyncio.gather(*self._connections, return_exceptions=True)
+
+        for path in self._socket_paths:
+            if os.path.exists(path):
+                os.unlink(path)
+
+        self._socket_paths = []
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    async def start_unix(self, path: str) -> asyncio.Server:
+        """Serve NDJSON over a Unix domain socket
+
+        Args:
+            path (str): Path to the socket
+
+        Returns:
+            asyncio.Server: Server
+        """
+        await self.start()
+        server = await asyncio.start_unix_server(
+            self._handle_stream, path=path, limit=self.max_line_size
+        )
+        self.servers.append(server)
+        self._socket_paths.append(path)
+        return server
+
+    async def start_http(
+        self, host: str = "127.0.0.1", port: int = 0
+    ) -> asyncio.Server:
+        """Serve HTTP on a loopback address
+
+        Args:
+            host (str, optional): Loopback address. Defaults to "127.0.0.1".
+            port (int, optional): Port. An arbitrary free port is used if it's 0. Defaults to 0.
+
+        Raises:
+            ValueError: Raised if the host is not a loopback address
+
+        Returns:
+            asyncio.Server: Server
+        """
+        if not is_loopback(host):
+            raise ValueError(f"{host} is not a loopback address")
+
+        await self.start()
+        server = await asyncio.start_server(
+            self._handle_http, host=host, port=port, limit=self.max_line_size
+        )
+        self.servers.append(server)
+        return server
+
+    async def serve_forever(self) -> None:
+        """Serve until it's cancelled"""
+        await asyncio.gather(*(server.serve_forever() for server in self.servers))
+
+    def _track_connection(self) -> None:
+        task = asyncio.current_task()
+        if task is not None:
+            self._connections.add(task)
+            task.add_done_callback(self._connections.discard)
+
+    def _error(self, request_id: Any, message: str) -> str:
+        self.stats.errors += 1
+        return encode_response(request_id, "error", ENCODER.encode(message))
+
+    async def handle_line(self, line: bytes) -> str:
+        """Handle a request line
+
+        Args:
+            line (bytes): JSON of a request or of an array of requests
+
+        Returns:
+            str: JSON of a response (or of an array of responses)
+        """
+        try:
+            request = DECODER.decode(line.decode("utf-8"))
+        except ValueError as e:
+            self.stats.requests += 1
+            return self._error(None, f"{type(e).__name__}: {e}")
+
+        if isinstance(request, list):
+            responses = await asyncio.gather(*(self.handle_request(r) for r in request))
+            return "[" + ",".join(responses) + "]"
+
+        return await self.handle_request(request)
+
+    async def handle_request(self, request: Any) -> str:
+        """Handle a request
+
+        Args:
+            request (Any): Decoded request
+
+        Returns:
+            str: JSON of a response
+        """
+        self.stats.requests += 1
+        if not isinstance(request, dict):
+            return self._error(None, "A request should be an object")
+
+        request_id = request.get("id")
+        method = request.get("method", "parse")
+        if method == "health":
+            return encode_response(request_id, "status", '"ok"')
+
+        if method == "stats":
+            return encode_response(
+                request_id, "stats", ENCODER.encode(self.get_stats())
+            )
+
+        if method != "parse":
+            return self._error(request_id, f"Unknown method: {method}")
+
+        raw_text = request.get("raw_text")
+        hostname = request.get("hostname")
+        if not isinstance(raw_text, str):
+            return self._error(request_id, "raw_text should be a string")
+
+        if hostname is not None and not isinstance(hostname, str):
+            return self._error(request_id, "hostname should be a string")
+
+        try:
+            fields = validate_fields(request.get("fields"))
+        except (TypeError, ValueError) as e:
+            return self._error(request_id, str(e))
+
+        assert self._semaphore is not None
+
+        loop = asyncio.get_running_loop()
+        async with self._semaphore:
+            self.stats.in_flight += 1
+            started_at = time.monotonic()
+            try:
+                is_parsed, value = await loop.run_in_executor(
+                    self._executor,
+                    functools.partial(
+                        parse_in_worker,
+                        self.parser if self.kind == "thread" else None,
+                        raw_text,
+                        hostname,
+                        fields,
+                    ),
+                )
+            except Exception as e:
+                # e.g. BrokenProcessPool or a record which can't be pickled
+                is_parsed, value = False, ENCODER.encode(f"{type(e).__name__}: {e}")
+            finally:
+                self.stats.in_flight -= 1
+                self.stats.busy += time.monotonic() - started_at
+
+        self.stats.records += 1
+        if not is_parsed:
+            self.stats.errors += 1
+            return encode_response(request_id, "error", value)
+
+        return encode_response(request_id, "record", value)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get statistics of the server
+
+        Returns:
+            dict[str, Any]: Counters, uptime, throughput and average latency of workers
+        """
+        return {
+            **self.stats.to_dict(),
+            "kind": self.kind,
+            "workers": self.workers,
+            "concurrency": self.concurrency,
+        }
+
+    async def _write_responses(
+        self,
+        queue: "asyncio.Queue[Optional[asyncio.Future]]",
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        is_connected = True
+        while True:
+            future = await queue.get()
+            if future is None:
+                return
+
+            if not is_connected:
+                future.cancel()
+                continue
+
+            try:
+                response: str = await future
+            except Exception as e:
+                # handle_line turns errors into responses thus it's unexpected.
+                # The writer should be alive not to block the reader.
+                response = self._error(None, f"{type(e).__name__}: {e}")
+
+            try:
+                writer.write(response.encode("utf-8") + b"\n")
+                # responses in the queue are written at once
+                if queue.empty():
+                    await writer.drain()
+            except ConnectionError:
+                # requests which are read are consumed not to block the reader
+                is_connected = False
+
+    async def _handle_stream(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.stats.connections += 1
+        self._track_connection()
+        # the queue limits requests read ahead of responses
+        queue: "asyncio.Queue[Optional[asyncio.Future]]" = asyncio.Queue(
+            maxsize=self.concurrency
+        )
+        write_task = asyncio.ensure_future(self._write_responses(queue, writer))
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # the rest of the line can't be told from the next request
+                    future = loop.create_future()
+                    future.set_result(self._error(None, "The line is too long"))
+                    await queue.put(future)
+                    break
+
+                if line == b"":
+                    break
+
+                if line.strip() == b"":
+                    continue
+
+                await queue.put(asyncio.ensure_future(self.handle_line(line)))
+        except ConnectionError:
+            pass
+        finally:
+            await queue.put(None)
+            await write_task
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _handle_http(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.stats.connections += 1
+        self._track_connection()
+        try:
+            while True:
+                request_line = await reader.readline()
+                if request_line == b"":
+                    break
+
+                parts = request_line.decode("latin-1").split()
+                headers: dict[str, str] = {}
+                while True:
+                    line = await reader.readline()
+                    if line.strip() == b"":
+                        break
+
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                if len(parts) != 3:
+                    await self._write_http(writer, 400, "Invalid request line")
+                    break
+
+                if "transfer-encoding" in headers:
+                    # a chunked body is not supported thus the next request can't be found
+                    await self._write_http(writer, 411, "Content-Length is required")
+                    break
+
+                length = get_content_length(headers)
+                if length is None:
+                    await self._write_http(writer, 400, "Invalid Content-Length")
+                    break
+
+                if length > self.max_line_size:
+                    await self._write_http(writer, 413, "The body is too large")
+                    break
+
+                # the body is read regardless of the route to find the next request
+                data = await reader.readexactly(length)
+
+                if "host" in headers and not is_loopback_host_header(headers["host"]):
+                    await self._write_http(writer, 403, "The host is not allowed")
+                    break
+
+                method, target, version = parts
+                is_keep_alive = (
+                    version == "HTTP/1.1"
+                    and headers.get("connection", "").lower() != "close"
+                )
+                status, body, content_type = await self._route_http(
+                    method, target.split("?", 1)[0], headers, data
+                )
+                await self._write_http(
+                    writer,
+                    status,
+                    body,
+                    content_type=content_type,
+                    is_keep_alive=is_keep_alive,
+                )
+                if not is_keep_alive:
+                    break
+        except (ConnectionError, ValueError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _route_http(
+        self,
+        method: str,
+        path: str,
+        headers: dict[str, str],
+        data: bytes,
+    ) -> tuple[int, str, str]:
+        if path == "/health":
+            if method != "GET":
+                return 405, "Use GET", "text/plain"
+
+            self.stats.requests += 1
+            return 200, '{"status":"ok"}\n', "application/json"
+
+        if path == "/stats":
+            if method != "GET":
+                return 405, "Use GET", "text/plain"
+
+            self.stats.requests += 1
+            return 200, ENCODER.encode(self.get_stats()) + "\n", "application/json"
+
+        if path != "/parse":
+            return 404, f"{path} is not found", "text/plain"
+
+        if method != "POST":
+            return 405, "Use POST", "text/plain"
+
+        if "content-length" not in headers:
+            return 411, "Content-Length is required", "text/plain"
+
+        responses = await asyncio.gather(
+            *(self.handle_line(line) for line in data.splitlines() if line.strip())
+        )
+        return 200, "".join(f"{r}\n" for r in responses), "application/x-ndjson"
+
+    async def _write_http(
+        self,
+        writer: asyncio.StreamWriter,
+        status: int,
+        body: str,
+        *,
+        content_type: str = "text/plain",
+        is_keep_alive: bool = False,
+    ) -> None:
+        data = body.encode("utf-8")
+        head = (
+            f"HTTP/1.1 {status} {HTTP_REASONS[status]}\r\n"
+            f"Content-Type: {content_type}; charset=utf-8\r\n"
+            f"Content-Length: {len(data)}\r\n"
+            f"Connection: {'keep-alive' if is_keep_alive else 'close'}\r\n\r\n"
+        )
+        writer.write(head.encode("latin-1") + data)
+        await writer.drain()
+
+
+async def serve(
+    parser: "WhoisParser",
+    *,
+    socket_path: Optional[str] = None,
+    host: str = "127.0.0.1",
+    port: Optional[int] = None,
+    kind: str = "process",
+    workers: Optional[int] = None,
+    concurrency: int = 64,
+) -> None:
+    """Run a server on a Unix domain socket and / or localhost HTTP until it's cancelled
+
+    Args:
+        parser (WhoisParser): Parser
+        socket_path (Optional[str], optional): Path to a Unix domain socket. Defaults to None.
+        host (str, optional): Loopback address of HTTP. Defaults to "127.0.0.1".
+        port (Optional[int], optional): Port of HTTP. HTTP is not served if it's None. Defaults to None.
+        kind (str, optional): Kind of workers. "thread" or "process". Defaults to "process".
+        workers (Optional[int], optional): Number of workers. Defaults to None.
+        concurrency (int, optional): Max number of records submitted to workers at once. Defaults to 64.
+    """
+    if socket_path is None and port is None:
+        raise ValueError("socket_path or port is required")
+
+    async with WhoisServer(
+        parser, kind=kind, workers=workers, concurrency=concurrency
+    ) as server:
+        if socket_path is not None:
+            await server.start_unix(socket_path)
+            sys.stderr.write(f"Listening on {socket_path}\n")
+
+        if port is not None:
+            http_server = await server.start_http(host, port)
+            for sock in http_server.sockets:
+                address = sock.getsockname()
+                sys.stderr.write(f"Listening on http://{address[0]}:{address[1]}\n")
+
+        await server.serve_forever()
+
+
+async def _run(parser: "WhoisParser", **kwargs: Any) -> None:
+    task = asyncio.ensure_future(serve(parser, **kwargs))
+    try:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, task.cancel)
+    except NotImplementedError:  # pragma: no cover
+        # signal handlers are not supported on Windows
+        pass
+
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    from .parser import WhoisParser
+
+    arg_parser = argparse.ArgumentParser(
+        prog="python -m whois_parser.server",
+        description="Serve parse requests of NDJSON over a Unix domain socket or localhost HTTP",
+    )
+    arg_parser.add_argument("--socket", help="path to a Unix domain socket")
+    arg_parser.add_argument("--host", default="127.0.0.1", help="loopback address")
+    arg_parser.add_argument("--port", type=int, help="port of HTTP")
+    arg_parser.add_argument("--kind", choices=["thread", "process"], default="process")
+    arg_parser.add_argument("--workers", type=int, help="number of workers")
+    arg_parser.add_argument("--concurrency", type=int, default=64)
+    arg_parser.add_argument("--engine", choices=["pyparsing", "regex"], default="regex")
+    arg_parser.add_argument(
+        "--raw-text-mode", choices=["keep", "drop", "digest"], default="drop"
+    )
+    args = arg_parser.parse_args(argv)
+    if args.socket is None and args.port is None:
+        arg_parser.error("--socket or --port is required")
+
+    parser = WhoisParser(engine=args.engine, raw_text_mode=args.raw_text_mode)
+    try:
+        asyncio.run(
+            _run(
+                parser,
+                socket_path=args.socket,
+                host=args.host,
+                port=args.port,
+                kind=args.kind,
+                workers=args.workers,
+                concurrency=args.concurrency,
+            )
+        )
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -1,3 +1,6 @@
+# rate limit and not found messages are matched as case insensitive substrings of a response
+# (e.g. a message in a banner). Add messages to the sets to extend them.
+
 # ref. https://github.com/cheenanet/whois-servers-list/blob/master/limit-reached-messages.json
 WHOIS_RATE_LIMIT_MESSAGES: set[str] = {
     "WHOIS LIMIT EXCEEDED - SEE WWW.PIR.ORG/WHOIS FOR DETAILS",
@@ -13,3 +16,32 @@ WHOIS_RATE_LIMIT_MESSAGES: set[str] = {
     "Access to whois service at whois.isoc.org.il was **DENIED**",
     "IP Address Has Reached Rate Limit",
 }
+
+# messages of responses for domains which are not registered
+WHOIS_NOT_FOUND_MESSAGES: set[str] = {
+    "No match for",
+    "No match!!",
+    "No Data Found",
+    "No entries found",
+    "No Object Found",
+    "No matching record",
+    "No such domain",
+    "Domain not found",
+    "Object not found",
+    "The queried object does not exist",
+    "This domain name has not been registered",
+}
+
+# max number of date strings to keep in the cache of parse_datetime
+DATETIME_CACHE_SIZE: int = 4096
+
+# max number of whois servers whose parsers are detected to keep in the cache of Dispatcher
+DETECTED_PARSERS_CACHE_SIZE: int = 1024
+
+# legacy charsets of ccTLDs which are tried in order when a record in bytes is not UTF-8
+WHOIS_CHARSETS: dict[str, tuple[str, ...]] = {
+    "jp": ("euc_jp", "cp932"),
+    "kr": ("cp949",),
+    "cn": ("gb18030",),
+    "tw": ("big5",),
+}